@@ -0,0 +1,306 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+from gerador_perfis import SEMENTE_PADRAO, gravar_ndjson
+
+TOLERANCIA_PADRAO = 0.25
+FOLGA_PADRAO_MS = 2.0
+
+VAGA_BENCHMARK = {
+    "habilidades_obrigatorias": ["Python"],
+    "habilidades_desejaveis": ["SQL", "Docker", "AWS"],
+    "anos_minimos": 3,
+    "idiomas": [{"idioma": "Inglês", "nivel_minimo": "Avançado"}],
+    "limit": 20
+}
+
+
+def caminho_banco_padrao(quantidade: int, semente: int) -> str:
+    return f"benchmark_{quantidade}_{semente}.db"
+
+
+def configurar_ambiente(caminho_banco: str) -> None:
+    os.environ["DATABASE_URL"] = f"sqlite:///{caminho_banco}"
+    os.environ["USAR_BANCO_ASYNC"] = "false"
+
+
+def preparar_banco(caminho_banco: str, quantidade: int, semente: int, recriar: bool) -> None:
+    if os.path.exists(caminho_banco) and not recriar:
+        print(f"[OK] Reutilizando {caminho_banco}")
+        return
+    
+    from seed import popular_banco_dados
+    
+    with tempfile.TemporaryDirectory() as diretorio:
+        arquivo = os.path.join(diretorio, "perfis.ndjson")
+        inicio = time.perf_counter()
+        gravar_ndjson(arquivo, quantidade, semente)
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            popular_banco_dados(arquivo, tamanho_lote=5000)
+    
+    print(f"[OK] {quantidade} perfis sinteticos importados em {caminho_banco} ({time.perf_counter() - inicio:.1f}s)")
+
+
+def resumir(tempos: List[float]) -> dict:
+    ordenados = sorted(tempos)
+    
+    return {
+        "mediana_ms": round(statistics.median(ordenados), 3),
+        "p95_ms": round(ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))], 3),
+        "media_ms": round(statistics.fmean(ordenados), 3),
+        "minimo_ms": round(ordenados[0], 3),
+        "repeticoes": len(ordenados)
+    }
+
+
+def medir(funcao: Callable[[int], object], repeticoes: int, aquecimento: int) -> List[float]:
+    for rodada in range(aquecimento):
+        funcao(rodada)
+    
+    tempos = []
+    
+    for rodada in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(aquecimento + rodada)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    
+    return tempos
+
+
+def id_da_rodada(quantidade: int, rodada: int) -> int:
+    return (quantidade // 2 + rodada * 7919) % quantidade + 1
+
+
+def montar_casos_crud(quantidade: int) -> Dict[str, Callable[[int], object]]:
+    import crud
+    from database import SessionLocal
+    from schemas import VagaRanking
+    
+    vaga = VagaRanking(**VAGA_BENCHMARK)
+
+    def com_sessao(funcao: Callable) -> Callable[[int], object]:
+        def executar(rodada: int):
+            db = SessionLocal()
+            try:
+                return funcao(db, rodada)
+            finally:
+                db.close()
+        
+        return executar
+
+    def segunda_pagina(db, rodada):
+        _, cursor = crud.buscar_profissionais_por_cursor(db, area="Dados", limit=100)
+        return crud.buscar_profissionais_por_cursor(db, area="Dados", cursor=cursor, limit=100)
+    
+    casos = {
+        "obter_todos_profissionais": lambda db, rodada: crud.obter_todos_profissionais(db, limit=100),
+        "obter_todos_profissionais[skip_profundo]": lambda db, rodada: crud.obter_todos_profissionais(
+            db, skip=max(0, quantidade - 200), limit=100
+        ),
+        "obter_profissional_por_id": lambda db, rodada: crud.obter_profissional_por_id(db, id_da_rodada(quantidade, rodada)),
+        "obter_profissional_serializado": lambda db, rodada: crud.obter_profissional_serializado(
+            db, id_da_rodada(quantidade, rodada)
+        ),
+        "buscar_profissionais[area]": lambda db, rodada: crud.buscar_profissionais(db, area="Dados"),
+        "buscar_profissionais[cidade]": lambda db, rodada: crud.buscar_profissionais(db, cidade="Recife/PE"),
+        "buscar_profissionais[tecnologia]": lambda db, rodada: crud.buscar_profissionais(db, tecnologia="Kubernetes"),
+        "buscar_profissionais[idioma]": lambda db, rodada: crud.buscar_profissionais(
+            db, idioma="Inglês", nivel_minimo="Fluente"
+        ),
+        "buscar_profissionais[anos_minimos]": lambda db, rodada: crud.buscar_profissionais(db, anos_minimos=10),
+        "buscar_profissionais[busca]": lambda db, rodada: crud.buscar_profissionais(db, termo_busca="engenheiro de dados"),
+        "buscar_profissionais[combinado]": lambda db, rodada: crud.buscar_profissionais(
+            db, area="Desenvolvimento", cidade="São Paulo/SP", tecnologia="Docker", idioma="Inglês", nivel_minimo="Avançado"
+        ),
+        "buscar_profissionais_por_cursor": segunda_pagina,
+        "buscar_profissionais_por_cursor[busca]": lambda db, rodada: crud.buscar_profissionais_por_cursor(
+            db, termo_busca="python", limit=100
+        ),
+        "ranquear_profissionais": lambda db, rodada: crud.ranquear_profissionais(db, vaga),
+        "buscar_profissionais_similares": lambda db, rodada: crud.buscar_profissionais_similares(
+            db, id_da_rodada(quantidade, rodada)
+        ),
+        "sugerir_termos": lambda db, rodada: crud.sugerir_termos(db, ["ana", "des", "py", "são", "mar"][rodada % 5]),
+        "obter_areas_unicas": lambda db, rodada: crud.obter_areas_unicas(db),
+        "obter_cidades_unicas": lambda db, rodada: crud.obter_cidades_unicas(db),
+        "obter_tecnologias_unicas": lambda db, rodada: crud.obter_tecnologias_unicas(db),
+        "contar_profissionais_por_area": lambda db, rodada: crud.contar_profissionais_por_area(db),
+        "calcular_estatisticas": lambda db, rodada: crud.calcular_estatisticas(db),
+        "obter_profissionais_com_tecnologia": lambda db, rodada: crud.obter_profissionais_com_tecnologia(db, "Kafka"),
+        "buscar_profissionais_com_minimo_experiencia": lambda db, rodada: crud.buscar_profissionais_com_minimo_experiencia(
+            db, 30
+        ),
+        "buscar_profissionais_por_idioma": lambda db, rodada: crud.buscar_profissionais_por_idioma(
+            db, "Mandarim", "Avançado"
+        )
+    }
+    
+    return {f"crud.{nome}": com_sessao(funcao) for nome, funcao in casos.items()}
+
+
+def montar_casos_endpoints(quantidade: int) -> Dict[str, Callable[[int], object]]:
+    from fastapi.testclient import TestClient
+    from main import app, montar_indice_sugestoes
+    
+    montar_indice_sugestoes()
+    cliente = TestClient(app)
+    
+    rotas = {
+        "GET /api/profissionais": lambda rodada: "/api/profissionais?limit=100",
+        "GET /api/profissionais[area]": lambda rodada: "/api/profissionais?area=Dados&limit=100",
+        "GET /api/profissionais[busca]": lambda rodada: "/api/profissionais?busca=engenheiro&limit=20",
+        "GET /api/profissionais/pagina": lambda rodada: "/api/profissionais/pagina?limit=100&tecnologia=Python",
+        "GET /api/profissionais/{id}": lambda rodada: f"/api/profissionais/{id_da_rodada(quantidade, rodada)}",
+        "GET /api/profissionais/{id}/similares": lambda rodada: (
+            f"/api/profissionais/{id_da_rodada(quantidade, rodada)}/similares"
+        ),
+        "GET /api/profissionais/tecnologia/{tecnologia}": lambda rodada: "/api/profissionais/tecnologia/Kafka",
+        "GET /api/sugestoes": lambda rodada: f"/api/sugestoes?q={['ana', 'des', 'py', 'são', 'mar'][rodada % 5]}",
+        "GET /api/areas": lambda rodada: "/api/areas",
+        "GET /api/cidades": lambda rodada: "/api/cidades",
+        "GET /api/tecnologias": lambda rodada: "/api/tecnologias",
+        "GET /api/estatisticas": lambda rodada: "/api/estatisticas"
+    }
+
+    def requisitar(metodo: str, rota: Callable[[int], str], corpo: Optional[dict] = None) -> Callable[[int], object]:
+        def executar(rodada: int):
+            resposta = cliente.request(metodo, rota(rodada), json=corpo)
+            
+            if resposta.status_code != 200:
+                raise RuntimeError(f"{metodo} {rota(rodada)} respondeu {resposta.status_code}")
+            
+            return resposta
+        
+        return executar
+    
+    casos = {f"endpoint.{nome}": requisitar("GET", rota) for nome, rota in rotas.items()}
+    casos["endpoint.POST /api/profissionais/ranking"] = requisitar(
+        "POST", lambda rodada: "/api/profissionais/ranking", VAGA_BENCHMARK
+    )
+    
+    return casos
+
+
+def executar_casos(casos: Dict[str, Callable[[int], object]], repeticoes: int, aquecimento: int) -> dict:
+    resultados = {}
+    
+    for nome, funcao in casos.items():
+        try:
+            resultados[nome] = resumir(medir(funcao, repeticoes, aquecimento))
+        except Exception as e:
+            print(f"[ERRO] {nome}: {e}")
+            continue
+        
+        print(f"  - {nome}: mediana {resultados[nome]['mediana_ms']:.2f} ms, p95 {resultados[nome]['p95_ms']:.2f} ms")
+    
+    return resultados
+
+
+def comparar(atual: dict, base: dict, tolerancia: float, folga_ms: float) -> List[str]:
+    regressoes = []
+    
+    if base["metadados"].get("quantidade") != atual["metadados"]["quantidade"]:
+        print(
+            f"[AVISO] Base medida com {base['metadados'].get('quantidade')} perfis, "
+            f"execucao atual com {atual['metadados']['quantidade']}"
+        )
+    
+    for nome, medicao in atual["resultados"].items():
+        anterior = base["resultados"].get(nome)
+        
+        if anterior is None:
+            print(f"[AVISO] {nome}: sem medicao na base")
+            continue
+        
+        limite = anterior["mediana_ms"] * (1 + tolerancia) + folga_ms
+        
+        if medicao["mediana_ms"] > limite:
+            regressoes.append(
+                f"{nome}: mediana {medicao['mediana_ms']:.2f} ms "
+                f"(base {anterior['mediana_ms']:.2f} ms, limite {limite:.2f} ms)"
+            )
+    
+    grupos = {nome.split(".", 1)[0] for nome in atual["resultados"]}
+    
+    for nome in base["resultados"]:
+        if nome.split(".", 1)[0] in grupos and nome not in atual["resultados"]:
+            regressoes.append(f"{nome}: medido na base mas ausente nesta execucao")
+    
+    return regressoes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mede as funcoes do crud e os endpoints da API com perfis sinteticos")
+    parser.add_argument("--quantidade", type=int, default=10000, help="Perfis sinteticos (ex.: 10000, 100000, 1000000)")
+    parser.add_argument("--semente", type=int, default=SEMENTE_PADRAO)
+    parser.add_argument("--banco", help="Arquivo SQLite do benchmark (padrao: benchmark_<quantidade>_<semente>.db)")
+    parser.add_argument("--recriar", action="store_true", help="Regera o banco mesmo que ele ja exista")
+    parser.add_argument("--repeticoes", type=int, default=20)
+    parser.add_argument("--aquecimento", type=int, default=2)
+    parser.add_argument("--apenas", choices=["crud", "endpoints"], help="Mede somente um dos grupos")
+    parser.add_argument("--saida", help="Arquivo JSON para gravar os resultados")
+    parser.add_argument("--base", help="Resultado JSON anterior para detectar regressoes")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO, help="Aumento relativo aceito na mediana")
+    parser.add_argument("--folga-ms", type=float, default=FOLGA_PADRAO_MS, help="Aumento absoluto aceito na mediana")
+    argumentos = parser.parse_args()
+    
+    caminho_banco = argumentos.banco or caminho_banco_padrao(argumentos.quantidade, argumentos.semente)
+    configurar_ambiente(caminho_banco)
+    preparar_banco(caminho_banco, argumentos.quantidade, argumentos.semente, argumentos.recriar)
+    
+    grupos = {"crud": ("Funcoes do crud", montar_casos_crud), "endpoints": ("Endpoints", montar_casos_endpoints)}
+    resultados = {}
+    falhas = 0
+    
+    for grupo, (titulo, montar_casos) in grupos.items():
+        if argumentos.apenas not in (None, grupo):
+            continue
+        
+        print(f"\n{titulo}:")
+        casos = montar_casos(argumentos.quantidade)
+        medidos = executar_casos(casos, argumentos.repeticoes, argumentos.aquecimento)
+        falhas += len(casos) - len(medidos)
+        resultados.update(medidos)
+    
+    relatorio = {
+        "metadados": {
+            "quantidade": argumentos.quantidade,
+            "semente": argumentos.semente,
+            "repeticoes": argumentos.repeticoes,
+            "aquecimento": argumentos.aquecimento,
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "executado_em": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "resultados": resultados
+    }
+    
+    if argumentos.saida:
+        with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        
+        print(f"\n[OK] Resultados gravados em {argumentos.saida}")
+    
+    regressoes = []
+    
+    if argumentos.base:
+        with open(argumentos.base, "r", encoding="utf-8") as arquivo:
+            regressoes = comparar(relatorio, json.load(arquivo), argumentos.tolerancia, argumentos.folga_ms)
+        
+        for regressao in regressoes:
+            print(f"[ERRO] Regressao em {regressao}")
+        
+        if not regressoes:
+            print(f"[OK] Nenhuma regressao acima de {argumentos.tolerancia:.0%} + {argumentos.folga_ms} ms")
+    
+    if falhas or regressoes:
+        sys.exit(1)
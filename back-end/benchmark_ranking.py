@@ -0,0 +1,159 @@
+import argparse
+import statistics
+import time
+import numpy as np
+from ranking import MatrizRanking, PESOS_RANKING, ANOS_TETO_RANKING
+from normalizacao import NIVEIS_IDIOMA
+
+HABILIDADES = [f"habilidade {indice}" for indice in range(400)]
+IDIOMAS = ["inglês", "espanhol", "francês", "alemão", "italiano"]
+AREAS = [f"Area {indice}" for indice in range(8)]
+CIDADES = [f"Cidade {indice}/SP" for indice in range(30)]
+HABILIDADES_POR_PERFIL = 8
+
+VAGAS = [
+    {
+        "obrigatorias": ["habilidade 0"],
+        "desejaveis": ["habilidade 1", "habilidade 5", "habilidade 20"],
+        "idiomas": [("inglês", "Avançado")],
+        "cidade": "Cidade 3/SP"
+    },
+    {
+        "obrigatorias": ["habilidade 2", "habilidade 7"],
+        "desejaveis": ["habilidade 40", "habilidade 90"],
+        "anos_minimos": 3,
+        "area": "Area 1"
+    },
+    {
+        "desejaveis": ["habilidade 3", "habilidade 11", "habilidade 150", "habilidade 300"],
+        "idiomas": [("inglês", "Fluente"), ("espanhol", "Intermediário")]
+    },
+    {
+        "obrigatorias": ["habilidade 250"],
+        "desejaveis": ["habilidade 0"],
+        "anos_minimos": 5
+    }
+]
+
+
+def gerar_matriz(quantidade: int, semente: int = 42) -> MatrizRanking:
+    gerador = np.random.default_rng(semente)
+    ids = np.arange(1, quantidade + 1, dtype=np.int64)
+    anos = gerador.integers(0, 25, quantidade).astype(np.int16)
+    
+    pesos = 1.0 / np.arange(1, len(HABILIDADES) + 1)
+    pesos /= pesos.sum()
+    sorteadas = gerador.choice(len(HABILIDADES), size=(quantidade, HABILIDADES_POR_PERFIL), p=pesos)
+    pares = np.unique(np.arange(quantidade)[:, None] * len(HABILIDADES) + sorteadas)
+    linhas, colunas = np.divmod(pares, len(HABILIDADES))
+    ordem = np.argsort(colunas, kind="stable")
+    limites = np.searchsorted(colunas[ordem], np.arange(len(HABILIDADES) + 1))
+    habilidades = {}
+    
+    for coluna in range(len(HABILIDADES)):
+        if limites[coluna] < limites[coluna + 1]:
+            habilidades[HABILIDADES[coluna]] = ids[linhas[ordem[limites[coluna]:limites[coluna + 1]]]]
+    
+    idiomas = {}
+    
+    for indice, idioma in enumerate(IDIOMAS):
+        linhas = np.flatnonzero(gerador.random(quantidade) < 0.8 / (indice + 1))
+        idiomas[idioma] = (ids[linhas], gerador.integers(1, 6, len(linhas)))
+    
+    areas = [AREAS[codigo] for codigo in gerador.integers(0, len(AREAS), quantidade)]
+    cidades = [CIDADES[codigo] for codigo in gerador.integers(0, len(CIDADES), quantidade)]
+    
+    return MatrizRanking(ids, anos, areas, cidades, habilidades, idiomas)
+
+
+def ranquear_por_linha(matriz: MatrizRanking, vaga: dict, limite: int = 10) -> list:
+    habilidades_por_linha = [set() for _ in range(matriz.tamanho)]
+    
+    for habilidade, linhas in matriz.habilidades.items():
+        for linha in linhas.tolist():
+            habilidades_por_linha[linha].add(habilidade)
+    
+    idiomas_por_linha = [{} for _ in range(matriz.tamanho)]
+    
+    for idioma, (linhas, niveis) in matriz.idiomas.items():
+        for linha, nivel in zip(linhas.tolist(), niveis.tolist()):
+            idiomas_por_linha[linha][idioma] = nivel
+    
+    areas = {codigo: valor for valor, codigo in matriz.valores_area.items()}
+    cidades = {codigo: valor for valor, codigo in matriz.valores_cidade.items()}
+    inicio = time.perf_counter()
+    resultado = []
+    
+    for linha in range(matriz.tamanho):
+        habilidades = habilidades_por_linha[linha]
+        anos = int(matriz.anos[linha])
+        
+        if not all(skill in habilidades for skill in vaga.get("obrigatorias", [])):
+            continue
+        
+        if vaga.get("anos_minimos") is not None and anos < vaga["anos_minimos"]:
+            continue
+        
+        nota = PESOS_RANKING["experiencia"] * min(max(anos, 0), ANOS_TETO_RANKING) / ANOS_TETO_RANKING
+        desejaveis = vaga.get("desejaveis", [])
+        nota += sum(PESOS_RANKING["desejaveis"] / len(desejaveis) for skill in desejaveis if skill in habilidades)
+        
+        for idioma, nivel in vaga.get("idiomas", []):
+            if idiomas_por_linha[linha].get(idioma, 0) >= NIVEIS_IDIOMA[nivel]:
+                nota += PESOS_RANKING["idiomas"] / len(vaga["idiomas"])
+        
+        if cidades[int(matriz.codigos_cidade[linha])] == vaga.get("cidade"):
+            nota += PESOS_RANKING["cidade"]
+        
+        if areas[int(matriz.codigos_area[linha])] == vaga.get("area"):
+            nota += PESOS_RANKING["area"]
+        
+        resultado.append((-nota, int(matriz.ids[linha])))
+    
+    resultado.sort()
+    duracao = time.perf_counter() - inicio
+    
+    return [profissional_id for _, profissional_id in resultado[:limite]], duracao
+
+
+def medir(matriz: MatrizRanking, vaga: dict, repeticoes: int) -> list:
+    matriz.ranquear(**vaga)
+    tempos = []
+    
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        matriz.ranquear(**vaga)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    
+    return tempos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mede o ranking vetorizado com perfis sinteticos")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeticoes", type=int, default=20)
+    parser.add_argument("--comparar-ate", type=int, default=100000, help="Compara com o ranking linha a linha ate este tamanho")
+    argumentos = parser.parse_args()
+    
+    for quantidade in argumentos.tamanhos:
+        inicio = time.perf_counter()
+        matriz = gerar_matriz(quantidade)
+        montagem = time.perf_counter() - inicio
+        
+        print(f"\n{quantidade} perfis (matriz gerada em {montagem:.2f}s, {matriz.memoria_bytes() / 1024 / 1024:.1f} MB)")
+        
+        for indice, vaga in enumerate(VAGAS, start=1):
+            tempos = sorted(medir(matriz, vaga, argumentos.repeticoes))
+            p95 = tempos[max(0, int(len(tempos) * 0.95) - 1)]
+            linha = f"  - Vaga {indice}: mediana {statistics.median(tempos):.2f} ms, p95 {p95:.2f} ms"
+            
+            if quantidade <= argumentos.comparar_ate:
+                esperados, duracao = ranquear_por_linha(matriz, vaga)
+                ids, _, _ = matriz.ranquear(**vaga)
+                
+                if ids != esperados:
+                    print(f"[ERRO] Vaga {indice}: ranking vetorizado difere do ranking linha a linha")
+                
+                linha += f" (linha a linha: {duracao * 1000:.0f} ms)"
+            
+            print(linha)
@@ -0,0 +1,70 @@
+import argparse
+import json
+import time
+from typing import List
+from pydantic import TypeAdapter
+from database import SessionLocal
+from models import Profissional
+from schemas import ProfissionalResponse
+from serializacao import RespostaJSONRapida, serializar_profissionais
+
+ADAPTADOR_LISTA = TypeAdapter(List[ProfissionalResponse])
+
+
+def serializar_com_pydantic(profissionais: list) -> bytes:
+    validados = ADAPTADOR_LISTA.validate_python(profissionais, from_attributes=True)
+    conteudo = ADAPTADOR_LISTA.dump_python(validados, mode="json")
+    return json.dumps(conteudo, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def serializar_rapido(profissionais: list) -> bytes:
+    return RespostaJSONRapida(content=serializar_profissionais(profissionais)).body
+
+
+def medir_cpu(funcao, profissionais: list, repeticoes: int) -> float:
+    funcao(profissionais)
+    inicio = time.process_time()
+    
+    for _ in range(repeticoes):
+        funcao(profissionais)
+    
+    return (time.process_time() - inicio) / repeticoes * 1000
+
+
+def carregar_pagina(tamanho_pagina: int) -> list:
+    db = SessionLocal()
+    
+    try:
+        profissionais = db.query(Profissional).order_by(Profissional.id).limit(tamanho_pagina).all()
+    finally:
+        db.close()
+    
+    if not profissionais:
+        return []
+    
+    while len(profissionais) < tamanho_pagina:
+        profissionais = profissionais + profissionais
+    
+    return profissionais[:tamanho_pagina]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara o custo de CPU da serializacao de uma pagina de perfis")
+    parser.add_argument("--pagina", type=int, default=100, help="Perfis por pagina")
+    parser.add_argument("--repeticoes", type=int, default=200)
+    argumentos = parser.parse_args()
+    
+    profissionais = carregar_pagina(argumentos.pagina)
+    
+    if not profissionais:
+        print("[ERRO] Banco vazio. Execute 'python seed.py' antes do benchmark.")
+    elif serializar_com_pydantic(profissionais) != serializar_rapido(profissionais):
+        print("[ERRO] As duas serializacoes produziram respostas diferentes")
+    else:
+        pydantic_ms = medir_cpu(serializar_com_pydantic, profissionais, argumentos.repeticoes)
+        rapido_ms = medir_cpu(serializar_rapido, profissionais, argumentos.repeticoes)
+        
+        print(f"Pagina com {len(profissionais)} perfis ({argumentos.repeticoes} repeticoes)")
+        print(f"  - Pydantic (response_model): {pydantic_ms:.3f} ms de CPU por pagina")
+        print(f"  - Serializacao rapida:        {rapido_ms:.3f} ms de CPU por pagina")
+        print(f"  - Economia: {pydantic_ms - rapido_ms:.3f} ms por pagina ({(1 - rapido_ms / pydantic_ms) * 100:.1f}%)")
@@ -0,0 +1,152 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import Float, Integer, false, select, text
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, Query
+from models import Profissional
+
+PESOS_BM25 = "10.0, 5.0, 1.0, 3.0, 1.0"
+
+CRIAR_TABELA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS profissionais_fts USING fts5(
+    nome,
+    cargo,
+    resumo,
+    habilidades,
+    experiencias,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+
+def fts_disponivel(bind) -> bool:
+    return bind.dialect.name == "sqlite"
+
+
+def criar_indice_busca(engine: Engine) -> None:
+    if not fts_disponivel(engine):
+        return
+    
+    with engine.begin() as conexao:
+        conexao.execute(text(CRIAR_TABELA_FTS))
+
+
+def montar_documento(profissional: Profissional) -> dict:
+    experiencias = []
+    
+    for exp in profissional.experiencias:
+        experiencias.append(f"{exp['cargo']} {exp['empresa']} {exp['descricao']}")
+    
+    return {
+        "id": profissional.id,
+        "nome": profissional.nome,
+        "cargo": profissional.cargo,
+        "resumo": profissional.resumo,
+        "habilidades": " ".join(profissional.habilidades_tecnicas),
+        "experiencias": " ".join(experiencias)
+    }
+
+
+def indexar_profissional(db: Session, profissional: Profissional) -> None:
+    indexar_profissionais(db, [profissional])
+
+
+def indexar_profissionais(db: Session, profissionais: List[Profissional]) -> None:
+    if not fts_disponivel(db.bind) or not profissionais:
+        return
+    
+    remover_profissionais_do_indice(db, [profissional.id for profissional in profissionais])
+    _inserir_lote(db, [montar_documento(profissional) for profissional in profissionais])
+
+
+def remover_profissional_do_indice(db: Session, profissional_id: int) -> None:
+    remover_profissionais_do_indice(db, [profissional_id])
+
+
+def remover_profissionais_do_indice(db: Session, profissionais_ids: List[int]) -> None:
+    if not fts_disponivel(db.bind) or not profissionais_ids:
+        return
+    
+    db.execute(
+        text("DELETE FROM profissionais_fts WHERE rowid = :id"),
+        [{"id": profissional_id} for profissional_id in profissionais_ids]
+    )
+
+
+def reconstruir_indice_busca(db: Session, tamanho_lote: int = 1000) -> int:
+    if not fts_disponivel(db.bind):
+        return 0
+    
+    db.execute(text("DELETE FROM profissionais_fts"))
+    
+    total = 0
+    lote = []
+    
+    consulta = select(
+        Profissional.id,
+        Profissional.nome,
+        Profissional.cargo,
+        Profissional.resumo,
+        Profissional.habilidades_tecnicas,
+        Profissional.experiencias
+    ).execution_options(yield_per=tamanho_lote)
+    
+    for profissional in db.execute(consulta):
+        lote.append(montar_documento(profissional))
+        
+        if len(lote) >= tamanho_lote:
+            total += _inserir_lote(db, lote)
+            lote = []
+    
+    if lote:
+        total += _inserir_lote(db, lote)
+    
+    db.execute(text("INSERT INTO profissionais_fts (profissionais_fts) VALUES ('optimize')"))
+    db.commit()
+    return total
+
+
+def _inserir_lote(db: Session, lote: list) -> int:
+    db.execute(
+        text(
+            "INSERT INTO profissionais_fts (rowid, nome, cargo, resumo, habilidades, experiencias) "
+            "VALUES (:id, :nome, :cargo, :resumo, :habilidades, :experiencias)"
+        ),
+        lote
+    )
+    return len(lote)
+
+
+def montar_consulta_fts(termo_busca: str) -> Optional[str]:
+    palavras = re.findall(r"\w+", termo_busca)
+    
+    if not palavras:
+        return None
+    
+    return " ".join(f'"{palavra}"*' for palavra in palavras)
+
+
+def aplicar_busca_textual(query: Query, termo_busca: str) -> Tuple[Query, Optional[ColumnElement]]:
+    if not fts_disponivel(query.session.bind):
+        query = query.filter(
+            (Profissional.nome.ilike(f"%{termo_busca}%")) |
+            (Profissional.cargo.ilike(f"%{termo_busca}%")) |
+            (Profissional.resumo.ilike(f"%{termo_busca}%"))
+        )
+        return query, None
+    
+    consulta = montar_consulta_fts(termo_busca)
+    
+    if consulta is None:
+        return query.filter(false()), None
+    
+    resultados = text(
+        f"SELECT rowid AS id, bm25(profissionais_fts, {PESOS_BM25}) AS relevancia "
+        "FROM profissionais_fts WHERE profissionais_fts MATCH :consulta"
+    ).bindparams(consulta=consulta).columns(id=Integer, relevancia=Float).subquery("busca")
+    
+    query = query.join(resultados, resultados.c.id == Profissional.id)
+    return query, resultados.c.relevancia
+
@@ -0,0 +1,164 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memoria")
+CACHE_MAX_ITENS = int(os.getenv("CACHE_MAX_ITENS", "1000"))
+CACHE_TTL = float(os.getenv("CACHE_TTL", "300"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+class CacheMemoria:
+    def __init__(self, max_itens: int = CACHE_MAX_ITENS, ttl: float = CACHE_TTL):
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+        self._invalidacoes = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def marcador(self) -> int:
+        return self._invalidacoes
+
+    def obter(self, chave) -> Optional[bytes]:
+        with self._trava:
+            item = self._itens.get(chave)
+            
+            if item is None:
+                self.falhas += 1
+                return None
+            
+            valor, expira_em = item
+            
+            if expira_em < time.monotonic():
+                del self._itens[chave]
+                self.remocoes += 1
+                self.falhas += 1
+                return None
+            
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return valor
+
+    def definir(self, chave, valor: bytes, marcador: Optional[int] = None) -> None:
+        with self._trava:
+            if marcador is not None and marcador != self._invalidacoes:
+                return
+            
+            self._itens[chave] = (valor, time.monotonic() + self.ttl)
+            self._itens.move_to_end(chave)
+            
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+                self.remocoes += 1
+
+    def remover(self, chave) -> None:
+        with self._trava:
+            self._invalidacoes += 1
+            self._itens.pop(chave, None)
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._invalidacoes += 1
+            self._itens.clear()
+
+    def estatisticas(self) -> dict:
+        return {
+            "backend": "memoria",
+            "itens": len(self._itens),
+            "max_itens": self.max_itens,
+            "ttl": self.ttl,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "remocoes": self.remocoes
+        }
+
+
+class CacheRedis:
+    def __init__(self, cliente, ttl: float = CACHE_TTL, prefixo: str = "futuroconecta:perfil:v2:"):
+        self.cliente = cliente
+        self.ttl = ttl
+        self.prefixo = prefixo
+        self.chave_invalidacoes = f"{prefixo}__invalidacoes"
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def _chave(self, chave) -> str:
+        return f"{self.prefixo}{chave}"
+
+    def marcador(self) -> int:
+        return int(self.cliente.get(self.chave_invalidacoes) or 0)
+
+    def obter(self, chave) -> Optional[bytes]:
+        valor = self.cliente.get(self._chave(chave))
+        
+        if valor is None:
+            self.falhas += 1
+        else:
+            self.acertos += 1
+        
+        return valor
+
+    def definir(self, chave, valor: bytes, marcador: Optional[int] = None) -> None:
+        if marcador is None:
+            self.cliente.set(self._chave(chave), valor, ex=int(self.ttl))
+            return
+        
+        from redis.exceptions import WatchError
+        
+        with self.cliente.pipeline() as transacao:
+            try:
+                transacao.watch(self.chave_invalidacoes)
+                
+                if int(transacao.get(self.chave_invalidacoes) or 0) != marcador:
+                    return
+                
+                transacao.multi()
+                transacao.set(self._chave(chave), valor, ex=int(self.ttl))
+                transacao.execute()
+            except WatchError:
+                return
+
+    def remover(self, chave) -> None:
+        transacao = self.cliente.pipeline()
+        transacao.incr(self.chave_invalidacoes)
+        transacao.delete(self._chave(chave))
+        _, removidas = transacao.execute()
+        self.remocoes += removidas
+
+    def limpar(self) -> None:
+        self.cliente.incr(self.chave_invalidacoes)
+        
+        for chave in self.cliente.scan_iter(f"{self.prefixo}*"):
+            if chave.decode() != self.chave_invalidacoes:
+                self.remocoes += self.cliente.delete(chave)
+
+    def estatisticas(self) -> dict:
+        return {
+            "backend": "redis",
+            "ttl": self.ttl,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "remocoes": self.remocoes,
+            "invalidacoes": self.marcador()
+        }
+
+
+def criar_cache_perfis():
+    if CACHE_BACKEND == "redis":
+        import redis
+        
+        return CacheRedis(redis.Redis.from_url(REDIS_URL))
+    
+    return CacheMemoria()
+
+
+cache_perfis = criar_cache_perfis()
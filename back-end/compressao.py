@@ -0,0 +1,158 @@
+import os
+import zlib
+from typing import Optional
+from dotenv import load_dotenv
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+load_dotenv()
+
+COMPRESSAO_TAMANHO_MINIMO = int(os.getenv("COMPRESSAO_TAMANHO_MINIMO", "1024"))
+COMPRESSAO_NIVEL_GZIP = int(os.getenv("COMPRESSAO_NIVEL_GZIP", "6"))
+COMPRESSAO_QUALIDADE_BROTLI = int(os.getenv("COMPRESSAO_QUALIDADE_BROTLI", "4"))
+
+TIPOS_COMPRIMIVEIS = ("application/json", "application/x-ndjson", "text/")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class CompressorGzip:
+    codificacao = "gzip"
+
+    def __init__(self, nivel: int = COMPRESSAO_NIVEL_GZIP):
+        self._compressor = zlib.compressobj(nivel, zlib.DEFLATED, 31)
+
+    def comprimir(self, dados: bytes) -> bytes:
+        return self._compressor.compress(dados)
+
+    def finalizar(self) -> bytes:
+        return self._compressor.flush()
+
+
+class CompressorBrotli:
+    codificacao = "br"
+
+    def __init__(self, qualidade: int = COMPRESSAO_QUALIDADE_BROTLI):
+        self._compressor = brotli.Compressor(quality=qualidade)
+
+    def comprimir(self, dados: bytes) -> bytes:
+        return self._compressor.process(dados)
+
+    def finalizar(self) -> bytes:
+        return self._compressor.finish()
+
+
+def codificacoes_aceitas(cabecalho: str) -> set:
+    aceitas = set()
+    
+    for parte in cabecalho.split(","):
+        nome, _, parametros = parte.strip().partition(";")
+        parametros = parametros.replace(" ", "")
+        
+        if parametros in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        
+        aceitas.add(nome.strip().lower())
+    
+    return aceitas
+
+
+def escolher_compressor(cabecalho: str):
+    aceitas = codificacoes_aceitas(cabecalho)
+    
+    if brotli is not None and "br" in aceitas:
+        return CompressorBrotli
+    
+    if "gzip" in aceitas:
+        return CompressorGzip
+    
+    return None
+
+
+def etag_fraco(etag: Optional[str]) -> Optional[str]:
+    if etag is None or etag.startswith("W/"):
+        return etag
+    
+    return f"W/{etag}"
+
+
+class CompressaoMiddleware:
+    def __init__(self, app: ASGIApp, tamanho_minimo: int = COMPRESSAO_TAMANHO_MINIMO):
+        self.app = app
+        self.tamanho_minimo = tamanho_minimo
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        fabrica = escolher_compressor(Headers(scope=scope).get("accept-encoding", ""))
+        
+        if fabrica is None:
+            await self.app(scope, receive, send)
+            return
+        
+        inicio: Optional[Message] = None
+        pendente = []
+        compressor = None
+        repassar = False
+
+        async def enviar(mensagem: Message) -> None:
+            nonlocal inicio, compressor, repassar
+            
+            if mensagem["type"] == "http.response.start":
+                inicio = mensagem
+                return
+            
+            if mensagem["type"] != "http.response.body":
+                await send(mensagem)
+                return
+            
+            corpo = mensagem.get("body", b"")
+            mais = mensagem.get("more_body", False)
+            
+            if inicio is not None:
+                pendente.append(corpo)
+                tamanho = sum(len(parte) for parte in pendente)
+                
+                if mais and tamanho < self.tamanho_minimo:
+                    return
+                
+                corpo = b"".join(pendente)
+                pendente.clear()
+                cabecalhos = MutableHeaders(raw=inicio["headers"])
+                tipo = cabecalhos.get("content-type", "")
+                repassar = (
+                    "content-encoding" in cabecalhos
+                    or not tipo.startswith(TIPOS_COMPRIMIVEIS)
+                    or tamanho < self.tamanho_minimo
+                )
+                
+                if not repassar:
+                    compressor = fabrica()
+                    cabecalhos["Content-Encoding"] = compressor.codificacao
+                    cabecalhos.add_vary_header("Accept-Encoding")
+                    del cabecalhos["Content-Length"]
+                    
+                    if "etag" in cabecalhos:
+                        cabecalhos["ETag"] = etag_fraco(cabecalhos["etag"])
+                    
+                    corpo = compressor.comprimir(corpo) + (b"" if mais else compressor.finalizar())
+                    
+                    if not mais:
+                        cabecalhos["Content-Length"] = str(len(corpo))
+                
+                await send(inicio)
+                inicio = None
+                await send({"type": "http.response.body", "body": corpo, "more_body": mais})
+                return
+            
+            if not repassar:
+                corpo = compressor.comprimir(corpo) + (b"" if mais else compressor.finalizar())
+            
+            await send({"type": "http.response.body", "body": corpo, "more_body": mais})
+        
+        await self.app(scope, receive, enviar)
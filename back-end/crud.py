@@ -1,10 +1,270 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from models import Profissional
-from schemas import ProfissionalCreate, ProfissionalUpdate
+import base64
+import json
+import math
+import re
+from datetime import date
+from collections import Counter
+from sqlalchemy import select, delete, insert, update, and_, or_
+from sqlalchemy.orm import Session, Query, selectinload, load_only
+from typing import Iterator, List, Optional, Tuple
+from models import Profissional, HabilidadeProfissional, IdiomaProfissional
+from schemas import ProfissionalCreate, ProfissionalUpdate, ProfissionalResponse, VagaRanking, OperacaoPatch
+from cache import cache_perfis
+from serializacao import empacotar_perfil
+from versionamento import ConflitoVersao
+from normalizacao import (
+    NIVEIS_IDIOMA,
+    canonizar_habilidades,
+    normalizar_habilidade,
+    normalizar_idioma,
+    extrair_niveis_idiomas,
+    vocabulario_habilidades
+)
+from ranking import indice_ranking
+from similaridade import indice_similaridade, tokens_do_profissional
+from sugestoes import indice_sugestoes, termos_do_profissional
+from busca import (
+    indexar_profissional,
+    indexar_profissionais,
+    remover_profissional_do_indice,
+    remover_profissionais_do_indice,
+    aplicar_busca_textual
+)
+from facetas import (
+    FACETA_AREA,
+    FACETA_CIDADE,
+    FACETA_TECNOLOGIA,
+    facetas_do_profissional,
+    aplicar_delta_facetas,
+    obter_valores_faceta,
+    obter_contagens_faceta
+)
+from estatisticas import ESTATISTICAS_TOP_TECNOLOGIAS, consulta_estatisticas, montar_estatisticas
+from fila import fila_derivados
+from fotos import PREFIXO_ENVIADA
 
+CAMPOS_INDICE_BUSCA = ['nome', 'cargo', 'resumo', 'habilidades_tecnicas', 'experiencias']
 
-def criar_profissional(db: Session, profissional: ProfissionalCreate) -> Profissional:
+CAMPOS_SIMILARIDADE = ['habilidades_tecnicas', 'area_interesses', 'area']
+
+CAMPOS_DERIVADOS = sorted(set(CAMPOS_INDICE_BUSCA) | set(CAMPOS_SIMILARIDADE))
+
+CAMPOS_DELTAS = ['nome', 'cargo', 'localizacao', 'area', 'habilidades_tecnicas']
+
+CAMPOS_LISTAS_OBJETOS = ['experiencias', 'formacao', 'projetos', 'idiomas']
+
+
+def sincronizar_indice_habilidades(db_profissional: Profissional) -> None:
+    novas = {normalizar_habilidade(skill) for skill in db_profissional.habilidades_tecnicas}
+    atuais = {item.habilidade: item for item in db_profissional.indice_habilidades}
+    
+    for habilidade, item in atuais.items():
+        if habilidade not in novas:
+            db_profissional.indice_habilidades.remove(item)
+    
+    for habilidade in sorted(novas - atuais.keys()):
+        db_profissional.indice_habilidades.append(HabilidadeProfissional(habilidade=habilidade))
+
+
+def sincronizar_indice_idiomas(db_profissional: Profissional) -> None:
+    novos = extrair_niveis_idiomas(db_profissional.idiomas)
+    atuais = {item.idioma: item for item in db_profissional.indice_idiomas}
+    
+    for idioma, item in atuais.items():
+        if idioma not in novos:
+            db_profissional.indice_idiomas.remove(item)
+        elif item.nivel != novos[idioma]:
+            item.nivel = novos[idioma]
+    
+    for idioma in sorted(novos.keys() - atuais.keys()):
+        db_profissional.indice_idiomas.append(IdiomaProfissional(idioma=idioma, nivel=novos[idioma]))
+
+
+def filtrar_por_idioma(query: Query, idioma: str, nivel_minimo: Optional[str] = None) -> Query:
+    subconsulta = select(IdiomaProfissional.profissional_id).where(
+        IdiomaProfissional.idioma == normalizar_idioma(idioma)
+    )
+    
+    if nivel_minimo:
+        subconsulta = subconsulta.where(IdiomaProfissional.nivel >= NIVEIS_IDIOMA.get(nivel_minimo, 0))
+    
+    return query.filter(Profissional.id.in_(subconsulta))
+
+
+def reconstruir_indice_idiomas(db: Session, tamanho_lote: int = 1000) -> int:
+    db.execute(delete(IdiomaProfissional))
+    
+    total = 0
+    lote = []
+    consulta = select(Profissional.id, Profissional.idiomas).execution_options(yield_per=tamanho_lote)
+    
+    for profissional_id, idiomas in db.execute(consulta):
+        for idioma, nivel in extrair_niveis_idiomas(idiomas).items():
+            lote.append({"profissional_id": profissional_id, "idioma": idioma, "nivel": nivel})
+        
+        if len(lote) >= tamanho_lote:
+            db.execute(insert(IdiomaProfissional.__table__), lote)
+            total += len(lote)
+            lote = []
+    
+    if lote:
+        db.execute(insert(IdiomaProfissional.__table__), lote)
+        total += len(lote)
+    
+    db.commit()
+    return total
+
+
+def resolver_tecnologia(db: Session, tecnologia: str) -> str:
+    if not vocabulario_habilidades.carregado:
+        vocabulario_habilidades.carregar(obter_valores_faceta(db, FACETA_TECNOLOGIA))
+    
+    return vocabulario_habilidades.resolver(tecnologia)
+
+
+def filtrar_por_tecnologia(query: Query, tecnologia: str) -> Query:
+    subconsulta = select(HabilidadeProfissional.profissional_id).where(
+        HabilidadeProfissional.habilidade == resolver_tecnologia(query.session, tecnologia)
+    )
+    return query.filter(Profissional.id.in_(subconsulta))
+
+
+def reconstruir_indice_habilidades(db: Session, tamanho_lote: int = 1000) -> int:
+    db.execute(delete(HabilidadeProfissional))
+    
+    total = 0
+    lote = []
+    consulta = select(Profissional.id, Profissional.habilidades_tecnicas).execution_options(yield_per=tamanho_lote)
+    
+    for profissional_id, habilidades in db.execute(consulta):
+        for habilidade in {normalizar_habilidade(skill) for skill in habilidades}:
+            lote.append({"profissional_id": profissional_id, "habilidade": habilidade})
+        
+        if len(lote) >= tamanho_lote:
+            db.execute(insert(HabilidadeProfissional.__table__), lote)
+            total += len(lote)
+            lote = []
+    
+    if lote:
+        db.execute(insert(HabilidadeProfissional.__table__), lote)
+        total += len(lote)
+    
+    db.commit()
+    return total
+
+
+def ano_do_mes(valor) -> Optional[int]:
+    correspondencia = re.match(r"\s*(\d{4})", valor) if isinstance(valor, str) else None
+    return int(correspondencia.group(1)) if correspondencia else None
+
+
+def calcular_resumo_experiencia(experiencias: List[dict]) -> dict:
+    anos_base = 0
+    cargos_atuais = 0
+    mais_recente = None
+    
+    for exp in experiencias:
+        ano_inicio = ano_do_mes(exp.get('inicio'))
+        
+        if ano_inicio is None:
+            continue
+        
+        if str(exp.get('fim', '')).strip().lower() == 'atual':
+            anos_base -= ano_inicio
+            cargos_atuais += 1
+        else:
+            ano_fim = ano_do_mes(exp.get('fim'))
+            
+            if ano_fim is None:
+                continue
+            
+            anos_base += ano_fim - ano_inicio
+        
+        if mais_recente is None or exp['inicio'] > mais_recente['inicio']:
+            mais_recente = exp
+    
+    return {
+        "anos_experiencia_base": anos_base,
+        "cargos_atuais": cargos_atuais,
+        "cargo_recente": mais_recente['cargo'] if mais_recente else None,
+        "inicio_cargo_recente": mais_recente['inicio'] if mais_recente else None
+    }
+
+
+def calcular_experiencia_total(profissional: Profissional) -> int:
+    resumo = calcular_resumo_experiencia(profissional.experiencias)
+    return resumo["anos_experiencia_base"] + resumo["cargos_atuais"] * date.today().year
+
+
+def sincronizar_resumo_experiencia(db_profissional: Profissional) -> None:
+    for campo, valor in calcular_resumo_experiencia(db_profissional.experiencias).items():
+        setattr(db_profissional, campo, valor)
+
+
+def reconstruir_resumo_experiencia(db: Session, tamanho_lote: int = 1000) -> int:
+    total = 0
+    ultimo_id = 0
+    
+    while True:
+        consulta = (
+            select(Profissional.id, Profissional.experiencias)
+            .where(Profissional.id > ultimo_id)
+            .order_by(Profissional.id)
+            .limit(tamanho_lote)
+        )
+        linhas = db.execute(consulta).all()
+        
+        if not linhas:
+            break
+        
+        lote = [
+            {"id": profissional_id, **calcular_resumo_experiencia(experiencias)}
+            for profissional_id, experiencias in linhas
+        ]
+        db.execute(update(Profissional), lote)
+        
+        total += len(lote)
+        ultimo_id = linhas[-1][0]
+    
+    db.commit()
+    return total
+
+
+def canonizar_habilidades_cadastradas(db: Session, tamanho_lote: int = 1000) -> int:
+    total = 0
+    ultimo_id = 0
+    
+    while True:
+        consulta = (
+            select(Profissional.id, Profissional.habilidades_tecnicas)
+            .where(Profissional.id > ultimo_id)
+            .order_by(Profissional.id)
+            .limit(tamanho_lote)
+        )
+        linhas = db.execute(consulta).all()
+        
+        if not linhas:
+            break
+        
+        lote = []
+        
+        for profissional_id, habilidades in linhas:
+            canonicas = canonizar_habilidades(habilidades)
+            
+            if canonicas != habilidades:
+                lote.append({"id": profissional_id, "habilidades_tecnicas": canonicas})
+        
+        if lote:
+            db.execute(update(Profissional), lote)
+        
+        total += len(lote)
+        ultimo_id = linhas[-1][0]
+    
+    db.commit()
+    return total
+
+
+def montar_profissional(profissional: ProfissionalCreate) -> Profissional:
     db_profissional = Profissional(
         nome=profissional.nome,
         foto=profissional.foto,
@@ -12,7 +272,7 @@ def criar_profissional(db: Session, profissional: ProfissionalCreate) -> Profiss
         resumo=profissional.resumo,
         localizacao=profissional.localizacao,
         area=profissional.area,
-        habilidades_tecnicas=[skill for skill in profissional.habilidades_tecnicas],
+        habilidades_tecnicas=canonizar_habilidades(profissional.habilidades_tecnicas),
         soft_skills=[skill for skill in profissional.soft_skills],
         experiencias=[exp.dict() for exp in profissional.experiencias],
         formacao=[form.dict() for form in profissional.formacao],
@@ -21,14 +281,72 @@ def criar_profissional(db: Session, profissional: ProfissionalCreate) -> Profiss
         idiomas=[idioma.dict() for idioma in profissional.idiomas],
         area_interesses=profissional.area_interesses
     )
+    sincronizar_indice_habilidades(db_profissional)
+    sincronizar_indice_idiomas(db_profissional)
+    sincronizar_resumo_experiencia(db_profissional)
+    vocabulario_habilidades.adicionar(db_profissional.habilidades_tecnicas)
+    
+    return db_profissional
+
+
+def criar_profissional(db: Session, profissional: ProfissionalCreate) -> Profissional:
+    db_profissional = montar_profissional(profissional)
     
     db.add(db_profissional)
+    db.flush()
+    aplicar_delta_facetas(db, Counter(), facetas_do_profissional(db_profissional))
+    termos = termos_do_profissional(db_profissional)
+    similares = []
+    
+    if fila_derivados.ativa:
+        fila_derivados.enfileirar(db, [db_profissional.id])
+    else:
+        indexar_profissional(db, db_profissional)
+        similares.append((db_profissional.id, tokens_do_profissional(db_profissional)))
+    
     db.commit()
+    indice_ranking.invalidar()
+    indice_similaridade.definir(similares)
+    indice_sugestoes.aplicar_delta(Counter(), termos)
+    fila_derivados.notificar()
     db.refresh(db_profissional)
     
     return db_profissional
 
 
+def criar_profissionais_em_lote(db: Session, profissionais: List[ProfissionalCreate]) -> List[int]:
+    db_profissionais = [montar_profissional(profissional) for profissional in profissionais]
+    facetas_novas = Counter()
+    termos_novos = Counter()
+    
+    for db_profissional in db_profissionais:
+        facetas_novas.update(facetas_do_profissional(db_profissional))
+        termos_novos.update(termos_do_profissional(db_profissional))
+    
+    db.add_all(db_profissionais)
+    db.flush()
+    aplicar_delta_facetas(db, Counter(), facetas_novas)
+    ids_criados = [db_profissional.id for db_profissional in db_profissionais]
+    similares = []
+    
+    if fila_derivados.ativa:
+        fila_derivados.enfileirar(db, ids_criados)
+    else:
+        indexar_profissionais(db, db_profissionais)
+        similares = [
+            (db_profissional.id, tokens_do_profissional(db_profissional))
+            for db_profissional in db_profissionais
+        ]
+    
+    db.commit()
+    indice_ranking.invalidar()
+    indice_similaridade.definir(similares)
+    indice_sugestoes.aplicar_delta(Counter(), termos_novos)
+    fila_derivados.notificar()
+    
+    return ids_criados
+
+
 def obter_profissional_por_id(db: Session, profissional_id: int) -> Optional[Profissional]:
     profissional = db.query(Profissional).filter(Profissional.id == profissional_id).first()
     
@@ -38,205 +356,722 @@ def obter_profissional_por_id(db: Session, profissional_id: int) -> Optional[Pro
     return profissional
 
 
-def obter_todos_profissionais(db: Session, skip: int = 0, limit: int = 100) -> List[Profissional]:
-    profissionais = db.query(Profissional).offset(skip).limit(limit).all()
+def obter_foto_do_profissional(db: Session, profissional_id: int):
+    return db.execute(
+        select(Profissional.foto, Profissional.versao).where(Profissional.id == profissional_id)
+    ).first()
+
+
+def obter_fotos_enviadas_em_uso(db: Session, fotos: Optional[List[str]] = None) -> set:
+    consulta = select(Profissional.foto).where(Profissional.foto.startswith(PREFIXO_ENVIADA)).distinct()
+    
+    if fotos is not None:
+        consulta = consulta.where(Profissional.foto.in_(fotos))
+    
+    return set(db.scalars(consulta))
+
+
+def obter_profissional_serializado(db: Session, profissional_id: int) -> Optional[bytes]:
+    em_cache = cache_perfis.obter(profissional_id)
+    
+    if em_cache is not None:
+        return em_cache
+    
+    marcador = cache_perfis.marcador()
+    profissional = obter_profissional_por_id(db, profissional_id)
+    
+    if profissional is None:
+        return None
+    
+    empacotado = empacotar_perfil(profissional)
+    cache_perfis.definir(profissional_id, empacotado, marcador)
+    
+    return empacotado
+
+
+def consultar_profissionais(db: Session, campos: Optional[List[str]] = None) -> Query:
+    query = db.query(Profissional)
+    
+    if campos:
+        query = query.options(load_only(*[getattr(Profissional, campo) for campo in campos]))
+    
+    return query
+
+
+def obter_todos_profissionais(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    campos: Optional[List[str]] = None
+) -> List[Profissional]:
+    profissionais = consultar_profissionais(db, campos).order_by(Profissional.id).offset(skip).limit(limit).all()
     return profissionais
 
 
+def aplicar_filtros(
+    query: Query,
+    area: Optional[str] = None,
+    cidade: Optional[str] = None,
+    tecnologia: Optional[str] = None,
+    anos_minimos: Optional[int] = None,
+    idioma: Optional[str] = None,
+    nivel_minimo: Optional[str] = None
+) -> Query:
+    if area:
+        query = query.filter(Profissional.area == area)
+    
+    if cidade:
+        query = query.filter(Profissional.localizacao == cidade)
+    
+    if tecnologia:
+        query = filtrar_por_tecnologia(query, tecnologia)
+    
+    if anos_minimos is not None:
+        query = query.filter(Profissional.anos_experiencia >= anos_minimos)
+    
+    if idioma:
+        query = filtrar_por_idioma(query, idioma, nivel_minimo)
+    
+    return query
+
+
 def buscar_profissionais(
     db: Session,
     termo_busca: Optional[str] = None,
     area: Optional[str] = None,
     cidade: Optional[str] = None,
     tecnologia: Optional[str] = None,
+    anos_minimos: Optional[int] = None,
+    idioma: Optional[str] = None,
+    nivel_minimo: Optional[str] = None,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    campos: Optional[List[str]] = None
 ) -> List[Profissional]:
-    query = db.query(Profissional)
+    query = aplicar_filtros(consultar_profissionais(db, campos), area, cidade, tecnologia, anos_minimos, idioma, nivel_minimo)
+    relevancia = None
     
     if termo_busca:
-        termo_lower = termo_busca.lower()
-        query = query.filter(
-            (Profissional.nome.ilike(f"%{termo_busca}%")) |
-            (Profissional.cargo.ilike(f"%{termo_busca}%")) |
-            (Profissional.resumo.ilike(f"%{termo_busca}%"))
-        )
+        query, relevancia = aplicar_busca_textual(query, termo_busca)
     
-    if area:
-        query = query.filter(Profissional.area == area)
-    
-    if cidade:
-        query = query.filter(Profissional.localizacao == cidade)
+    if relevancia is not None:
+        query = query.order_by(relevancia, Profissional.id)
+    else:
+        query = query.order_by(Profissional.id)
     
     profissionais = query.offset(skip).limit(limit).all()
     
-    if tecnologia:
-        profissionais_filtrados = []
-        for prof in profissionais:
-            for tech in prof.habilidades_tecnicas:
-                if tecnologia.lower() in tech.lower():
-                    profissionais_filtrados.append(prof)
-                    break
-        return profissionais_filtrados
-    
     return profissionais
 
 
-def atualizar_profissional(
+def ranquear_profissionais(
+    db: Session,
+    vaga: VagaRanking,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Tuple[Profissional, float]], int]:
+    matriz = indice_ranking.obter_matriz(db)
+    ids, pontuacoes, total = matriz.ranquear(
+        obrigatorias=vaga.habilidades_obrigatorias,
+        desejaveis=vaga.habilidades_desejaveis,
+        anos_minimos=vaga.anos_minimos,
+        idiomas=[(requisito.idioma, requisito.nivel_minimo) for requisito in vaga.idiomas],
+        cidade=vaga.cidade,
+        area=vaga.area,
+        limite=vaga.limit
+    )
+    
+    if not ids:
+        return [], total
+    
+    encontrados = {
+        profissional.id: profissional
+        for profissional in consultar_profissionais(db, campos).filter(Profissional.id.in_(ids))
+    }
+    
+    return [
+        (encontrados[profissional_id], pontuacao)
+        for profissional_id, pontuacao in zip(ids, pontuacoes)
+        if profissional_id in encontrados
+    ], total
+
+
+def buscar_profissionais_similares(
     db: Session,
     profissional_id: int,
-    profissional_update: ProfissionalUpdate
-) -> Optional[Profissional]:
-    db_profissional = obter_profissional_por_id(db, profissional_id)
+    limite: int = 10,
+    campos: Optional[List[str]] = None
+) -> Optional[Tuple[List[Tuple[Profissional, float]], int]]:
+    indice_similaridade.montar(db)
     
-    if db_profissional is None:
-        return None
+    if not indice_similaridade.contem(profissional_id):
+        db_profissional = obter_profissional_por_id(db, profissional_id)
+        
+        if db_profissional is None:
+            return None
+        
+        indice_similaridade.definir([(profissional_id, tokens_do_profissional(db_profissional))])
+    
+    similares, total = indice_similaridade.similares(profissional_id, limite)
+    ids = [candidato for candidato, _ in similares]
+    
+    if not ids:
+        return [], total
     
-    update_data = profissional_update.dict(exclude_unset=True)
+    encontrados = {
+        profissional.id: profissional
+        for profissional in consultar_profissionais(db, campos).filter(Profissional.id.in_(ids))
+    }
+    
+    return [
+        (encontrados[candidato], nota)
+        for candidato, nota in similares
+        if candidato in encontrados
+    ], total
+
+
+def codificar_cursor(profissional_id: int, relevancia: Optional[float] = None) -> str:
+    posicao = {"id": profissional_id}
+    
+    if relevancia is not None:
+        posicao["relevancia"] = relevancia
+    
+    return base64.urlsafe_b64encode(json.dumps(posicao).encode()).decode()
+
+
+def decodificar_cursor(cursor: str) -> dict:
+    try:
+        dados = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        posicao = {"id": int(dados["id"])}
+        
+        if "relevancia" in dados:
+            posicao["relevancia"] = float(dados["relevancia"])
+            
+            if not math.isfinite(posicao["relevancia"]):
+                raise ValueError(posicao["relevancia"])
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Cursor de paginação inválido")
+    
+    return posicao
+
+
+def buscar_profissionais_por_cursor(
+    db: Session,
+    termo_busca: Optional[str] = None,
+    area: Optional[str] = None,
+    cidade: Optional[str] = None,
+    tecnologia: Optional[str] = None,
+    anos_minimos: Optional[int] = None,
+    idioma: Optional[str] = None,
+    nivel_minimo: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Profissional], Optional[str]]:
+    query = aplicar_filtros(consultar_profissionais(db, campos), area, cidade, tecnologia, anos_minimos, idioma, nivel_minimo)
+    relevancia = None
+    
+    if termo_busca:
+        query, relevancia = aplicar_busca_textual(query, termo_busca)
+    
+    if relevancia is not None:
+        query = query.add_columns(relevancia)
+    
+    if cursor:
+        posicao = decodificar_cursor(cursor)
+        
+        if (relevancia is not None) != ("relevancia" in posicao):
+            raise ValueError("Cursor de paginação inválido para esta busca")
+        
+        if relevancia is not None:
+            query = query.filter(or_(
+                relevancia > posicao["relevancia"],
+                and_(relevancia == posicao["relevancia"], Profissional.id > posicao["id"])
+            ))
+        else:
+            query = query.filter(Profissional.id > posicao["id"])
+    
+    if relevancia is not None:
+        query = query.order_by(relevancia, Profissional.id)
+    else:
+        query = query.order_by(Profissional.id)
+    
+    linhas = query.limit(limit + 1).all()
+    tem_proxima = len(linhas) > limit
+    linhas = linhas[:limit]
+    
+    if relevancia is not None:
+        profissionais = [profissional for profissional, _ in linhas]
+    else:
+        profissionais = linhas
+    
+    proximo_cursor = None
+    
+    if tem_proxima:
+        if relevancia is not None:
+            ultimo, ultima_relevancia = linhas[-1]
+            proximo_cursor = codificar_cursor(ultimo.id, ultima_relevancia)
+        else:
+            proximo_cursor = codificar_cursor(profissionais[-1].id)
+    
+    return profissionais, proximo_cursor
+
+
+def exportar_profissionais(
+    db: Session,
+    termo_busca: Optional[str] = None,
+    area: Optional[str] = None,
+    cidade: Optional[str] = None,
+    tecnologia: Optional[str] = None,
+    anos_minimos: Optional[int] = None,
+    idioma: Optional[str] = None,
+    nivel_minimo: Optional[str] = None,
+    campos: Optional[List[str]] = None,
+    tamanho_lote: int = 1000
+) -> Iterator[List[Profissional]]:
+    query = aplicar_filtros(consultar_profissionais(db, campos), area, cidade, tecnologia, anos_minimos, idioma, nivel_minimo)
+    relevancia = None
+    
+    if termo_busca:
+        query, relevancia = aplicar_busca_textual(query, termo_busca)
+    
+    if relevancia is not None:
+        query = query.order_by(relevancia, Profissional.id)
+    else:
+        query = query.order_by(Profissional.id)
+    
+    resultado = db.execute(query.statement.execution_options(yield_per=tamanho_lote))
+    
+    for lote in resultado.scalars().partitions():
+        yield lote
+
+
+def valores_da_atualizacao(update_data: dict) -> dict:
+    valores = {}
     
     for campo, valor in update_data.items():
-        if hasattr(db_profissional, campo):
-            if campo in ['experiencias', 'formacao', 'projetos', 'idiomas']:
-                valor_processado = [item.dict() if hasattr(item, 'dict') else item for item in valor]
-                setattr(db_profissional, campo, valor_processado)
-            else:
-                setattr(db_profissional, campo, valor)
+        if not hasattr(Profissional, campo):
+            continue
+        
+        if campo in CAMPOS_LISTAS_OBJETOS:
+            valores[campo] = [item.dict() if hasattr(item, 'dict') else item for item in valor]
+        elif campo == 'habilidades_tecnicas':
+            valores[campo] = canonizar_habilidades(valor)
+        else:
+            valores[campo] = valor
     
-    db.commit()
-    db.refresh(db_profissional)
+    if 'experiencias' in valores:
+        valores.update(calcular_resumo_experiencia(valores['experiencias']))
     
-    return db_profissional
+    return valores
 
 
-def deletar_profissional(db: Session, profissional_id: int) -> bool:
-    db_profissional = obter_profissional_por_id(db, profissional_id)
+def aplicar_atualizacao(db_profissional: Profissional, update_data: dict) -> None:
+    db_profissional.versao = Profissional.versao + 1
+    
+    for campo, valor in valores_da_atualizacao(update_data).items():
+        setattr(db_profissional, campo, valor)
+    
+    if 'habilidades_tecnicas' in update_data:
+        sincronizar_indice_habilidades(db_profissional)
+        vocabulario_habilidades.adicionar(db_profissional.habilidades_tecnicas)
+    
+    if 'idiomas' in update_data:
+        sincronizar_indice_idiomas(db_profissional)
+
+
+def regravar_indices_do_profissional(db: Session, profissional_id: int, valores: dict) -> None:
+    if 'habilidades_tecnicas' in valores:
+        db.execute(delete(HabilidadeProfissional).where(HabilidadeProfissional.profissional_id == profissional_id))
+        habilidades = sorted({normalizar_habilidade(skill) for skill in valores['habilidades_tecnicas']})
+        
+        if habilidades:
+            db.execute(insert(HabilidadeProfissional.__table__), [
+                {"profissional_id": profissional_id, "habilidade": habilidade}
+                for habilidade in habilidades
+            ])
+        
+        vocabulario_habilidades.adicionar(valores['habilidades_tecnicas'])
+    
+    if 'idiomas' in valores:
+        db.execute(delete(IdiomaProfissional).where(IdiomaProfissional.profissional_id == profissional_id))
+        niveis = extrair_niveis_idiomas(valores['idiomas'])
+        
+        if niveis:
+            db.execute(insert(IdiomaProfissional.__table__), [
+                {"profissional_id": profissional_id, "idioma": idioma, "nivel": nivel}
+                for idioma, nivel in sorted(niveis.items())
+            ])
+
+
+def gravar_atualizacao(
+    db: Session,
+    profissional_id: int,
+    update_data: dict,
+    versoes_aceitas: Optional[List[int]] = None,
+    anterior=None
+) -> Optional[Profissional]:
+    valores = valores_da_atualizacao(update_data)
+    altera_deltas = any(campo in valores for campo in CAMPOS_DELTAS)
+    
+    if anterior is None and altera_deltas:
+        anterior = db.execute(
+            select(Profissional.versao, *[getattr(Profissional, campo) for campo in CAMPOS_DELTAS])
+            .where(Profissional.id == profissional_id)
+        ).first()
+        
+        if anterior is None:
+            return None
+    
+    if anterior is not None:
+        if versoes_aceitas is not None and anterior.versao not in versoes_aceitas:
+            raise ConflitoVersao(profissional_id, anterior.versao)
+        
+        versoes_aceitas = [anterior.versao]
+    
+    comando = (
+        update(Profissional)
+        .where(Profissional.id == profissional_id)
+        .values(versao=Profissional.versao + 1, **valores)
+        .returning(Profissional)
+    )
+    
+    if versoes_aceitas is not None:
+        comando = comando.where(Profissional.versao.in_(versoes_aceitas))
+    
+    db_profissional = db.scalars(comando).first()
     
     if db_profissional is None:
-        return False
+        versao_atual = db.scalar(select(Profissional.versao).where(Profissional.id == profissional_id))
+        db.rollback()
+        
+        if versao_atual is None:
+            return None
+        
+        raise ConflitoVersao(profissional_id, versao_atual)
     
-    db.delete(db_profissional)
+    regravar_indices_do_profissional(db, profissional_id, valores)
+    termos_antigos = Counter()
+    termos_novos = Counter()
+    
+    if altera_deltas:
+        aplicar_delta_facetas(db, facetas_do_profissional(anterior), facetas_do_profissional(db_profissional))
+        termos_antigos = termos_do_profissional(anterior)
+        termos_novos = termos_do_profissional(db_profissional)
+    
+    similares = []
+    
+    if fila_derivados.ativa:
+        if any(campo in valores for campo in CAMPOS_DERIVADOS):
+            fila_derivados.enfileirar(db, [profissional_id])
+    else:
+        if any(campo in valores for campo in CAMPOS_INDICE_BUSCA):
+            indexar_profissional(db, db_profissional)
+        
+        if any(campo in valores for campo in CAMPOS_SIMILARIDADE):
+            similares.append((profissional_id, tokens_do_profissional(db_profissional)))
+    
+    db.expunge(db_profissional)
     db.commit()
+    cache_perfis.remover(profissional_id)
+    indice_ranking.invalidar()
+    indice_similaridade.definir(similares)
+    indice_sugestoes.aplicar_delta(termos_antigos, termos_novos)
+    fila_derivados.notificar()
     
-    return True
+    return db_profissional
 
 
-def obter_areas_unicas(db: Session) -> List[str]:
-    profissionais = db.query(Profissional).all()
-    areas = set()
+def atualizar_profissional(
+    db: Session,
+    profissional_id: int,
+    profissional_update: ProfissionalUpdate,
+    versoes_aceitas: Optional[List[int]] = None
+) -> Optional[Profissional]:
+    return gravar_atualizacao(db, profissional_id, profissional_update.dict(exclude_unset=True), versoes_aceitas)
+
+
+def decompor_caminho(caminho: str) -> Tuple[str, List[str]]:
+    partes = [parte.replace("~1", "/").replace("~0", "~") for parte in caminho.split("/")[1:]]
     
-    for prof in profissionais:
-        areas.add(prof.area)
+    if not caminho.startswith("/") or not partes or partes[0] not in ProfissionalUpdate.model_fields:
+        raise ValueError(f"Caminho inválido: {caminho}")
     
-    return sorted(list(areas))
+    return partes[0], partes[1:]
 
 
-def obter_cidades_unicas(db: Session) -> List[str]:
-    profissionais = db.query(Profissional).all()
-    cidades = set()
+def posicao_na_lista(lista: list, parte: str, caminho: str, inserir: bool = False) -> int:
+    if inserir and parte == "-":
+        return len(lista)
     
-    for prof in profissionais:
-        cidades.add(prof.localizacao)
+    if not parte.isdigit() or int(parte) > len(lista) or (int(parte) == len(lista) and not inserir):
+        raise ValueError(f"Índice inválido em {caminho}")
     
-    return sorted(list(cidades))
+    return int(parte)
 
 
-def obter_tecnologias_unicas(db: Session) -> List[str]:
-    profissionais = db.query(Profissional).all()
-    tecnologias = set()
+def aplicar_operacao(valores: dict, operacao: OperacaoPatch) -> None:
+    campo, partes = decompor_caminho(operacao.path)
+    
+    if not partes:
+        if operacao.op == "remove":
+            raise ValueError(f"O campo {campo} não pode ser removido")
+        
+        valores[campo] = operacao.value
+        return
+    
+    alvo = valores[campo]
+    
+    for parte in partes[:-1]:
+        if isinstance(alvo, list):
+            alvo = alvo[posicao_na_lista(alvo, parte, operacao.path)]
+        elif isinstance(alvo, dict) and parte in alvo:
+            alvo = alvo[parte]
+        else:
+            raise ValueError(f"Caminho inválido: {operacao.path}")
     
-    for prof in profissionais:
-        for tech in prof.habilidades_tecnicas:
-            tecnologias.add(tech)
+    final = partes[-1]
     
-    return sorted(list(tecnologias))
+    if isinstance(alvo, list):
+        if operacao.op == "add":
+            alvo.insert(posicao_na_lista(alvo, final, operacao.path, inserir=True), operacao.value)
+        elif operacao.op == "remove":
+            del alvo[posicao_na_lista(alvo, final, operacao.path)]
+        else:
+            alvo[posicao_na_lista(alvo, final, operacao.path)] = operacao.value
+    elif isinstance(alvo, dict):
+        if operacao.op != "add" and final not in alvo:
+            raise ValueError(f"Caminho inválido: {operacao.path}")
+        
+        if operacao.op == "remove":
+            del alvo[final]
+        else:
+            alvo[final] = operacao.value
+    else:
+        raise ValueError(f"Caminho inválido: {operacao.path}")
 
 
-def contar_profissionais_por_area(db: Session) -> dict:
-    profissionais = db.query(Profissional).all()
-    contagem = {}
+def alterar_profissional(
+    db: Session,
+    profissional_id: int,
+    operacoes: List[OperacaoPatch],
+    versoes_aceitas: Optional[List[int]] = None
+) -> Optional[Profissional]:
+    campos = sorted({decompor_caminho(operacao.path)[0] for operacao in operacoes})
+    carregar = set(campos)
     
-    for prof in profissionais:
-        if prof.area in contagem:
-            contagem[prof.area] += 1
-        else:
-            contagem[prof.area] = 1
+    if carregar & set(CAMPOS_DELTAS):
+        carregar.update(CAMPOS_DELTAS)
+    
+    atual = db.execute(
+        select(Profissional.versao, *[getattr(Profissional, campo) for campo in sorted(carregar)])
+        .where(Profissional.id == profissional_id)
+    ).first()
+    
+    if atual is None:
+        return None
+    
+    valores = {campo: getattr(atual, campo) for campo in campos}
+    
+    for operacao in operacoes:
+        aplicar_operacao(valores, operacao)
     
-    return contagem
+    update_data = ProfissionalUpdate.model_validate(valores).dict(exclude_unset=True)
+    return gravar_atualizacao(db, profissional_id, update_data, versoes_aceitas, anterior=atual)
 
 
-def obter_profissionais_com_tecnologia(db: Session, tecnologia: str) -> List[Profissional]:
-    profissionais = db.query(Profissional).all()
+def obter_profissionais_por_ids(db: Session, profissionais_ids: List[int]) -> dict:
+    profissionais = (
+        db.query(Profissional)
+        .options(
+            selectinload(Profissional.indice_habilidades),
+            selectinload(Profissional.indice_idiomas)
+        )
+        .filter(Profissional.id.in_(set(profissionais_ids)))
+        .all()
+    )
+    return {profissional.id: profissional for profissional in profissionais}
+
+
+def atualizar_profissionais_em_lote(
+    db: Session,
+    atualizacoes: List[Tuple[int, ProfissionalUpdate]]
+) -> List[bool]:
+    encontrados = obter_profissionais_por_ids(db, [profissional_id for profissional_id, _ in atualizacoes])
+    facetas_antigas = Counter()
+    facetas_novas = Counter()
+    termos_antigos = Counter()
+    termos_novos = Counter()
+    reindexar = {}
+    similares = []
+    derivados = []
     resultado = []
     
-    for prof in profissionais:
-        encontrou = False
+    for profissional_id, profissional_update in atualizacoes:
+        db_profissional = encontrados.get(profissional_id)
+        
+        if db_profissional is None:
+            resultado.append(False)
+            continue
         
-        for tech in prof.habilidades_tecnicas:
-            if tecnologia.lower() in tech.lower():
-                encontrou = True
-                break
+        update_data = profissional_update.dict(exclude_unset=True)
+        facetas_antigas.update(facetas_do_profissional(db_profissional))
+        termos_antigos.update(termos_do_profissional(db_profissional))
         
-        if encontrou:
-            resultado.append(prof)
+        aplicar_atualizacao(db_profissional, update_data)
+        facetas_novas.update(facetas_do_profissional(db_profissional))
+        termos_novos.update(termos_do_profissional(db_profissional))
+        
+        if fila_derivados.ativa:
+            if any(campo in update_data for campo in CAMPOS_DERIVADOS):
+                derivados.append(profissional_id)
+        else:
+            if any(campo in update_data for campo in CAMPOS_INDICE_BUSCA):
+                reindexar[profissional_id] = db_profissional
+            
+            if any(campo in update_data for campo in CAMPOS_SIMILARIDADE):
+                similares.append((profissional_id, tokens_do_profissional(db_profissional)))
+        
+        resultado.append(True)
+    
+    indexar_profissionais(db, list(reindexar.values()))
+    fila_derivados.enfileirar(db, derivados)
+    aplicar_delta_facetas(db, facetas_antigas, facetas_novas)
+    db.commit()
+    indice_ranking.invalidar()
+    indice_similaridade.definir(similares)
+    indice_sugestoes.aplicar_delta(termos_antigos, termos_novos)
+    fila_derivados.notificar()
+    
+    for profissional_id, _ in atualizacoes:
+        cache_perfis.remover(profissional_id)
     
     return resultado
 
 
-def calcular_experiencia_total(profissional: Profissional) -> int:
-    anos_totais = 0
+def deletar_profissional(db: Session, profissional_id: int) -> bool:
+    db_profissional = obter_profissional_por_id(db, profissional_id)
     
-    for exp in profissional.experiencias:
-        ano_inicio = int(exp['inicio'].split('-')[0])
-        
-        if exp['fim'] == 'Atual':
-            ano_fim = 2024
-        else:
-            ano_fim = int(exp['fim'].split('-')[0])
-        
-        anos = ano_fim - ano_inicio
-        anos_totais += anos
+    if db_profissional is None:
+        return False
+    
+    termos = termos_do_profissional(db_profissional)
     
-    return anos_totais
+    if fila_derivados.ativa:
+        fila_derivados.enfileirar(db, [profissional_id])
+    else:
+        remover_profissional_do_indice(db, profissional_id)
+    
+    aplicar_delta_facetas(db, facetas_do_profissional(db_profissional), Counter())
+    db.delete(db_profissional)
+    db.commit()
+    cache_perfis.remover(profissional_id)
+    indice_ranking.invalidar()
+    indice_similaridade.remover([profissional_id])
+    indice_sugestoes.aplicar_delta(termos, Counter())
+    fila_derivados.notificar()
+    
+    return True
 
 
-def buscar_profissionais_com_minimo_experiencia(db: Session, anos_minimos: int) -> List[Profissional]:
-    profissionais = db.query(Profissional).all()
+def deletar_profissionais_em_lote(db: Session, profissionais_ids: List[int]) -> List[bool]:
+    encontrados = obter_profissionais_por_ids(db, profissionais_ids)
+    facetas_removidas = Counter()
+    termos_removidos = Counter()
+    removidos = set()
     resultado = []
     
-    for prof in profissionais:
-        anos = calcular_experiencia_total(prof)
+    for profissional_id in profissionais_ids:
+        db_profissional = encontrados.get(profissional_id)
         
-        if anos >= anos_minimos:
-            resultado.append(prof)
+        if db_profissional is None or profissional_id in removidos:
+            resultado.append(False)
+            continue
+        
+        facetas_removidas.update(facetas_do_profissional(db_profissional))
+        termos_removidos.update(termos_do_profissional(db_profissional))
+        db.delete(db_profissional)
+        removidos.add(profissional_id)
+        resultado.append(True)
+    
+    if fila_derivados.ativa:
+        fila_derivados.enfileirar(db, list(removidos))
+    else:
+        remover_profissionais_do_indice(db, list(removidos))
+    
+    aplicar_delta_facetas(db, facetas_removidas, Counter())
+    db.commit()
+    indice_ranking.invalidar()
+    indice_similaridade.remover(removidos)
+    indice_sugestoes.aplicar_delta(termos_removidos, Counter())
+    fila_derivados.notificar()
+    
+    for profissional_id in removidos:
+        cache_perfis.remover(profissional_id)
     
     return resultado
 
 
-def buscar_profissionais_por_idioma(db: Session, idioma: str, nivel_minimo: Optional[str] = None) -> List[Profissional]:
-    profissionais = db.query(Profissional).all()
-    
-    niveis_ordem = {
-        'Básico': 1,
-        'Intermediário': 2,
-        'Avançado': 3,
-        'Fluente': 4,
-        'Nativo': 5
+def atualizar_derivados(db: Session, profissionais_ids: List[int]) -> None:
+    encontrados = {
+        profissional.id: profissional
+        for profissional in consultar_profissionais(db, CAMPOS_DERIVADOS).filter(Profissional.id.in_(profissionais_ids))
     }
+    removidos = [profissional_id for profissional_id in profissionais_ids if profissional_id not in encontrados]
     
-    resultado = []
+    indexar_profissionais(db, list(encontrados.values()))
+    remover_profissionais_do_indice(db, removidos)
+    indice_similaridade.definir([
+        (profissional_id, tokens_do_profissional(profissional))
+        for profissional_id, profissional in encontrados.items()
+    ])
+    indice_similaridade.remover(removidos)
+
+
+def sugerir_termos(db: Session, termo: str, limite: int = 10) -> List[dict]:
+    if not indice_sugestoes.montado:
+        indice_sugestoes.montar(db)
     
-    for prof in profissionais:
-        for lang in prof.idiomas:
-            if lang['idioma'].lower() == idioma.lower():
-                if nivel_minimo:
-                    nivel_prof = niveis_ordem.get(lang['nivel'], 0)
-                    nivel_req = niveis_ordem.get(nivel_minimo, 0)
-                    
-                    if nivel_prof >= nivel_req:
-                        resultado.append(prof)
-                        break
-                else:
-                    resultado.append(prof)
-                    break
+    return indice_sugestoes.sugerir(termo, limite)
+
+
+def obter_areas_unicas(db: Session) -> List[str]:
+    return obter_valores_faceta(db, FACETA_AREA)
+
+
+def obter_cidades_unicas(db: Session) -> List[str]:
+    return obter_valores_faceta(db, FACETA_CIDADE)
+
+
+def obter_tecnologias_unicas(db: Session) -> List[str]:
+    grafias = {}
     
-    return resultado
+    for tecnologia, quantidade in obter_contagens_faceta(db, FACETA_TECNOLOGIA).items():
+        chave = normalizar_habilidade(tecnologia)
+        
+        if chave not in grafias or quantidade > grafias[chave][1]:
+            grafias[chave] = (tecnologia, quantidade)
+    
+    return sorted(tecnologia for tecnologia, _ in grafias.values())
+
+
+def contar_profissionais_por_area(db: Session) -> dict:
+    return obter_contagens_faceta(db, FACETA_AREA)
+
+
+def calcular_estatisticas(db: Session, limite_tecnologias: int = ESTATISTICAS_TOP_TECNOLOGIAS) -> dict:
+    return montar_estatisticas(db.execute(consulta_estatisticas()), limite_tecnologias)
+
+
+def obter_profissionais_com_tecnologia(db: Session, tecnologia: str) -> List[Profissional]:
+    query = filtrar_por_tecnologia(db.query(Profissional), tecnologia)
+    return query.all()
+
+
+def buscar_profissionais_com_minimo_experiencia(db: Session, anos_minimos: int) -> List[Profissional]:
+    query = db.query(Profissional).filter(Profissional.anos_experiencia >= anos_minimos)
+    return query.order_by(Profissional.id).all()
+
+
+def buscar_profissionais_por_idioma(db: Session, idioma: str, nivel_minimo: Optional[str] = None) -> List[Profissional]:
+    query = filtrar_por_idioma(db.query(Profissional), idioma, nivel_minimo)
+    return query.order_by(Profissional.id).all()
@@ -0,0 +1,132 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+import crud
+from models import Profissional
+from schemas import ProfissionalCreate, ProfissionalUpdate, OperacaoPatch
+
+
+async def criar_profissional(db: AsyncSession, profissional: ProfissionalCreate) -> Profissional:
+    return await db.run_sync(crud.criar_profissional, profissional)
+
+
+async def obter_profissional_por_id(db: AsyncSession, profissional_id: int) -> Optional[Profissional]:
+    return await db.run_sync(crud.obter_profissional_por_id, profissional_id)
+
+
+async def obter_profissional_serializado(db: AsyncSession, profissional_id: int) -> Optional[bytes]:
+    return await db.run_sync(crud.obter_profissional_serializado, profissional_id)
+
+
+async def obter_todos_profissionais(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    campos: Optional[List[str]] = None
+) -> List[Profissional]:
+    return await db.run_sync(crud.obter_todos_profissionais, skip, limit, campos)
+
+
+async def buscar_profissionais(
+    db: AsyncSession,
+    termo_busca: Optional[str] = None,
+    area: Optional[str] = None,
+    cidade: Optional[str] = None,
+    tecnologia: Optional[str] = None,
+    anos_minimos: Optional[int] = None,
+    idioma: Optional[str] = None,
+    nivel_minimo: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    campos: Optional[List[str]] = None
+) -> List[Profissional]:
+    return await db.run_sync(
+        crud.buscar_profissionais,
+        termo_busca=termo_busca,
+        area=area,
+        cidade=cidade,
+        tecnologia=tecnologia,
+        anos_minimos=anos_minimos,
+        idioma=idioma,
+        nivel_minimo=nivel_minimo,
+        skip=skip,
+        limit=limit,
+        campos=campos
+    )
+
+
+async def buscar_profissionais_por_cursor(
+    db: AsyncSession,
+    termo_busca: Optional[str] = None,
+    area: Optional[str] = None,
+    cidade: Optional[str] = None,
+    tecnologia: Optional[str] = None,
+    anos_minimos: Optional[int] = None,
+    idioma: Optional[str] = None,
+    nivel_minimo: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Profissional], Optional[str]]:
+    return await db.run_sync(
+        crud.buscar_profissionais_por_cursor,
+        termo_busca=termo_busca,
+        area=area,
+        cidade=cidade,
+        tecnologia=tecnologia,
+        anos_minimos=anos_minimos,
+        idioma=idioma,
+        nivel_minimo=nivel_minimo,
+        cursor=cursor,
+        limit=limit,
+        campos=campos
+    )
+
+
+async def atualizar_profissional(
+    db: AsyncSession,
+    profissional_id: int,
+    profissional_update: ProfissionalUpdate,
+    versoes_aceitas: Optional[List[int]] = None
+) -> Optional[Profissional]:
+    return await db.run_sync(crud.atualizar_profissional, profissional_id, profissional_update, versoes_aceitas)
+
+
+async def alterar_profissional(
+    db: AsyncSession,
+    profissional_id: int,
+    operacoes: List[OperacaoPatch],
+    versoes_aceitas: Optional[List[int]] = None
+) -> Optional[Profissional]:
+    return await db.run_sync(crud.alterar_profissional, profissional_id, operacoes, versoes_aceitas)
+
+
+async def deletar_profissional(db: AsyncSession, profissional_id: int) -> bool:
+    return await db.run_sync(crud.deletar_profissional, profissional_id)
+
+
+async def obter_areas_unicas(db: AsyncSession) -> List[str]:
+    return await db.run_sync(crud.obter_areas_unicas)
+
+
+async def obter_cidades_unicas(db: AsyncSession) -> List[str]:
+    return await db.run_sync(crud.obter_cidades_unicas)
+
+
+async def obter_tecnologias_unicas(db: AsyncSession) -> List[str]:
+    return await db.run_sync(crud.obter_tecnologias_unicas)
+
+
+async def contar_profissionais_por_area(db: AsyncSession) -> dict:
+    return await db.run_sync(crud.contar_profissionais_por_area)
+
+
+async def buscar_profissionais_com_minimo_experiencia(db: AsyncSession, anos_minimos: int) -> List[Profissional]:
+    return await db.run_sync(crud.buscar_profissionais_com_minimo_experiencia, anos_minimos)
+
+
+async def obter_profissionais_com_tecnologia(db: AsyncSession, tecnologia: str) -> List[Profissional]:
+    return await db.run_sync(crud.obter_profissionais_com_tecnologia, tecnologia)
+
+
+async def buscar_profissionais_por_idioma(db: AsyncSession, idioma: str, nivel_minimo: Optional[str] = None) -> List[Profissional]:
+    return await db.run_sync(crud.buscar_profissionais_por_idioma, idioma, nivel_minimo)
@@ -1,18 +1,129 @@
-from sqlalchemy import create_engine
+import os
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-DATABASE_URL = "sqlite:///./futuroconecta.db"
+load_dotenv()
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./futuroconecta.db")
+
+USAR_BANCO_ASYNC = os.getenv("USAR_BANCO_ASYNC", "false").lower() in ("1", "true", "sim")
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+POOL_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))
+
+
+def montar_url_async(url: str) -> str:
+    url_banco = make_url(url)
+    
+    if url_banco.get_backend_name() == "sqlite":
+        return url_banco.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    
+    if url_banco.get_backend_name() == "postgresql":
+        return url_banco.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", montar_url_async(DATABASE_URL))
+
+
+def opcoes_engine(url: str) -> dict:
+    url_banco = make_url(url)
+    opcoes = {}
+    
+    if url_banco.get_backend_name() == "sqlite":
+        opcoes["connect_args"] = {"check_same_thread": False}
+        
+        if url_banco.database in (None, "", ":memory:"):
+            return opcoes
+        
+        if url_banco.get_driver_name() == "aiosqlite":
+            opcoes["poolclass"] = AsyncAdaptedQueuePool
+    
+    opcoes.update({
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_MAX_OVERFLOW,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_pre_ping": True
+    })
+    
+    return opcoes
+
+
+def configurar_sqlite(conexao_dbapi, registro_conexao):
+    cursor = conexao_dbapi.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+engine = create_engine(DATABASE_URL, **opcoes_engine(DATABASE_URL))
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", configurar_sqlite)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+async_engine = None
+AsyncSessionLocal = None
+
+if USAR_BANCO_ASYNC:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **opcoes_engine(ASYNC_DATABASE_URL))
+    
+    if async_engine.dialect.name == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", configurar_sqlite)
+    
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+def atualizar_esquema(bind) -> None:
+    inspetor = inspect(bind)
+    
+    with bind.begin() as conexao:
+        for tabela in Base.metadata.sorted_tables:
+            if not inspetor.has_table(tabela.name):
+                continue
+            
+            existentes = {coluna["name"] for coluna in inspetor.get_columns(tabela.name)}
+            
+            for coluna in tabela.columns:
+                if coluna.name in existentes:
+                    continue
+                
+                tipo = coluna.type.compile(dialect=bind.dialect)
+                conexao.execute(text(f"ALTER TABLE {tabela.name} ADD COLUMN {coluna.name} {tipo}"))
+
+                if coluna.default is not None and coluna.default.is_scalar:
+                    conexao.execute(
+                        text(f"UPDATE {tabela.name} SET {coluna.name} = :valor"),
+                        {"valor": coluna.default.arg}
+                    )
+            
+            for indice in tabela.indexes:
+                indice.create(conexao, checkfirst=True)
+
+
+def insert_com_conflito(bind, modelo):
+    if bind.dialect.name == "postgresql":
+        return postgresql.insert(modelo)
+    return sqlite.insert(modelo)
+
 
 def get_db():
     db = SessionLocal()
@@ -20,3 +131,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
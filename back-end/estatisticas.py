@@ -0,0 +1,178 @@
+import logging
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import String, cast, func, literal, select, union_all
+from facetas import FACETA_AREA, FACETA_CIDADE, FACETA_TECNOLOGIA
+from models import Profissional, IdiomaProfissional, ContagemFaceta
+from normalizacao import NIVEIS_IDIOMA, normalizar_habilidade
+from versionamento import EstadoVersao, versao_dados
+
+load_dotenv()
+
+ESTATISTICAS_TOP_TECNOLOGIAS = int(os.getenv("ESTATISTICAS_TOP_TECNOLOGIAS", "10"))
+ESTATISTICAS_INTERVALO = float(os.getenv("ESTATISTICAS_INTERVALO", "0"))
+
+FAIXAS_EXPERIENCIA = [(1, "0-1"), (4, "2-4"), (9, "5-9"), (14, "10-14"), (None, "15+")]
+
+NOMES_NIVEIS = {valor: nome for nome, valor in NIVEIS_IDIOMA.items()}
+
+logger_estatisticas = logging.getLogger("futuroconecta.estatisticas")
+
+
+def faixa_experiencia(anos: Optional[int]) -> str:
+    for maximo, rotulo in FAIXAS_EXPERIENCIA:
+        if maximo is None or (anos or 0) <= maximo:
+            return rotulo
+
+
+def consulta_estatisticas():
+    anos_experiencia = Profissional.anos_experiencia
+    
+    return union_all(
+        select(literal("total"), literal(""), literal(""), func.count()).select_from(Profissional),
+        select(literal("faceta"), ContagemFaceta.tipo, ContagemFaceta.valor, ContagemFaceta.quantidade),
+        select(
+            literal("idioma"),
+            IdiomaProfissional.idioma,
+            cast(IdiomaProfissional.nivel, String),
+            func.count()
+        ).group_by(IdiomaProfissional.idioma, IdiomaProfissional.nivel),
+        select(
+            literal("experiencia"),
+            cast(anos_experiencia, String),
+            literal(""),
+            func.count()
+        ).group_by(anos_experiencia)
+    )
+
+
+def agrupar_tecnologias(contagens: Dict[str, int]) -> List[Tuple[str, int]]:
+    grupos = {}
+    
+    for tecnologia, quantidade in contagens.items():
+        chave = normalizar_habilidade(tecnologia)
+        grafia, maior, total = grupos.get(chave, (tecnologia, 0, 0))
+        
+        if quantidade > maior:
+            grafia, maior = tecnologia, quantidade
+        
+        grupos[chave] = (grafia, maior, total + quantidade)
+    
+    return sorted(((grafia, total) for grafia, _, total in grupos.values()), key=lambda item: (-item[1], item[0]))
+
+
+def montar_estatisticas(linhas: Iterable[tuple], limite_tecnologias: int = ESTATISTICAS_TOP_TECNOLOGIAS) -> dict:
+    total = 0
+    facetas = {FACETA_AREA: {}, FACETA_CIDADE: {}, FACETA_TECNOLOGIA: {}}
+    idiomas = {}
+    faixas = {rotulo: 0 for _, rotulo in FAIXAS_EXPERIENCIA}
+    
+    for grupo, chave, detalhe, quantidade in linhas:
+        if grupo == "total":
+            total = quantidade
+        elif grupo == "faceta":
+            facetas.setdefault(chave, {})[detalhe] = quantidade
+        elif grupo == "idioma":
+            idioma = idiomas.setdefault(chave, {"total": 0, "niveis": {}})
+            idioma["total"] += quantidade
+            idioma["niveis"][NOMES_NIVEIS.get(int(detalhe), detalhe)] = quantidade
+        else:
+            faixas[faixa_experiencia(int(chave) if chave is not None else None)] += quantidade
+    
+    tecnologias = agrupar_tecnologias(facetas[FACETA_TECNOLOGIA])
+    
+    for idioma in idiomas.values():
+        idioma["niveis"] = {
+            nome: idioma["niveis"][nome]
+            for nome in sorted(idioma["niveis"], key=lambda nome: NIVEIS_IDIOMA.get(nome, 0))
+        }
+    
+    return {
+        "total_profissionais": total,
+        "total_areas": len(facetas[FACETA_AREA]),
+        "total_cidades": len(facetas[FACETA_CIDADE]),
+        "total_tecnologias": len(tecnologias),
+        "profissionais_por_area": dict(sorted(facetas[FACETA_AREA].items())),
+        "profissionais_por_cidade": dict(sorted(facetas[FACETA_CIDADE].items())),
+        "top_tecnologias": [
+            {"tecnologia": tecnologia, "quantidade": quantidade}
+            for tecnologia, quantidade in tecnologias[:limite_tecnologias]
+        ],
+        "idiomas": dict(sorted(idiomas.items(), key=lambda item: (-item[1]["total"], item[0]))),
+        "faixas_experiencia": faixas
+    }
+
+
+class InstantaneoEstatisticas:
+    def __init__(self, intervalo: float = ESTATISTICAS_INTERVALO):
+        self.intervalo = intervalo
+        self._dados: Optional[dict] = None
+        self._estado: Optional[EstadoVersao] = None
+        self._fabrica_sessao: Optional[Callable] = None
+        self._calcular: Optional[Callable] = None
+        self._trava = threading.Lock()
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ativo(self) -> bool:
+        return self.intervalo > 0 and self._calcular is not None
+
+    def atualizar(self) -> None:
+        estado = versao_dados.ler()
+        db = self._fabrica_sessao()
+        
+        try:
+            dados = self._calcular(db)
+        finally:
+            db.close()
+        
+        with self._trava:
+            self._dados, self._estado = dados, estado
+
+    def obter(self) -> Tuple[dict, EstadoVersao]:
+        if self._dados is None:
+            self.atualizar()
+        
+        with self._trava:
+            return self._dados, self._estado
+
+    def _executar(self) -> None:
+        while not self._parar.wait(self.intervalo):
+            try:
+                if self._estado == versao_dados.ler():
+                    continue
+                
+                self.atualizar()
+            except Exception:
+                logger_estatisticas.exception("Falha ao atualizar o instantaneo de estatisticas")
+
+    def iniciar(self, fabrica_sessao: Callable, calcular: Callable) -> None:
+        if self.intervalo <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        
+        self._fabrica_sessao = fabrica_sessao
+        self._calcular = calcular
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name="instantaneo-estatisticas", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        self._parar.set()
+        
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def estatisticas(self) -> dict:
+        return {
+            "ativo": self.ativo,
+            "intervalo_segundos": self.intervalo,
+            "versao": self._estado.versao if self._estado else None,
+            "versao_atual": versao_dados.ler().versao
+        }
+
+
+instantaneo_estatisticas = InstantaneoEstatisticas()
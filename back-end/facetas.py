@@ -0,0 +1,110 @@
+from collections import Counter
+from typing import Dict, List
+from sqlalchemy import select, delete, func
+from sqlalchemy.orm import Session
+from database import insert_com_conflito
+from models import Profissional, ContagemFaceta
+
+FACETA_AREA = "area"
+FACETA_CIDADE = "cidade"
+FACETA_TECNOLOGIA = "tecnologia"
+
+
+def extrair_facetas(area: str, localizacao: str, habilidades_tecnicas: List[str]) -> Counter:
+    facetas = Counter()
+    facetas[(FACETA_AREA, area)] += 1
+    facetas[(FACETA_CIDADE, localizacao)] += 1
+    
+    for tecnologia in set(habilidades_tecnicas):
+        facetas[(FACETA_TECNOLOGIA, tecnologia)] += 1
+    
+    return facetas
+
+
+def facetas_do_profissional(profissional: Profissional) -> Counter:
+    return extrair_facetas(profissional.area, profissional.localizacao, profissional.habilidades_tecnicas)
+
+
+def aplicar_delta_facetas(db: Session, antigas: Counter, novas: Counter) -> None:
+    delta = Counter(novas)
+    delta.subtract(antigas)
+    
+    linhas = [
+        {"tipo": tipo, "valor": valor, "quantidade": quantidade}
+        for (tipo, valor), quantidade in delta.items()
+        if quantidade != 0
+    ]
+    
+    if not linhas:
+        return
+    
+    comando = insert_com_conflito(db.bind, ContagemFaceta)
+    comando = comando.on_conflict_do_update(
+        index_elements=[ContagemFaceta.tipo, ContagemFaceta.valor],
+        set_={"quantidade": ContagemFaceta.quantidade + comando.excluded.quantidade}
+    )
+    db.execute(comando, linhas)
+    db.execute(delete(ContagemFaceta).where(ContagemFaceta.quantidade <= 0))
+
+
+def obter_valores_faceta(db: Session, tipo: str) -> List[str]:
+    consulta = (
+        select(ContagemFaceta.valor)
+        .where(ContagemFaceta.tipo == tipo)
+        .order_by(ContagemFaceta.valor)
+    )
+    return list(db.scalars(consulta))
+
+
+def obter_contagens_faceta(db: Session, tipo: str) -> Dict[str, int]:
+    consulta = (
+        select(ContagemFaceta.valor, ContagemFaceta.quantidade)
+        .where(ContagemFaceta.tipo == tipo)
+        .order_by(ContagemFaceta.valor)
+    )
+    return {valor: quantidade for valor, quantidade in db.execute(consulta)}
+
+
+def contar_valores_faceta(db: Session, tipo: str) -> int:
+    consulta = select(func.count()).select_from(ContagemFaceta).where(ContagemFaceta.tipo == tipo)
+    return db.scalar(consulta)
+
+
+def calcular_facetas(db: Session, tamanho_lote: int = 1000) -> Counter:
+    facetas = Counter()
+    consulta = select(
+        Profissional.area,
+        Profissional.localizacao,
+        Profissional.habilidades_tecnicas
+    ).execution_options(yield_per=tamanho_lote)
+    
+    for area, localizacao, habilidades in db.execute(consulta):
+        facetas.update(extrair_facetas(area, localizacao, habilidades))
+    
+    return facetas
+
+
+def reconstruir_facetas(db: Session) -> int:
+    facetas = calcular_facetas(db)
+    
+    db.execute(delete(ContagemFaceta))
+    aplicar_delta_facetas(db, Counter(), facetas)
+    db.commit()
+    
+    return len(facetas)
+
+
+def verificar_facetas(db: Session) -> Dict[tuple, tuple]:
+    esperadas = calcular_facetas(db)
+    armazenadas = Counter()
+    
+    for faceta in db.scalars(select(ContagemFaceta)):
+        armazenadas[(faceta.tipo, faceta.valor)] = faceta.quantidade
+    
+    divergencias = {}
+    
+    for chave in set(esperadas) | set(armazenadas):
+        if esperadas[chave] != armazenadas[chave]:
+            divergencias[chave] = (armazenadas[chave], esperadas[chave])
+    
+    return divergencias
@@ -0,0 +1,236 @@
+import logging
+import os
+import threading
+from datetime import timedelta
+from typing import Callable, List, Optional
+from dotenv import load_dotenv
+from sqlalchemy import and_, bindparam, delete, func, select, update
+from sqlalchemy.orm import Session
+from database import SessionLocal, insert_com_conflito
+from metricas import registro_metricas
+from models import TarefaDerivada
+from versionamento import agora_utc
+
+load_dotenv()
+
+FILA_DERIVADOS = os.getenv("FILA_DERIVADOS", "false").lower() in ("1", "true", "sim")
+FILA_INTERVALO = float(os.getenv("FILA_INTERVALO", "1.0"))
+FILA_TAMANHO_LOTE = int(os.getenv("FILA_TAMANHO_LOTE", "200"))
+FILA_MAX_TENTATIVAS = int(os.getenv("FILA_MAX_TENTATIVAS", "5"))
+FILA_ESPERA_BASE = float(os.getenv("FILA_ESPERA_BASE", "2.0"))
+FILA_ESPERA_MAXIMA = 300.0
+
+logger_fila = logging.getLogger("futuroconecta.fila")
+
+
+def espera_nova_tentativa(tentativas: int, base: float = FILA_ESPERA_BASE) -> float:
+    return min(FILA_ESPERA_MAXIMA, base * 2 ** (tentativas - 1))
+
+
+class FilaDerivados:
+    def __init__(
+        self,
+        ativa: bool = FILA_DERIVADOS,
+        intervalo: float = FILA_INTERVALO,
+        tamanho_lote: int = FILA_TAMANHO_LOTE,
+        max_tentativas: int = FILA_MAX_TENTATIVAS,
+        fabrica_sessao: Callable = SessionLocal
+    ):
+        self.ativa = ativa
+        self.intervalo = intervalo
+        self.tamanho_lote = tamanho_lote
+        self.max_tentativas = max_tentativas
+        self.profundidade = 0
+        self.falhas = 0
+        self.atraso_segundos = 0.0
+        self._fabrica_sessao = fabrica_sessao
+        self._processar: Optional[Callable[[Session, List[int]], None]] = None
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def enfileirar(self, db: Session, profissionais_ids: List[int]) -> None:
+        if not profissionais_ids:
+            return
+        
+        agora = agora_utc()
+        comando = insert_com_conflito(db.bind, TarefaDerivada)
+        comando = comando.on_conflict_do_update(
+            index_elements=[TarefaDerivada.profissional_id],
+            set_={
+                "sequencia": TarefaDerivada.sequencia + 1,
+                "eventos": TarefaDerivada.eventos + 1,
+                "tentativas": 0,
+                "disponivel_em": comando.excluded.disponivel_em,
+                "ultimo_erro": None
+            }
+        )
+        db.execute(comando, [
+            {"profissional_id": profissional_id, "criado_em": agora, "disponivel_em": agora}
+            for profissional_id in sorted(set(profissionais_ids))
+        ])
+
+    def notificar(self) -> None:
+        if self.ativa:
+            self._acordar.set()
+
+    def _pendentes(self, db: Session) -> List[tuple]:
+        consulta = (
+            select(TarefaDerivada.profissional_id, TarefaDerivada.sequencia, TarefaDerivada.eventos, TarefaDerivada.tentativas)
+            .where(
+                TarefaDerivada.disponivel_em <= agora_utc(),
+                TarefaDerivada.tentativas < self.max_tentativas
+            )
+            .order_by(TarefaDerivada.disponivel_em, TarefaDerivada.profissional_id)
+            .limit(self.tamanho_lote)
+        )
+        return db.execute(consulta).all()
+
+    def _concluir(self, db: Session, tarefas: List[tuple]) -> None:
+        self._processar(db, [tarefa.profissional_id for tarefa in tarefas])
+        tabela = TarefaDerivada.__table__
+        db.execute(
+            delete(tabela).where(and_(
+                tabela.c.profissional_id == bindparam("id_tarefa"),
+                tabela.c.sequencia == bindparam("sequencia_tarefa")
+            )),
+            [{"id_tarefa": tarefa.profissional_id, "sequencia_tarefa": tarefa.sequencia} for tarefa in tarefas]
+        )
+        db.commit()
+        registro_metricas.incrementar("fila_tarefas_processadas_total", len(tarefas))
+        registro_metricas.incrementar("fila_eventos_processados_total", sum(tarefa.eventos for tarefa in tarefas))
+
+    def _adiar(self, db: Session, tarefa: tuple, erro: Exception) -> None:
+        tentativas = tarefa.tentativas + 1
+        db.execute(
+            update(TarefaDerivada)
+            .where(
+                TarefaDerivada.profissional_id == tarefa.profissional_id,
+                TarefaDerivada.sequencia == tarefa.sequencia
+            )
+            .values(
+                tentativas=tentativas,
+                disponivel_em=agora_utc() + timedelta(seconds=espera_nova_tentativa(tentativas)),
+                ultimo_erro=f"{type(erro).__name__}: {erro}"[:500]
+            )
+        )
+        db.commit()
+        registro_metricas.incrementar("fila_tarefas_com_erro_total")
+        
+        if tentativas >= self.max_tentativas:
+            logger_fila.error("Tarefa do perfil %s desistida apos %s tentativas: %s", tarefa.profissional_id, tentativas, erro)
+        else:
+            logger_fila.warning("Tarefa do perfil %s falhou (tentativa %s): %s", tarefa.profissional_id, tentativas, erro)
+
+    def processar_pendentes(self) -> int:
+        db = self._fabrica_sessao()
+        
+        try:
+            tarefas = self._pendentes(db)
+            
+            if not tarefas:
+                return 0
+            
+            try:
+                self._concluir(db, tarefas)
+                return len(tarefas)
+            except Exception:
+                db.rollback()
+            
+            for tarefa in tarefas:
+                try:
+                    self._concluir(db, [tarefa])
+                except Exception as e:
+                    db.rollback()
+                    self._adiar(db, tarefa, e)
+            
+            return len(tarefas)
+        finally:
+            db.close()
+
+    def atualizar_situacao(self) -> None:
+        db = self._fabrica_sessao()
+        
+        try:
+            pendentes = TarefaDerivada.tentativas < self.max_tentativas
+            profundidade, mais_antiga = db.execute(
+                select(func.count(), func.min(TarefaDerivada.criado_em)).where(pendentes)
+            ).one()
+            falhas = db.scalar(select(func.count()).select_from(TarefaDerivada).where(~pendentes))
+        finally:
+            db.close()
+        
+        self.profundidade = profundidade
+        self.falhas = falhas
+        self.atraso_segundos = (agora_utc() - mais_antiga).total_seconds() if mais_antiga else 0.0
+
+    def drenar(self) -> int:
+        total = 0
+        
+        while True:
+            processadas = self.processar_pendentes()
+            total += processadas
+            
+            if not processadas:
+                break
+        
+        self.atualizar_situacao()
+        return total
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            try:
+                processadas = self.processar_pendentes()
+                self.atualizar_situacao()
+            except Exception:
+                logger_fila.exception("Falha ao processar a fila de dados derivados")
+                processadas = 0
+            
+            if not processadas:
+                self._acordar.wait(self.intervalo)
+                self._acordar.clear()
+
+    def iniciar(self, fabrica_sessao: Callable, processar: Callable[[Session, List[int]], None]) -> None:
+        self._fabrica_sessao = fabrica_sessao
+        self._processar = processar
+        
+        if not self.ativa:
+            self.drenar()
+            return
+        
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name="fila-derivados", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        self._parar.set()
+        self._acordar.set()
+        
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def estatisticas(self) -> dict:
+        self.atualizar_situacao()
+        
+        return {
+            "ativa": self.ativa,
+            "profundidade": self.profundidade,
+            "atraso_segundos": round(self.atraso_segundos, 3),
+            "falhas": self.falhas,
+            "max_tentativas": self.max_tentativas,
+            "tamanho_lote": self.tamanho_lote
+        }
+
+
+fila_derivados = FilaDerivados()
+
+registro_metricas.contador("fila_tarefas_processadas_total", "Perfis com dados derivados atualizados pela fila")
+registro_metricas.contador("fila_eventos_processados_total", "Eventos de alteracao aplicados (inclui os agrupados)")
+registro_metricas.contador("fila_tarefas_com_erro_total", "Tentativas da fila que falharam")
+registro_metricas.medidor("fila_profundidade", "Perfis aguardando atualizacao de dados derivados", lambda: fila_derivados.profundidade)
+registro_metricas.medidor("fila_atraso_segundos", "Idade do evento pendente mais antigo", lambda: fila_derivados.atraso_segundos)
+registro_metricas.medidor("fila_falhas", "Tarefas que esgotaram as tentativas", lambda: fila_derivados.falhas)
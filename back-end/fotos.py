@@ -0,0 +1,500 @@
+import hashlib
+import http.client
+import ipaddress
+import logging
+import os
+import re
+import socket
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+from dotenv import load_dotenv
+from PIL import Image, ImageOps
+from metricas import registro_metricas
+
+load_dotenv()
+
+FOTOS_DIRETORIO = os.getenv("FOTOS_DIRETORIO", "./cache_fotos")
+FOTOS_CACHE_MAX_MB = float(os.getenv("FOTOS_CACHE_MAX_MB", "256"))
+FOTOS_TAMANHOS = tuple(sorted(int(tamanho) for tamanho in os.getenv("FOTOS_TAMANHOS", "96,256,512").split(",")))
+FOTOS_TAMANHO_PADRAO = int(os.getenv("FOTOS_TAMANHO_PADRAO", "256"))
+FOTOS_TRABALHADORES = int(os.getenv("FOTOS_TRABALHADORES", str(min(4, os.cpu_count() or 1))))
+FOTOS_TIMEOUT = float(os.getenv("FOTOS_TIMEOUT", "10"))
+FOTOS_MAX_MB_ORIGEM = float(os.getenv("FOTOS_MAX_MB_ORIGEM", "10"))
+FOTOS_HOSTS_PERMITIDOS = {
+    host.strip().lower()
+    for host in os.getenv("FOTOS_HOSTS_PERMITIDOS", "").split(",")
+    if host.strip()
+}
+FOTOS_MAX_REDIRECIONAMENTOS = int(os.getenv("FOTOS_MAX_REDIRECIONAMENTOS", "3"))
+FOTOS_ORIGEM_LOCAL = os.getenv("FOTOS_ORIGEM_LOCAL")
+FOTOS_CARENCIA_ENVIADAS = float(os.getenv("FOTOS_CARENCIA_ENVIADAS", "60"))
+FOTOS_MAX_AGE = int(os.getenv("FOTOS_MAX_AGE", "86400"))
+
+FOTOS_QUALIDADE_JPEG = 85
+CACHE_CONTROL_IMUTAVEL = "public, max-age=31536000, immutable"
+
+PREFIXO_ENVIADA = "upload:"
+PADRAO_HASH = re.compile(r"[0-9a-f]{64}")
+
+ASSINATURAS_IMAGEM = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif")
+)
+
+logger_fotos = logging.getLogger("futuroconecta.fotos")
+
+
+class FotoIndisponivel(Exception):
+    pass
+
+
+def tipo_da_imagem(inicio: bytes) -> Optional[str]:
+    for assinatura, tipo in ASSINATURAS_IMAGEM:
+        if inicio.startswith(assinatura):
+            return tipo
+    
+    if inicio[:4] == b"RIFF" and inicio[8:12] == b"WEBP":
+        return "image/webp"
+    
+    return None
+
+
+def resumo_conteudo(conteudo: bytes) -> str:
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def cache_control_foto(imutavel: bool) -> str:
+    return CACHE_CONTROL_IMUTAVEL if imutavel else f"public, max-age={FOTOS_MAX_AGE}"
+
+
+def gerar_miniatura(conteudo: bytes, tamanho: int) -> bytes:
+    imagem = Image.open(BytesIO(conteudo))
+    imagem.draft("RGB", (tamanho, tamanho))
+    imagem = ImageOps.exif_transpose(imagem)
+    imagem.thumbnail((tamanho, tamanho), Image.Resampling.LANCZOS)
+    saida = BytesIO()
+    
+    if imagem.mode in ("RGBA", "LA", "PA") or "transparency" in imagem.info:
+        imagem.convert("RGBA").save(saida, format="PNG", optimize=True)
+    else:
+        imagem.convert("RGB").save(saida, format="JPEG", quality=FOTOS_QUALIDADE_JPEG, optimize=True, progressive=True)
+    
+    return saida.getvalue()
+
+
+def endereco_publico(endereco: str) -> bool:
+    ip = ipaddress.ip_address(endereco.split("%", 1)[0])
+    
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    
+    return ip.is_global and not ip.is_multicast
+
+
+class ConexaoPublica(http.client.HTTPConnection):
+    def connect(self):
+        for *_, endereco in socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM):
+            if not endereco_publico(endereco[0]):
+                raise FotoIndisponivel(f"Host de foto em rede interna: {self.host} ({endereco[0]})")
+        
+        super().connect()
+        endereco = self.sock.getpeername()[0]
+        
+        if not endereco_publico(endereco):
+            self.sock.close()
+            self.sock = None
+            raise FotoIndisponivel(f"Host de foto em rede interna: {self.host} ({endereco})")
+
+
+class ConexaoPublicaHttps(http.client.HTTPSConnection, ConexaoPublica):
+    pass
+
+
+class ManipuladorHttp(urllib.request.HTTPHandler):
+    def http_open(self, requisicao):
+        return self.do_open(ConexaoPublica, requisicao)
+
+
+class ManipuladorHttps(urllib.request.HTTPSHandler):
+    def https_open(self, requisicao):
+        return self.do_open(ConexaoPublicaHttps, requisicao, context=self._context)
+
+
+class ManipuladorRedirecionamento(urllib.request.HTTPRedirectHandler):
+    max_redirections = FOTOS_MAX_REDIRECIONAMENTOS
+
+    def __init__(self, verificar_url):
+        self.verificar_url = verificar_url
+
+    def redirect_request(self, requisicao, resposta, codigo, mensagem, cabecalhos, nova_url):
+        self.verificar_url(nova_url)
+        return super().redirect_request(requisicao, resposta, codigo, mensagem, cabecalhos, nova_url)
+
+
+class BuscadorHttp:
+    def __init__(
+        self,
+        timeout: float = FOTOS_TIMEOUT,
+        max_bytes: int = int(FOTOS_MAX_MB_ORIGEM * 1024 * 1024),
+        hosts_permitidos: set = FOTOS_HOSTS_PERMITIDOS
+    ):
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.hosts_permitidos = hosts_permitidos
+        self.abridor = urllib.request.OpenerDirector()
+        
+        for manipulador in (
+            ManipuladorHttp(),
+            ManipuladorHttps(),
+            ManipuladorRedirecionamento(self.verificar_url),
+            urllib.request.HTTPDefaultErrorHandler(),
+            urllib.request.HTTPErrorProcessor()
+        ):
+            self.abridor.add_handler(manipulador)
+
+    def verificar_url(self, url: str) -> None:
+        partes = urlsplit(url)
+        
+        if partes.scheme not in ("http", "https") or not partes.hostname:
+            raise FotoIndisponivel(f"URL de foto não suportada: {url}")
+        
+        if self.hosts_permitidos and partes.hostname.lower() not in self.hosts_permitidos:
+            raise FotoIndisponivel(f"Host de foto não permitido: {partes.hostname}")
+
+    def buscar(self, url: str) -> bytes:
+        self.verificar_url(url)
+        requisicao = urllib.request.Request(url, headers={"User-Agent": "FuturoConecta/1.0"})
+        
+        try:
+            with self.abridor.open(requisicao, timeout=self.timeout) as resposta:
+                conteudo = resposta.read(self.max_bytes + 1)
+        except (OSError, ValueError) as e:
+            raise FotoIndisponivel(f"Falha ao buscar a foto {url}: {e}")
+        
+        if len(conteudo) > self.max_bytes:
+            raise FotoIndisponivel(f"Foto {url} maior que {FOTOS_MAX_MB_ORIGEM:g} MB")
+        
+        return conteudo
+
+
+class BuscadorArquivos:
+    def __init__(self, diretorio: str):
+        self.diretorio = Path(diretorio).resolve()
+
+    def buscar(self, url: str) -> bytes:
+        partes = urlsplit(url)
+        caminho = (self.diretorio / (partes.hostname or "") / unquote(partes.path).lstrip("/")).resolve()
+        
+        if not caminho.is_relative_to(self.diretorio) or not caminho.is_file():
+            raise FotoIndisponivel(f"Foto não encontrada: {url}")
+        
+        return caminho.read_bytes()
+
+
+def criar_buscador():
+    if FOTOS_ORIGEM_LOCAL:
+        return BuscadorArquivos(FOTOS_ORIGEM_LOCAL)
+    
+    return BuscadorHttp()
+
+
+class CacheFotos:
+    def __init__(
+        self,
+        diretorio: str = FOTOS_DIRETORIO,
+        max_bytes: int = int(FOTOS_CACHE_MAX_MB * 1024 * 1024),
+        trabalhadores: int = FOTOS_TRABALHADORES,
+        buscador=None
+    ):
+        self.diretorio = Path(diretorio)
+        self.max_bytes = max_bytes
+        self.trabalhadores = trabalhadores
+        self.buscador = buscador or criar_buscador()
+        self.bytes_em_cache = 0
+        self._arquivos: "OrderedDict[Path, int]" = OrderedDict()
+        self._conteudos: Dict[str, str] = {}
+        self._pendentes: Dict[Tuple[str, int], Future] = {}
+        self._trava = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _caminho(self, pasta: str, nome: str) -> Path:
+        return self.diretorio / pasta / nome[:2] / nome
+
+    def _registrar(self, caminho: Path, tamanho: int) -> None:
+        with self._trava:
+            self.bytes_em_cache += tamanho - self._arquivos.pop(caminho, 0)
+            self._arquivos[caminho] = tamanho
+            
+            while self.bytes_em_cache > self.max_bytes and len(self._arquivos) > 1:
+                antigo, tamanho_antigo = self._arquivos.popitem(last=False)
+                self.bytes_em_cache -= tamanho_antigo
+                antigo.unlink(missing_ok=True)
+                registro_metricas.incrementar("fotos_remocoes_total")
+                
+                if antigo.parent.parent.name == "urls":
+                    self._conteudos.pop(antigo.name, None)
+
+    def _tocar(self, caminho: Path) -> None:
+        with self._trava:
+            if caminho in self._arquivos:
+                self._arquivos.move_to_end(caminho)
+
+    def _gravar(self, caminho: Path, conteudo: bytes, descartavel: bool = True) -> None:
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        temporario = caminho.with_name(f"{caminho.name}.{threading.get_ident()}.tmp")
+        temporario.write_bytes(conteudo)
+        os.replace(temporario, caminho)
+        
+        if descartavel:
+            self._registrar(caminho, len(conteudo))
+
+    def _ler(self, caminho: Path) -> Optional[bytes]:
+        try:
+            conteudo = caminho.read_bytes()
+        except FileNotFoundError:
+            return None
+        
+        self._tocar(caminho)
+        return conteudo
+
+    def carregar(self) -> None:
+        encontrados = []
+        
+        for pasta in ("originais", "miniaturas", "urls"):
+            for caminho in (self.diretorio / pasta).glob("*/*"):
+                if caminho.suffix == ".tmp":
+                    caminho.unlink(missing_ok=True)
+                    continue
+                
+                situacao = caminho.stat()
+                encontrados.append((situacao.st_mtime, caminho, situacao.st_size))
+        
+        with self._trava:
+            self._arquivos.clear()
+            self.bytes_em_cache = 0
+        
+        for _, caminho, tamanho in sorted(encontrados, key=lambda item: item[0]):
+            self._registrar(caminho, tamanho)
+
+    def iniciar(self) -> None:
+        if self._executor is not None:
+            return
+        
+        self.carregar()
+        self._executor = ThreadPoolExecutor(max_workers=self.trabalhadores, thread_name_prefix="fotos")
+
+    def parar(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def guardar_enviada(self, conteudo: bytes) -> str:
+        if tipo_da_imagem(conteudo[:12]) is None:
+            raise ValueError("A foto deve ser uma imagem JPEG, PNG, GIF ou WebP")
+        
+        try:
+            Image.open(BytesIO(conteudo)).verify()
+        except Exception as e:
+            raise ValueError(f"Imagem inválida: {e}")
+        
+        resumo = resumo_conteudo(conteudo)
+        caminho = self._caminho("enviadas", resumo)
+        
+        try:
+            os.utime(caminho)
+        except FileNotFoundError:
+            self._gravar(caminho, conteudo, descartavel=False)
+        
+        return PREFIXO_ENVIADA + resumo
+
+    def _apagar_enviada(self, caminho: Path, carencia: float) -> int:
+        try:
+            situacao = caminho.stat()
+        except FileNotFoundError:
+            return 0
+        
+        if time.time() - situacao.st_mtime < carencia:
+            return 0
+        
+        caminho.unlink(missing_ok=True)
+        registro_metricas.incrementar("fotos_enviadas_removidas_total")
+        return situacao.st_size
+
+    def descartar_enviadas(self, fotos: Iterable[str], carencia: float = FOTOS_CARENCIA_ENVIADAS) -> int:
+        liberados = 0
+        
+        for foto in fotos:
+            resumo = self._resumo_conhecido(foto) if foto and foto.startswith(PREFIXO_ENVIADA) else None
+            
+            if resumo is not None:
+                liberados += self._apagar_enviada(self._caminho("enviadas", resumo), carencia)
+        
+        return liberados
+
+    def coletar_enviadas(self, referenciadas: Set[str], carencia: float = FOTOS_CARENCIA_ENVIADAS) -> Tuple[int, int]:
+        removidas = 0
+        liberados = 0
+        
+        for caminho in (self.diretorio / "enviadas").glob("*/*"):
+            if PREFIXO_ENVIADA + caminho.name in referenciadas:
+                continue
+            
+            tamanho = self._apagar_enviada(caminho, 0 if caminho.suffix == ".tmp" else carencia)
+            
+            if tamanho:
+                removidas += 1
+                liberados += tamanho
+        
+        return removidas, liberados
+
+    def _resumo_conhecido(self, foto: str) -> Optional[str]:
+        if foto.startswith(PREFIXO_ENVIADA):
+            resumo = foto[len(PREFIXO_ENVIADA):]
+            return resumo if PADRAO_HASH.fullmatch(resumo) else None
+        
+        chave = resumo_conteudo(foto.encode())
+        caminho = self._caminho("urls", chave)
+        resumo = self._conteudos.get(chave)
+        
+        if resumo is not None:
+            self._tocar(caminho)
+            return resumo
+        
+        conteudo = self._ler(caminho)
+        
+        if conteudo is None:
+            return None
+        
+        resumo = conteudo.decode().strip()
+        self._conteudos[chave] = resumo
+        return resumo
+
+    def _original(self, foto: str) -> Tuple[str, bytes]:
+        resumo = self._resumo_conhecido(foto)
+        
+        if foto.startswith(PREFIXO_ENVIADA):
+            conteudo = self._ler(self._caminho("enviadas", resumo)) if resumo else None
+            
+            if conteudo is None:
+                raise FotoIndisponivel("Foto enviada não encontrada")
+            
+            return resumo, conteudo
+        
+        if resumo is not None:
+            conteudo = self._ler(self._caminho("originais", resumo))
+            
+            if conteudo is not None:
+                return resumo, conteudo
+        
+        try:
+            conteudo = self.buscador.buscar(foto)
+        except FotoIndisponivel:
+            registro_metricas.incrementar("fotos_falhas_origem_total")
+            raise
+        
+        registro_metricas.incrementar("fotos_buscas_origem_total")
+        
+        if tipo_da_imagem(conteudo[:12]) is None:
+            registro_metricas.incrementar("fotos_falhas_origem_total")
+            raise FotoIndisponivel(f"A URL {foto} não retornou uma imagem")
+        
+        resumo = resumo_conteudo(conteudo)
+        chave = resumo_conteudo(foto.encode())
+        self._gravar(self._caminho("originais", resumo), conteudo)
+        self._gravar(self._caminho("urls", chave), resumo.encode())
+        self._conteudos[chave] = resumo
+        
+        return resumo, conteudo
+
+    def _produzir(self, foto: str, tamanho: int) -> Tuple[bytes, str]:
+        resumo, original = self._original(foto)
+        nome = f"{resumo}-{tamanho}"
+        caminho = self._caminho("miniaturas", nome)
+        miniatura = self._ler(caminho)
+        
+        if miniatura is None:
+            try:
+                miniatura = gerar_miniatura(original, tamanho)
+            except Exception as e:
+                logger_fotos.warning("Falha ao redimensionar a foto %s: %s", foto, e)
+                raise FotoIndisponivel(f"Não foi possível processar a foto: {e}")
+            
+            self._gravar(caminho, miniatura)
+            registro_metricas.incrementar("fotos_miniaturas_geradas_total")
+        
+        return miniatura, nome
+
+    def _agendar(self, foto: str, tamanho: int) -> Future:
+        chave = (foto, tamanho)
+        
+        with self._trava:
+            pendente = self._pendentes.get(chave)
+            
+            if pendente is not None:
+                return pendente
+            
+            pendente = self._executor.submit(self._produzir, foto, tamanho)
+            self._pendentes[chave] = pendente
+        
+        pendente.add_done_callback(lambda _: self._liberar(chave))
+        return pendente
+
+    def _liberar(self, chave: Tuple[str, int]) -> None:
+        with self._trava:
+            self._pendentes.pop(chave, None)
+
+    def obter(self, foto: str, tamanho: int) -> Tuple[bytes, str, str]:
+        if self._executor is None:
+            self.iniciar()
+        
+        resumo = self._resumo_conhecido(foto)
+        
+        if resumo is not None:
+            nome = f"{resumo}-{tamanho}"
+            conteudo = self._ler(self._caminho("miniaturas", nome))
+            
+            if conteudo is not None:
+                registro_metricas.incrementar("fotos_acertos_total")
+                return conteudo, tipo_da_imagem(conteudo[:12]), nome
+        
+        try:
+            conteudo, nome = self._agendar(foto, tamanho).result(timeout=FOTOS_TIMEOUT * 2)
+        except TimeoutError:
+            raise FotoIndisponivel("Tempo esgotado ao processar a foto")
+        
+        return conteudo, tipo_da_imagem(conteudo[:12]), nome
+
+    def estatisticas(self) -> dict:
+        with self._trava:
+            arquivos = len(self._arquivos)
+            pendentes = len(self._pendentes)
+        
+        return {
+            "diretorio": str(self.diretorio),
+            "tamanhos": list(FOTOS_TAMANHOS),
+            "arquivos": arquivos,
+            "bytes": self.bytes_em_cache,
+            "max_bytes": self.max_bytes,
+            "pendentes": pendentes,
+            "trabalhadores": self.trabalhadores
+        }
+
+
+cache_fotos = CacheFotos()
+
+registro_metricas.contador("fotos_acertos_total", "Fotos servidas direto do cache em disco")
+registro_metricas.contador("fotos_miniaturas_geradas_total", "Miniaturas geradas pelo pool de fotos")
+registro_metricas.contador("fotos_buscas_origem_total", "Fotos baixadas da URL de origem")
+registro_metricas.contador("fotos_falhas_origem_total", "Falhas ao baixar ou ler a foto de origem")
+registro_metricas.contador("fotos_remocoes_total", "Arquivos removidos do cache de fotos por falta de espaco")
+registro_metricas.contador("fotos_enviadas_removidas_total", "Fotos enviadas apagadas por nao serem usadas por nenhum perfil")
+registro_metricas.medidor("fotos_cache_bytes", "Bytes ocupados pelo cache de fotos em disco", lambda: cache_fotos.bytes_em_cache)
@@ -0,0 +1,307 @@
+import argparse
+import itertools
+import random
+import time
+from typing import Iterator, List, Optional
+import orjson
+
+SEMENTE_PADRAO = 42
+ANO_REFERENCIA = 2025
+
+AREAS = {
+    "Desenvolvimento": {
+        "peso": 30,
+        "cargos": [
+            "Desenvolvedor Back-End", "Desenvolvedor Full Stack", "Desenvolvedor Front-End",
+            "Desenvolvedor Mobile", "DevOps Engineer", "Engenheiro de Software Sênior", "Arquiteto de Software"
+        ],
+        "habilidades": [
+            "JavaScript", "Python", "Git", "React", "SQL", "Docker", "Node.js", "Java", "TypeScript",
+            "PostgreSQL", "AWS", "REST API", "CI/CD", "Kubernetes", "MongoDB", "Spring Boot", "Angular",
+            "Vue.js", "C#", ".NET", "Redis", "Microservices", "Azure", "GCP", "Go", "Kotlin", "Flutter",
+            "RabbitMQ", "Terraform", "GraphQL", "Django", "FastAPI", "PHP", "Swift", "Rust", "Kafka"
+        ],
+        "certificacoes": [
+            "AWS Certified Developer", "Certified Kubernetes Administrator", "Oracle Certified Java Programmer",
+            "Microsoft Azure Fundamentals", "Google Cloud Associate Engineer"
+        ],
+        "cursos": ["Ciência da Computação", "Engenharia de Software", "Sistemas de Informação", "Análise e Desenvolvimento de Sistemas"]
+    },
+    "Dados": {
+        "peso": 18,
+        "cargos": [
+            "Analista de Dados", "Cientista de Dados", "Engenheiro de Dados",
+            "Analista de Business Intelligence", "Engenheiro de Machine Learning"
+        ],
+        "habilidades": [
+            "SQL", "Python", "Power BI", "Pandas", "Excel", "Tableau", "NumPy", "Scikit-learn", "Apache Spark",
+            "R", "TensorFlow", "AWS", "PyTorch", "Airflow", "Databricks", "Keras", "Hadoop", "MLflow",
+            "Looker", "dbt", "Azure ML", "BigQuery", "Estatística", "Snowflake"
+        ],
+        "certificacoes": [
+            "Google Data Analytics", "Microsoft Power BI Data Analyst", "Databricks Data Engineer",
+            "TensorFlow Developer Certificate", "AWS Certified Data Analytics"
+        ],
+        "cursos": ["Estatística", "Ciência da Computação", "Matemática Aplicada", "Engenharia de Produção"]
+    },
+    "Design": {
+        "peso": 14,
+        "cargos": ["UI Designer", "Product Designer", "Designer de Experiência", "Designer Gráfico", "Motion Designer", "Visual Designer"],
+        "habilidades": [
+            "Figma", "Photoshop", "Illustrator", "Prototyping", "User Research", "Adobe XD", "Wireframing",
+            "Design System", "Sketch", "After Effects", "InDesign", "HTML", "CSS", "Blender", "Premiere"
+        ],
+        "certificacoes": ["Nielsen Norman Group UX", "Design Thinking Certificate", "Google UX Design", "Adobe Certified Professional"],
+        "cursos": ["Design Gráfico", "Publicidade e Propaganda", "Design Digital", "Arquitetura e Urbanismo"]
+    },
+    "Marketing": {
+        "peso": 16,
+        "cargos": ["Analista de Marketing", "Gerente de Marketing Digital", "Social Media Manager", "Content Manager", "Brand Manager"],
+        "habilidades": [
+            "Google Analytics", "SEO", "Copywriting", "Google Ads", "Facebook Ads", "Content Marketing",
+            "Email Marketing", "CRM", "Instagram Marketing", "SEM", "Marketing Automation", "HubSpot",
+            "RD Station", "Excel", "Canva"
+        ],
+        "certificacoes": ["Google Ads Certification", "HubSpot Inbound Marketing", "Meta Certified Digital Marketing Associate"],
+        "cursos": ["Marketing", "Publicidade e Propaganda", "Administração", "Comunicação Social"]
+    },
+    "Saúde": {
+        "peso": 12,
+        "cargos": ["Enfermeiro Coordenador", "Farmacêutico Clínico", "Médico Especialista", "Psicólogo Clínico", "Terapeuta Ocupacional"],
+        "habilidades": [
+            "Prontuário Eletrônico", "Protocolos Clínicos", "Gestão de Saúde", "Excel", "Telemedicina",
+            "Farmacologia", "Sistemas Hospitalares", "Anatomia", "Power BI", "Primeiros Socorros"
+        ],
+        "certificacoes": ["ACLS", "BLS", "Especialização em Saúde Pública", "Certificação em Telessaúde"],
+        "cursos": ["Enfermagem", "Medicina", "Farmácia", "Psicologia", "Terapia Ocupacional"]
+    },
+    "Educação": {
+        "peso": 10,
+        "cargos": ["Professor Universitário", "Coordenador Pedagógico", "Especialista em EAD", "Gestor Educacional", "Designer Instrucional"],
+        "habilidades": [
+            "Moodle", "Google Classroom", "Metodologias Ativas", "Power Point", "LMS", "Canvas",
+            "Design Thinking", "Camtasia", "Articulate Storyline", "EdTech Tools", "Excel"
+        ],
+        "certificacoes": ["Google Certified Educator", "Especialização em Docência", "Certificação em EAD"],
+        "cursos": ["Pedagogia", "Licenciatura em Letras", "Licenciatura em Matemática", "Licenciatura em Computação"]
+    }
+}
+
+CIDADES = [
+    ("São Paulo/SP", 22), ("Rio de Janeiro/RJ", 11), ("Belo Horizonte/MG", 6), ("Brasília/DF", 6),
+    ("Curitiba/PR", 5), ("Porto Alegre/RS", 5), ("Recife/PE", 4), ("Salvador/BA", 4), ("Fortaleza/CE", 4),
+    ("Campinas/SP", 4), ("Florianópolis/SC", 3), ("Goiânia/GO", 3), ("Manaus/AM", 2), ("Belém/PA", 2),
+    ("Vitória/ES", 2), ("Santos/SP", 2), ("Ribeirão Preto/SP", 2), ("Natal/RN", 1.5), ("João Pessoa/PB", 1.5),
+    ("Aracaju/SE", 1), ("Maceió/AL", 1), ("São Luís/MA", 1), ("Teresina/PI", 1), ("Cuiabá/MT", 1),
+    ("Campo Grande/MS", 1), ("Londrina/PR", 1), ("Joinville/SC", 1), ("Uberlândia/MG", 1)
+]
+
+IDIOMAS = [
+    ("Inglês", 0.7, [("Básico", 25), ("Intermediário", 35), ("Avançado", 25), ("Fluente", 15)]),
+    ("Espanhol", 0.35, [("Básico", 45), ("Intermediário", 35), ("Avançado", 12), ("Fluente", 8)]),
+    ("Francês", 0.08, [("Básico", 50), ("Intermediário", 30), ("Avançado", 12), ("Fluente", 8)]),
+    ("Alemão", 0.05, [("Básico", 55), ("Intermediário", 28), ("Avançado", 10), ("Fluente", 7)]),
+    ("Italiano", 0.04, [("Básico", 55), ("Intermediário", 30), ("Avançado", 10), ("Fluente", 5)]),
+    ("Mandarim", 0.02, [("Básico", 70), ("Intermediário", 20), ("Avançado", 7), ("Fluente", 3)])
+]
+
+NOMES = [
+    "Ana", "Amanda", "André", "Beatriz", "Bernardo", "Bruno", "Camila", "Carla", "Carlos", "Daniel",
+    "Daniela", "Diego", "Eduarda", "Eduardo", "Elisa", "Fabio", "Felipe", "Fernanda", "Gabriel", "Gabriela",
+    "Giovana", "Guilherme", "Helena", "Henrique", "Hugo", "Igor", "Ingrid", "Isabela", "João", "Juliana",
+    "Julio", "Karina", "Kevin", "Larissa", "Laura", "Lucas", "Luiza", "Marcelo", "Maria", "Mariana",
+    "Matheus", "Natália", "Nicolas", "Nina", "Olivia", "Otávio", "Patricia", "Paula", "Pedro", "Rafael",
+    "Rafaela", "Ricardo", "Rodrigo", "Sabrina", "Sofia", "Thiago", "Vanessa", "Vitória", "Wagner", "Yasmin"
+]
+
+SOBRENOMES = [
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima", "Gomes",
+    "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa",
+    "Rocha", "Dias", "Nascimento", "Andrade", "Moreira", "Nunes", "Marques", "Machado", "Mendes", "Freitas",
+    "Cardoso", "Ramos", "Gonçalves", "Santana", "Teixeira", "Araújo", "Pinto", "Correia", "Castro", "Moura"
+]
+
+SOFT_SKILLS = [
+    "Comunicação", "Trabalho em equipe", "Proatividade", "Resolução de problemas", "Organização",
+    "Adaptabilidade", "Pensamento crítico", "Liderança", "Empatia", "Criatividade", "Negociação",
+    "Inteligência emocional", "Resiliência", "Gestão de tempo"
+]
+
+INTERESSES = [
+    "Inteligência Artificial", "Cloud Computing", "Educação tecnológica", "Smart Cities", "Robótica",
+    "Blockchain", "Internet das Coisas", "Energias renováveis", "Economia circular", "Realidade Virtual",
+    "IA ética", "Automação", "Big Data", "Cibersegurança", "Desenvolvimento sustentável", "Inovação social"
+]
+
+EMPRESAS = [
+    "TechNova Solutions", "DataMinds Analytics", "Grupo Horizonte", "Banco Atlântico", "Saúde Integrada",
+    "EduMais", "Varejo Brasil", "LogiTrans", "AgroTech Campo", "FinPay", "Mídia Viva", "Construtora Alvorada",
+    "Hospital Vida Plena", "Consultoria Prisma", "Startup Aurora", "Telecom Conecta"
+]
+
+INSTITUICOES = ["USP", "Unicamp", "UFRJ", "UFMG", "UFPR", "UFRGS", "UnB", "UFPE", "UFBA", "PUC", "Mackenzie", "Insper", "FGV", "UFSC"]
+
+PROJETOS = ["Aplicativo Mobile", "Dashboard Analítico", "Portal Institucional", "Sistema de Agendamento", "Campanha Digital", "Plataforma EAD"]
+
+
+def pesos_zipf(quantidade: int, expoente: float = 1.0) -> List[float]:
+    return [1.0 / (posicao ** expoente) for posicao in range(1, quantidade + 1)]
+
+
+def acumular(pesos: List[float]) -> List[float]:
+    return list(itertools.accumulate(pesos))
+
+
+def sortear_distintos(gerador: random.Random, valores: list, acumulados: List[float], quantidade: int) -> list:
+    quantidade = min(quantidade, len(valores))
+    escolhidos = []
+    vistos = set()
+    
+    while len(escolhidos) < quantidade:
+        valor = gerador.choices(valores, cum_weights=acumulados)[0]
+        
+        if valor not in vistos:
+            vistos.add(valor)
+            escolhidos.append(valor)
+    
+    return escolhidos
+
+
+def formatar_mes(ano: int, mes: int) -> str:
+    return f"{ano:04d}-{mes:02d}"
+
+
+class GeradorPerfis:
+    def __init__(self, semente: int = SEMENTE_PADRAO):
+        self.gerador = random.Random(semente)
+        self.areas = list(AREAS)
+        self.pesos_areas = acumular([AREAS[area]["peso"] for area in self.areas])
+        self.pesos_habilidades = {area: acumular(pesos_zipf(len(AREAS[area]["habilidades"]))) for area in self.areas}
+        self.cidades = [cidade for cidade, _ in CIDADES]
+        self.pesos_cidades = acumular([peso for _, peso in CIDADES])
+        self.pesos_soft_skills = acumular(pesos_zipf(len(SOFT_SKILLS), 0.5))
+        self.pesos_interesses = acumular(pesos_zipf(len(INTERESSES), 0.5))
+        self.niveis = {
+            idioma: ([nivel for nivel, _ in niveis], acumular([peso for _, peso in niveis]))
+            for idioma, _, niveis in IDIOMAS
+        }
+
+    def gerar_experiencias(self, cargos: List[str]) -> List[dict]:
+        gerador = self.gerador
+        anos_carreira = min(35, int(gerador.expovariate(1 / 7)))
+        ano = ANO_REFERENCIA - anos_carreira
+        mes = gerador.randint(1, 12)
+        quantidade = 1 + min(4, int(gerador.expovariate(1 / 1.2)))
+        experiencias = []
+        
+        for indice in range(quantidade):
+            atual = indice == quantidade - 1
+            inicio = formatar_mes(ano, mes)
+            
+            if atual:
+                fim = "Atual" if gerador.random() < 0.8 else formatar_mes(ANO_REFERENCIA, gerador.randint(1, 6))
+            else:
+                ano = min(ANO_REFERENCIA - 1, ano + gerador.randint(1, max(1, anos_carreira // quantidade + 1)))
+                mes = gerador.randint(1, 12)
+                fim = formatar_mes(ano, mes)
+            
+            cargo = cargos[-1] if atual else gerador.choice(cargos)
+            experiencias.append({
+                "empresa": gerador.choice(EMPRESAS),
+                "cargo": cargo,
+                "inicio": inicio,
+                "fim": fim,
+                "descricao": f"Atuação como {cargo.lower()} em equipe multidisciplinar com foco em resultados."
+            })
+        
+        return experiencias
+
+    def gerar_idiomas(self) -> List[dict]:
+        gerador = self.gerador
+        idiomas = [{"idioma": "Português", "nivel": "Nativo"}]
+        
+        for idioma, probabilidade, _ in IDIOMAS:
+            if gerador.random() < probabilidade:
+                niveis, acumulados = self.niveis[idioma]
+                idiomas.append({"idioma": idioma, "nivel": gerador.choices(niveis, cum_weights=acumulados)[0]})
+        
+        return idiomas
+
+    def gerar(self, profissional_id: Optional[int] = None) -> dict:
+        gerador = self.gerador
+        area = gerador.choices(self.areas, cum_weights=self.pesos_areas)[0]
+        dados_area = AREAS[area]
+        cargo = gerador.choice(dados_area["cargos"])
+        nome = f"{gerador.choice(NOMES)} {gerador.choice(SOBRENOMES)} {gerador.choice(SOBRENOMES)}"
+        habilidades = sortear_distintos(
+            gerador, dados_area["habilidades"], self.pesos_habilidades[area], gerador.randint(3, 10)
+        )
+        ano_formacao = gerador.randint(ANO_REFERENCIA - 30, ANO_REFERENCIA - 1)
+        formacao = [{
+            "curso": gerador.choice(dados_area["cursos"]),
+            "instituicao": gerador.choice(INSTITUICOES),
+            "ano": ano_formacao
+        }]
+        
+        if gerador.random() < 0.35:
+            formacao.append({
+                "curso": "MBA em Gestão de Projetos",
+                "instituicao": gerador.choice(INSTITUICOES),
+                "ano": min(ANO_REFERENCIA, ano_formacao + gerador.randint(1, 6))
+            })
+        
+        perfil = {
+            "nome": nome,
+            "foto": "",
+            "cargo": cargo,
+            "resumo": f"Profissional de {area} com experiência em {', '.join(habilidades[:3])}.",
+            "localizacao": gerador.choices(self.cidades, cum_weights=self.pesos_cidades)[0],
+            "area": area,
+            "habilidadesTecnicas": habilidades,
+            "softSkills": sortear_distintos(gerador, SOFT_SKILLS, self.pesos_soft_skills, gerador.randint(3, 5)),
+            "experiencias": self.gerar_experiencias([*dados_area["cargos"], cargo]),
+            "formacao": formacao,
+            "projetos": [
+                {
+                    "titulo": gerador.choice(PROJETOS),
+                    "link": f"https://github.com/exemplo{gerador.randint(1, 99999)}",
+                    "descricao": f"Projeto na área de {area.lower()}."
+                }
+                for _ in range(gerador.randint(0, 3))
+            ],
+            "certificacoes": gerador.sample(dados_area["certificacoes"], gerador.randint(0, 2)),
+            "idiomas": self.gerar_idiomas(),
+            "areaInteresses": sortear_distintos(gerador, INTERESSES, self.pesos_interesses, gerador.randint(1, 3))
+        }
+        
+        if profissional_id is not None:
+            perfil = {"id": profissional_id, **perfil}
+        
+        return perfil
+
+
+def gerar_perfis(quantidade: int, semente: int = SEMENTE_PADRAO, com_ids: bool = True) -> Iterator[dict]:
+    gerador = GeradorPerfis(semente)
+    
+    for indice in range(1, quantidade + 1):
+        yield gerador.gerar(indice if com_ids else None)
+
+
+def gravar_ndjson(caminho: str, quantidade: int, semente: int = SEMENTE_PADRAO) -> None:
+    with open(caminho, "wb") as arquivo:
+        for perfil in gerar_perfis(quantidade, semente):
+            arquivo.write(orjson.dumps(perfil) + b"\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera perfis sinteticos deterministicos em NDJSON")
+    parser.add_argument("--quantidade", type=int, default=10000)
+    parser.add_argument("--semente", type=int, default=SEMENTE_PADRAO)
+    parser.add_argument("--saida", help="Arquivo NDJSON de saida (padrao: perfis_sinteticos_<quantidade>.ndjson)")
+    argumentos = parser.parse_args()
+    
+    caminho = argumentos.saida or f"perfis_sinteticos_{argumentos.quantidade}.ndjson"
+    inicio = time.perf_counter()
+    gravar_ndjson(caminho, argumentos.quantidade, argumentos.semente)
+    
+    print(f"[OK] {argumentos.quantidade} perfis gravados em {caminho} ({time.perf_counter() - inicio:.1f}s)")
@@ -1,43 +1,208 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError, OperationalError
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Dict, List, Literal, Optional
+from contextlib import asynccontextmanager
+import logging
 import uvicorn
 
-from database import engine, Base, SessionLocal
+from database import engine, async_engine, Base, SessionLocal, USAR_BANCO_ASYNC, atualizar_esquema
+from cache import cache_perfis
+from serializacao import (
+    RespostaJSONRapida,
+    responder_profissionais,
+    responder_pagina,
+    responder_ranking,
+    responder_perfil,
+    gerar_ndjson,
+    gerar_csv,
+    campos_da_requisicao
+)
+from compressao import CompressaoMiddleware
+from estatisticas import instantaneo_estatisticas
+from fila import fila_derivados
+from fotos import (
+    cache_fotos,
+    cache_control_foto,
+    FotoIndisponivel,
+    FOTOS_TAMANHOS,
+    FOTOS_TAMANHO_PADRAO,
+    FOTOS_MAX_MB_ORIGEM,
+    PREFIXO_ENVIADA
+)
+from metricas import (
+    MetricasMiddleware,
+    registro_metricas,
+    consultas_lentas,
+    instrumentar_engine,
+    instrumentar_modelos
+)
 from models import Profissional
-from schemas import ProfissionalCreate, ProfissionalResponse, ProfissionalUpdate
+from busca import criar_indice_busca
+from ranking import indice_ranking
+from similaridade import indice_similaridade
+from sugestoes import indice_sugestoes, SUGESTOES_LIMITE_MAXIMO
+from versionamento import (
+    versao_dados,
+    criar_controle_versao,
+    nao_modificado,
+    cabecalhos_versionados,
+    resposta_nao_modificada,
+    cabecalhos_do_perfil,
+    versoes_do_if_match,
+    ConflitoVersao,
+    erro_de_conflito
+)
+from schemas import (
+    ProfissionalCreate,
+    ProfissionalResponse,
+    ProfissionalUpdate,
+    OperacaoPatch,
+    PaginaProfissionais,
+    NivelIdioma,
+    ProfissionalAtualizacaoLote,
+    RemocaoLote,
+    ResultadoLote,
+    VagaRanking,
+    ResultadoRanking,
+    Sugestao
+)
 from crud import (
     criar_profissional,
-    obter_profissional_por_id,
+    criar_profissionais_em_lote,
+    obter_profissional_serializado,
+    obter_foto_do_profissional,
+    obter_fotos_enviadas_em_uso,
     obter_todos_profissionais,
+    calcular_estatisticas,
+    atualizar_derivados,
     atualizar_profissional,
+    alterar_profissional,
+    atualizar_profissionais_em_lote,
     deletar_profissional,
+    deletar_profissionais_em_lote,
     buscar_profissionais,
+    buscar_profissionais_por_cursor,
+    exportar_profissionais,
+    ranquear_profissionais,
+    buscar_profissionais_similares,
+    sugerir_termos,
     obter_areas_unicas,
     obter_cidades_unicas,
     obter_tecnologias_unicas,
-    contar_profissionais_por_area,
     obter_profissionais_com_tecnologia
 )
 
-Base.metadata.create_all(bind=engine)
+instrumentar_engine(engine)
+instrumentar_modelos(Base)
+
+if async_engine is not None:
+    instrumentar_engine(async_engine.sync_engine)
+
+
+def preparar_banco():
+    Base.metadata.create_all(bind=engine)
+    atualizar_esquema(engine)
+    criar_indice_busca(engine)
+    criar_controle_versao(engine)
+
+
+def montar_indice_sugestoes():
+    db = SessionLocal()
+    try:
+        indice_sugestoes.montar(db)
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def ciclo_de_vida(app: FastAPI):
+    preparar_banco()
+    montar_indice_sugestoes()
+    instantaneo_estatisticas.iniciar(SessionLocal, calcular_estatisticas)
+    fila_derivados.iniciar(SessionLocal, atualizar_derivados)
+    cache_fotos.iniciar()
+    
+    try:
+        yield
+    finally:
+        cache_fotos.parar()
+        fila_derivados.parar()
+        instantaneo_estatisticas.parar()
+
+
+TAMANHO_MAXIMO_LOTE = 1000
+
+logger_lote = logging.getLogger("futuroconecta.lote")
+
+ROTAS_VERSIONADAS = {
+    "/api/profissionais",
+    "/api/profissionais/pagina",
+    "/api/profissionais/export",
+    "/api/areas",
+    "/api/cidades",
+    "/api/tecnologias"
+}
+
+PREFIXOS_VERSIONADOS = ("/api/profissionais/tecnologia/",)
+
+FORMATOS_EXPORTACAO = {
+    "ndjson": ("application/x-ndjson", gerar_ndjson),
+    "csv": ("text/csv; charset=utf-8", gerar_csv)
+}
 
 app = FastAPI(
     title="FuturoConecta API",
     description="API REST para gerenciamento de perfis profissionais",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=ciclo_de_vida
 )
 
+
+def rota_versionada(caminho: str) -> bool:
+    return caminho in ROTAS_VERSIONADAS or caminho.startswith(PREFIXOS_VERSIONADOS)
+
+
+@app.middleware("http")
+async def responder_condicionalmente(request: Request, call_next):
+    if request.method != "GET" or not rota_versionada(request.url.path):
+        return await call_next(request)
+    
+    estado = await run_in_threadpool(versao_dados.ler)
+    etag, modificado_em = estado.etag, estado.modificado_em
+    
+    if nao_modificado(request, etag, modificado_em):
+        return resposta_nao_modificada(etag, modificado_em)
+    
+    response = await call_next(request)
+    
+    if response.status_code == 200:
+        response.headers.update(cabecalhos_versionados(etag, modificado_em))
+    
+    return response
+
+
+app.add_middleware(CompressaoMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
 
+app.add_middleware(MetricasMiddleware)
+
+rotas_sync = APIRouter()
+
+
 
 @app.get("/")
 def root():
@@ -60,7 +225,435 @@ def health_check():
     return {"status": "ok", "message": "API funcionando corretamente"}
 
 
-@app.post("/api/profissionais", response_model=ProfissionalResponse, status_code=201)
+@app.get("/metrics", response_class=PlainTextResponse)
+def exportar_metricas():
+    return PlainTextResponse(
+        registro_metricas.exportar(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/api/metricas/consultas-lentas")
+def listar_consultas_lentas():
+    return {
+        "ativo": consultas_lentas.ativo,
+        "limite_ms": consultas_lentas.limite_ms,
+        "consultas": consultas_lentas.listar()
+    }
+
+
+@app.get("/api/cache")
+def obter_estatisticas_cache():
+    return cache_perfis.estatisticas()
+
+
+@app.get("/api/ranking")
+def obter_estatisticas_ranking():
+    return indice_ranking.estatisticas()
+
+
+@app.get("/api/fila")
+def obter_estatisticas_fila():
+    return fila_derivados.estatisticas()
+
+
+@app.get("/api/sugestoes", response_model=List[Sugestao])
+def listar_sugestoes(
+    q: str = Query(..., min_length=1, description="Início do nome, cargo, habilidade, cidade ou área"),
+    limit: int = Query(10, ge=1, le=SUGESTOES_LIMITE_MAXIMO, description="Número máximo de sugestões")
+):
+    db = SessionLocal()
+    try:
+        return sugerir_termos(db, q, limit)
+    finally:
+        db.close()
+
+
+@app.get("/api/sugestoes/estatisticas")
+def obter_estatisticas_sugestoes():
+    return indice_sugestoes.estatisticas()
+
+
+@app.get("/api/versao")
+def obter_versao_dados():
+    return versao_dados.estatisticas()
+
+
+@app.get("/api/estatisticas")
+def obter_estatisticas(request: Request):
+    if instantaneo_estatisticas.ativo:
+        estatisticas, estado = instantaneo_estatisticas.obter()
+    else:
+        estatisticas, estado = None, versao_dados.ler()
+    
+    etag, modificado_em = estado.etag, estado.modificado_em
+    
+    if nao_modificado(request, etag, modificado_em):
+        return resposta_nao_modificada(etag, modificado_em)
+    
+    if estatisticas is None:
+        db = SessionLocal()
+        try:
+            estatisticas = calcular_estatisticas(db)
+        finally:
+            db.close()
+    
+    return RespostaJSONRapida(content=estatisticas, headers=cabecalhos_versionados(etag, modificado_em))
+
+
+@app.get("/api/estatisticas/instantaneo")
+def obter_estado_instantaneo_estatisticas():
+    return instantaneo_estatisticas.estatisticas()
+
+
+@app.get("/api/similaridade")
+def obter_estatisticas_similaridade():
+    return indice_similaridade.estatisticas()
+
+
+@app.get("/api/profissionais/{profissional_id}/similares", response_model=ResultadoRanking)
+def listar_profissionais_similares(
+    profissional_id: int,
+    limit: int = Query(10, ge=1, le=50, description="Número máximo de perfis semelhantes"),
+    campos: Optional[List[str]] = Depends(campos_da_requisicao)
+):
+    db = SessionLocal()
+    try:
+        resultado = buscar_profissionais_similares(db, profissional_id, limit, campos)
+        
+        if resultado is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profissional com ID {profissional_id} não encontrado"
+            )
+        
+        similares, total = resultado
+        return responder_ranking(similares, total, campos)
+    finally:
+        db.close()
+
+
+@app.get("/api/fotos")
+def obter_estatisticas_fotos():
+    return cache_fotos.estatisticas()
+
+
+@app.get("/api/profissionais/{profissional_id}/foto")
+def obter_foto_profissional(
+    profissional_id: int,
+    request: Request,
+    size: int = Query(FOTOS_TAMANHO_PADRAO, description=f"Lado máximo da miniatura em pixels ({FOTOS_TAMANHOS})"),
+    v: Optional[int] = Query(None, description="Versão do perfil; com a versão atual, a resposta fica em cache sem prazo")
+):
+    if size not in FOTOS_TAMANHOS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Tamanho inválido. Use um de: {', '.join(str(tamanho) for tamanho in FOTOS_TAMANHOS)}"
+        )
+    
+    db = SessionLocal()
+    try:
+        perfil = obter_foto_do_profissional(db, profissional_id)
+    finally:
+        db.close()
+    
+    if perfil is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Profissional com ID {profissional_id} não encontrado"
+        )
+    
+    if not perfil.foto:
+        raise HTTPException(status_code=404, detail=f"Profissional com ID {profissional_id} não tem foto")
+    
+    try:
+        conteudo, tipo, nome = cache_fotos.obter(perfil.foto, size)
+    except FotoIndisponivel as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    
+    etag = f'"{nome}"'
+    cabecalhos = {"ETag": etag, "Cache-Control": cache_control_foto(v == perfil.versao)}
+    
+    if nao_modificado(request, etag, None):
+        return Response(status_code=304, headers=cabecalhos)
+    
+    return Response(content=conteudo, media_type=tipo, headers=cabecalhos)
+
+
+@app.put("/api/profissionais/{profissional_id}/foto", response_model=ProfissionalResponse)
+def enviar_foto_profissional(
+    profissional_id: int,
+    response: Response,
+    conteudo: bytes = Body(..., media_type="image/jpeg"),
+    if_match: Optional[str] = Header(None)
+):
+    if len(conteudo) > FOTOS_MAX_MB_ORIGEM * 1024 * 1024:
+        raise HTTPException(status_code=413, detail=f"A foto deve ter no máximo {FOTOS_MAX_MB_ORIGEM:g} MB")
+    
+    try:
+        referencia = cache_fotos.guardar_enviada(conteudo)
+    except ValueError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    
+    db = SessionLocal()
+    try:
+        anterior = obter_foto_do_profissional(db, profissional_id)
+        
+        try:
+            profissional_atualizado = atualizar_profissional(
+                db,
+                profissional_id,
+                ProfissionalUpdate(foto=referencia),
+                versoes_do_if_match(if_match, profissional_id)
+            )
+        except ConflitoVersao as e:
+            raise erro_de_conflito(e, if_match)
+        
+        if profissional_atualizado is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profissional com ID {profissional_id} não encontrado"
+            )
+        
+        if anterior is not None and anterior.foto and anterior.foto.startswith(PREFIXO_ENVIADA):
+            if not obter_fotos_enviadas_em_uso(db, [anterior.foto]):
+                cache_fotos.descartar_enviadas([anterior.foto])
+        
+        response.headers.update(cabecalhos_do_perfil(profissional_atualizado))
+        return profissional_atualizado
+    finally:
+        db.close()
+
+
+@app.post("/api/profissionais/ranking", response_model=ResultadoRanking)
+def ranquear_candidatos(
+    vaga: VagaRanking,
+    campos: Optional[List[str]] = Depends(campos_da_requisicao)
+):
+    db = SessionLocal()
+    try:
+        ranqueados, total = ranquear_profissionais(db, vaga, campos)
+        return responder_ranking(ranqueados, total, campos)
+    finally:
+        db.close()
+
+
+@app.get("/api/profissionais/export")
+def exportar_catalogo(
+    formato: Literal["ndjson", "csv"] = Query("ndjson", description="Formato do arquivo: ndjson ou csv"),
+    area: Optional[str] = Query(None, description="Filtrar por área"),
+    cidade: Optional[str] = Query(None, description="Filtrar por cidade"),
+    tecnologia: Optional[str] = Query(None, description="Filtrar por tecnologia"),
+    anos_minimos: Optional[int] = Query(None, ge=0, description="Mínimo de anos de experiência"),
+    idioma: Optional[str] = Query(None, description="Filtrar por idioma"),
+    nivel_minimo: Optional[NivelIdioma] = Query(None, description="Nível mínimo no idioma (requer idioma)"),
+    busca: Optional[str] = Query(None, description="Busca textual"),
+    campos: Optional[List[str]] = Depends(campos_da_requisicao)
+):
+    tipo, gerador = FORMATOS_EXPORTACAO[formato]
+    
+    def gerar_arquivo():
+        db = SessionLocal()
+        try:
+            lotes = exportar_profissionais(
+                db=db,
+                termo_busca=busca,
+                area=area,
+                cidade=cidade,
+                tecnologia=tecnologia,
+                anos_minimos=anos_minimos,
+                idioma=idioma,
+                nivel_minimo=nivel_minimo,
+                campos=campos
+            )
+            yield from gerador(lotes, campos)
+        finally:
+            db.close()
+    
+    return StreamingResponse(
+        gerar_arquivo(),
+        media_type=tipo,
+        headers={"Content-Disposition": f'attachment; filename="profissionais.{formato}"'}
+    )
+
+
+def validar_tamanho_lote(itens: list):
+    if len(itens) > TAMANHO_MAXIMO_LOTE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"O lote deve ter no máximo {TAMANHO_MAXIMO_LOTE} itens"
+        )
+
+
+def erro_de_validacao(indice: int, erro: ValidationError) -> dict:
+    return {
+        "indice": indice,
+        "status": 422,
+        "erro": erro.errors(include_url=False, include_context=False, include_input=False)
+    }
+
+
+def erro_de_gravacao(indice: int, erro: Exception, profissional_id: Optional[int] = None) -> dict:
+    logger_lote.warning("Falha ao gravar o item %s do lote (id=%s)", indice, profissional_id, exc_info=erro)
+    
+    if isinstance(erro, IntegrityError):
+        mensagem = "Os dados violam uma restrição de integridade do cadastro"
+    elif isinstance(erro, OperationalError):
+        mensagem = "Banco de dados indisponível no momento, tente novamente"
+    else:
+        mensagem = "Não foi possível gravar o profissional"
+    
+    resultado = {"indice": indice, "status": 400, "erro": mensagem}
+    
+    if profissional_id is not None:
+        resultado["id"] = profissional_id
+    
+    return resultado
+
+
+def resumir_lote(resultados: list) -> dict:
+    sucesso = sum(1 for resultado in resultados if resultado["status"] < 400)
+    
+    return {
+        "sucesso": sucesso,
+        "falhas": len(resultados) - sucesso,
+        "resultados": resultados
+    }
+
+
+@app.post("/api/profissionais/batch", response_model=ResultadoLote)
+def criar_profissionais_lote(itens: List[Dict[str, Any]] = Body(...)):
+    validar_tamanho_lote(itens)
+    resultados = [None] * len(itens)
+    validos = []
+    
+    for indice, item in enumerate(itens):
+        try:
+            validos.append((indice, ProfissionalCreate.model_validate(item)))
+        except ValidationError as e:
+            resultados[indice] = erro_de_validacao(indice, e)
+    
+    db = SessionLocal()
+    try:
+        try:
+            ids_criados = criar_profissionais_em_lote(db, [profissional for _, profissional in validos])
+            
+            for (indice, _), profissional_id in zip(validos, ids_criados):
+                resultados[indice] = {"indice": indice, "status": 201, "id": profissional_id}
+        except Exception:
+            db.rollback()
+            
+            for indice, profissional in validos:
+                try:
+                    novo_profissional = criar_profissional(db, profissional)
+                    resultados[indice] = {"indice": indice, "status": 201, "id": novo_profissional.id}
+                except Exception as e:
+                    db.rollback()
+                    resultados[indice] = erro_de_gravacao(indice, e)
+        
+        return resumir_lote(resultados)
+    finally:
+        db.close()
+
+
+def resultado_da_atualizacao(indice: int, profissional_id: int, atualizado) -> dict:
+    if atualizado is True:
+        return {"indice": indice, "status": 200, "id": profissional_id}
+    
+    if atualizado is False:
+        return {
+            "indice": indice,
+            "status": 404,
+            "id": profissional_id,
+            "erro": f"Profissional com ID {profissional_id} não encontrado"
+        }
+    
+    if isinstance(atualizado, ConflitoVersao):
+        return {"indice": indice, "status": 412, "id": profissional_id, "erro": str(atualizado)}
+    
+    return erro_de_gravacao(indice, atualizado, profissional_id)
+
+
+@app.patch("/api/profissionais/batch", response_model=ResultadoLote)
+def atualizar_profissionais_lote(itens: List[Dict[str, Any]] = Body(...)):
+    validar_tamanho_lote(itens)
+    resultados = [None] * len(itens)
+    validos = []
+    versionados = []
+    
+    for indice, item in enumerate(itens):
+        try:
+            atualizacao = ProfissionalAtualizacaoLote.model_validate(item)
+            campos = ProfissionalUpdate(**atualizacao.dict(exclude={"id", "versao"}, exclude_unset=True))
+            
+            if atualizacao.versao is None:
+                validos.append((indice, atualizacao.id, campos))
+            else:
+                versionados.append((indice, atualizacao.id, atualizacao.versao, campos))
+        except ValidationError as e:
+            resultados[indice] = erro_de_validacao(indice, e)
+    
+    db = SessionLocal()
+    try:
+        try:
+            atualizados = atualizar_profissionais_em_lote(
+                db,
+                [(profissional_id, atualizacao) for _, profissional_id, atualizacao in validos]
+            )
+        except Exception:
+            db.rollback()
+            atualizados = []
+            
+            for _, profissional_id, atualizacao in validos:
+                try:
+                    atualizados.append(atualizar_profissional(db, profissional_id, atualizacao) is not None)
+                except Exception as e:
+                    db.rollback()
+                    atualizados.append(e)
+        
+        for (indice, profissional_id, _), atualizado in zip(validos, atualizados):
+            resultados[indice] = resultado_da_atualizacao(indice, profissional_id, atualizado)
+        
+        for indice, profissional_id, versao, atualizacao in versionados:
+            try:
+                atualizado = atualizar_profissional(db, profissional_id, atualizacao, [versao]) is not None
+            except Exception as e:
+                db.rollback()
+                atualizado = e
+            
+            resultados[indice] = resultado_da_atualizacao(indice, profissional_id, atualizado)
+        
+        return resumir_lote(resultados)
+    finally:
+        db.close()
+
+
+@app.delete("/api/profissionais/batch", response_model=ResultadoLote)
+def deletar_profissionais_lote(remocao: RemocaoLote):
+    validar_tamanho_lote(remocao.ids)
+    
+    db = SessionLocal()
+    try:
+        removidos = deletar_profissionais_em_lote(db, remocao.ids)
+        resultados = []
+        
+        for indice, (profissional_id, removido) in enumerate(zip(remocao.ids, removidos)):
+            if removido:
+                resultados.append({"indice": indice, "status": 204, "id": profissional_id})
+            else:
+                resultados.append({
+                    "indice": indice,
+                    "status": 404,
+                    "id": profissional_id,
+                    "erro": f"Profissional com ID {profissional_id} não encontrado"
+                })
+        
+        return resumir_lote(resultados)
+    finally:
+        db.close()
+
+
+@rotas_sync.post("/api/profissionais", response_model=ProfissionalResponse, status_code=201)
 def criar_novo_profissional(profissional: ProfissionalCreate):
     db = SessionLocal()
     try:
@@ -72,40 +665,84 @@ def criar_novo_profissional(profissional: ProfissionalCreate):
         db.close()
 
 
-@app.get("/api/profissionais", response_model=List[ProfissionalResponse])
+@rotas_sync.get("/api/profissionais", response_model=List[ProfissionalResponse])
 def listar_profissionais(
     skip: int = Query(0, ge=0, description="Número de registros para pular"),
     limit: int = Query(100, ge=1, le=100, description="Número máximo de registros"),
     area: Optional[str] = Query(None, description="Filtrar por área"),
     cidade: Optional[str] = Query(None, description="Filtrar por cidade"),
     tecnologia: Optional[str] = Query(None, description="Filtrar por tecnologia"),
-    busca: Optional[str] = Query(None, description="Busca textual")
+    anos_minimos: Optional[int] = Query(None, ge=0, description="Mínimo de anos de experiência"),
+    idioma: Optional[str] = Query(None, description="Filtrar por idioma"),
+    nivel_minimo: Optional[NivelIdioma] = Query(None, description="Nível mínimo no idioma (requer idioma)"),
+    busca: Optional[str] = Query(None, description="Busca textual"),
+    campos: Optional[List[str]] = Depends(campos_da_requisicao)
 ):
     db = SessionLocal()
     try:
-        if busca or area or cidade or tecnologia:
+        if busca or area or cidade or tecnologia or idioma or anos_minimos is not None:
             profissionais = buscar_profissionais(
                 db=db,
                 termo_busca=busca,
                 area=area,
                 cidade=cidade,
                 tecnologia=tecnologia,
+                anos_minimos=anos_minimos,
+                idioma=idioma,
+                nivel_minimo=nivel_minimo,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                campos=campos
             )
         else:
-            profissionais = obter_todos_profissionais(db, skip=skip, limit=limit)
+            profissionais = obter_todos_profissionais(db, skip=skip, limit=limit, campos=campos)
+        
+        return responder_profissionais(profissionais, campos)
+    finally:
+        db.close()
+
+
+@rotas_sync.get("/api/profissionais/pagina", response_model=PaginaProfissionais)
+def listar_profissionais_por_cursor(
+    cursor: Optional[str] = Query(None, description="Cursor retornado em next_cursor pela página anterior"),
+    limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    area: Optional[str] = Query(None, description="Filtrar por área"),
+    cidade: Optional[str] = Query(None, description="Filtrar por cidade"),
+    tecnologia: Optional[str] = Query(None, description="Filtrar por tecnologia"),
+    anos_minimos: Optional[int] = Query(None, ge=0, description="Mínimo de anos de experiência"),
+    idioma: Optional[str] = Query(None, description="Filtrar por idioma"),
+    nivel_minimo: Optional[NivelIdioma] = Query(None, description="Nível mínimo no idioma (requer idioma)"),
+    busca: Optional[str] = Query(None, description="Busca textual"),
+    campos: Optional[List[str]] = Depends(campos_da_requisicao)
+):
+    db = SessionLocal()
+    try:
+        profissionais, proximo_cursor = buscar_profissionais_por_cursor(
+            db=db,
+            termo_busca=busca,
+            area=area,
+            cidade=cidade,
+            tecnologia=tecnologia,
+            anos_minimos=anos_minimos,
+            idioma=idioma,
+            nivel_minimo=nivel_minimo,
+            cursor=cursor,
+            limit=limit,
+            campos=campos
+        )
         
-        return profissionais
+        return responder_pagina(profissionais, proximo_cursor, campos)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     finally:
         db.close()
 
 
-@app.get("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
-def obter_profissional(profissional_id: int):
+@rotas_sync.get("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
+def obter_profissional(profissional_id: int, request: Request):
     db = SessionLocal()
     try:
-        profissional = obter_profissional_por_id(db, profissional_id)
+        profissional = obter_profissional_serializado(db, profissional_id)
         
         if profissional is None:
             raise HTTPException(
@@ -113,16 +750,29 @@ def obter_profissional(profissional_id: int):
                 detail=f"Profissional com ID {profissional_id} não encontrado"
             )
         
-        return profissional
+        return responder_perfil(request, profissional)
     finally:
         db.close()
 
 
-@app.put("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
-def atualizar_dados_profissional(profissional_id: int, profissional: ProfissionalUpdate):
+@rotas_sync.put("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
+def atualizar_dados_profissional(
+    profissional_id: int,
+    profissional: ProfissionalUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
     db = SessionLocal()
     try:
-        profissional_atualizado = atualizar_profissional(db, profissional_id, profissional)
+        try:
+            profissional_atualizado = atualizar_profissional(
+                db,
+                profissional_id,
+                profissional,
+                versoes_do_if_match(if_match, profissional_id)
+            )
+        except ConflitoVersao as e:
+            raise erro_de_conflito(e, if_match)
         
         if profissional_atualizado is None:
             raise HTTPException(
@@ -130,12 +780,51 @@ def atualizar_dados_profissional(profissional_id: int, profissional: Profissiona
                 detail=f"Profissional com ID {profissional_id} não encontrado"
             )
         
+        response.headers.update(cabecalhos_do_perfil(profissional_atualizado))
         return profissional_atualizado
     finally:
         db.close()
 
 
-@app.delete("/api/profissionais/{profissional_id}", status_code=204)
+@rotas_sync.patch("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
+def alterar_dados_profissional(
+    profissional_id: int,
+    operacoes: List[OperacaoPatch],
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    db = SessionLocal()
+    try:
+        try:
+            profissional_alterado = alterar_profissional(
+                db,
+                profissional_id,
+                operacoes,
+                versoes_do_if_match(if_match, profissional_id)
+            )
+        except ConflitoVersao as e:
+            raise erro_de_conflito(e, if_match)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=e.errors(include_url=False, include_context=False, include_input=False)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        if profissional_alterado is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profissional com ID {profissional_id} não encontrado"
+            )
+        
+        response.headers.update(cabecalhos_do_perfil(profissional_alterado))
+        return profissional_alterado
+    finally:
+        db.close()
+
+
+@rotas_sync.delete("/api/profissionais/{profissional_id}", status_code=204)
 def deletar_profissional_por_id(profissional_id: int):
     db = SessionLocal()
     try:
@@ -152,7 +841,7 @@ def deletar_profissional_por_id(profissional_id: int):
         db.close()
 
 
-@app.get("/api/areas", response_model=List[str])
+@rotas_sync.get("/api/areas", response_model=List[str])
 def listar_areas():
     db = SessionLocal()
     try:
@@ -162,7 +851,7 @@ def listar_areas():
         db.close()
 
 
-@app.get("/api/cidades", response_model=List[str])
+@rotas_sync.get("/api/cidades", response_model=List[str])
 def listar_cidades():
     db = SessionLocal()
     try:
@@ -172,7 +861,7 @@ def listar_cidades():
         db.close()
 
 
-@app.get("/api/tecnologias", response_model=List[str])
+@rotas_sync.get("/api/tecnologias", response_model=List[str])
 def listar_tecnologias():
     db = SessionLocal()
     try:
@@ -182,37 +871,23 @@ def listar_tecnologias():
         db.close()
 
 
-@app.get("/api/estatisticas")
-def obter_estatisticas():
-    db = SessionLocal()
-    try:
-        total_profissionais = len(obter_todos_profissionais(db, skip=0, limit=1000))
-        profissionais_por_area = contar_profissionais_por_area(db)
-        total_areas = len(obter_areas_unicas(db))
-        total_cidades = len(obter_cidades_unicas(db))
-        total_tecnologias = len(obter_tecnologias_unicas(db))
-        
-        return {
-            "total_profissionais": total_profissionais,
-            "total_areas": total_areas,
-            "total_cidades": total_cidades,
-            "total_tecnologias": total_tecnologias,
-            "profissionais_por_area": profissionais_por_area
-        }
-    finally:
-        db.close()
-
-
-@app.get("/api/profissionais/tecnologia/{tecnologia}", response_model=List[ProfissionalResponse])
+@rotas_sync.get("/api/profissionais/tecnologia/{tecnologia}", response_model=List[ProfissionalResponse])
 def listar_profissionais_por_tecnologia(tecnologia: str):
     db = SessionLocal()
     try:
         profissionais = obter_profissionais_com_tecnologia(db, tecnologia)
-        return profissionais
+        return responder_profissionais(profissionais)
     finally:
         db.close()
 
 
+if USAR_BANCO_ASYNC:
+    from rotas_async import rotas_async
+    app.include_router(rotas_async)
+else:
+    app.include_router(rotas_sync)
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
@@ -0,0 +1,172 @@
+import argparse
+from database import SessionLocal, engine, Base, atualizar_esquema
+from crud import (
+    canonizar_habilidades_cadastradas,
+    reconstruir_indice_habilidades,
+    reconstruir_indice_idiomas,
+    reconstruir_resumo_experiencia,
+    obter_fotos_enviadas_em_uso
+)
+from busca import criar_indice_busca, reconstruir_indice_busca
+from facetas import reconstruir_facetas, verificar_facetas
+from fotos import cache_fotos
+from versionamento import criar_controle_versao
+
+
+def executar_canonizacao_habilidades():
+    print("Convertendo habilidades para os nomes canonicos...")
+    
+    db = SessionLocal()
+    
+    try:
+        total = canonizar_habilidades_cadastradas(db)
+        print(f"[OK] {total} perfis atualizados")
+    except Exception as e:
+        print(f"[ERRO] Erro ao canonizar habilidades: {e}")
+        db.rollback()
+        return
+    finally:
+        db.close()
+    
+    if total:
+        executar_reconstrucao_habilidades()
+        executar_reconstrucao_busca()
+        executar_reconstrucao_facetas()
+
+
+def executar_reconstrucao_habilidades():
+    print("Reconstruindo indice de habilidades...")
+    
+    db = SessionLocal()
+    
+    try:
+        total = reconstruir_indice_habilidades(db)
+        print(f"[OK] {total} habilidades indexadas")
+    except Exception as e:
+        print(f"[ERRO] Erro ao reconstruir indice de habilidades: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def executar_reconstrucao_idiomas():
+    print("Reconstruindo indice de idiomas...")
+    
+    db = SessionLocal()
+    
+    try:
+        total = reconstruir_indice_idiomas(db)
+        print(f"[OK] {total} idiomas indexados")
+    except Exception as e:
+        print(f"[ERRO] Erro ao reconstruir indice de idiomas: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def executar_reconstrucao_busca():
+    print("Reconstruindo indice de busca textual...")
+    
+    db = SessionLocal()
+    
+    try:
+        total = reconstruir_indice_busca(db)
+        print(f"[OK] {total} perfis indexados para busca")
+    except Exception as e:
+        print(f"[ERRO] Erro ao reconstruir indice de busca: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def executar_reconstrucao_facetas():
+    print("Reconstruindo contagens de facetas...")
+    
+    db = SessionLocal()
+    
+    try:
+        total = reconstruir_facetas(db)
+        print(f"[OK] {total} valores de facetas recalculados")
+    except Exception as e:
+        print(f"[ERRO] Erro ao reconstruir facetas: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def executar_verificacao_facetas():
+    print("Verificando consistencia das facetas...")
+    
+    db = SessionLocal()
+    
+    try:
+        divergencias = verificar_facetas(db)
+        
+        if not divergencias:
+            print("[OK] Contagens de facetas consistentes")
+            return
+        
+        for (tipo, valor), (armazenada, esperada) in sorted(divergencias.items()):
+            print(f"[AVISO] {tipo} '{valor}': armazenado {armazenada}, esperado {esperada}")
+        
+        print(f"[ERRO] {len(divergencias)} divergencias encontradas. Execute 'python manutencao.py facetas'")
+    finally:
+        db.close()
+
+
+def executar_reconstrucao_experiencia():
+    print("Recalculando anos de experiencia e cargo mais recente...")
+    
+    db = SessionLocal()
+    
+    try:
+        total = reconstruir_resumo_experiencia(db)
+        print(f"[OK] {total} perfis atualizados")
+    except Exception as e:
+        print(f"[ERRO] Erro ao recalcular experiencia: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def executar_coleta_fotos():
+    print("Apagando fotos enviadas que nenhum perfil usa...")
+    
+    db = SessionLocal()
+    
+    try:
+        removidas, liberados = cache_fotos.coletar_enviadas(obter_fotos_enviadas_em_uso(db))
+        print(f"[OK] {removidas} fotos apagadas ({liberados / (1024 * 1024):.1f} MB liberados)")
+    except Exception as e:
+        print(f"[ERRO] Erro ao apagar fotos enviadas: {e}")
+    finally:
+        db.close()
+
+
+COMANDOS = {
+    "canonizar": executar_canonizacao_habilidades,
+    "habilidades": executar_reconstrucao_habilidades,
+    "idiomas": executar_reconstrucao_idiomas,
+    "busca": executar_reconstrucao_busca,
+    "facetas": executar_reconstrucao_facetas,
+    "experiencia": executar_reconstrucao_experiencia,
+    "verificar-facetas": executar_verificacao_facetas,
+    "fotos": executar_coleta_fotos,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rotinas de manutencao do banco de dados")
+    parser.add_argument("comando", choices=list(COMANDOS) + ["tudo"])
+    argumentos = parser.parse_args()
+    
+    Base.metadata.create_all(bind=engine)
+    atualizar_esquema(engine)
+    criar_indice_busca(engine)
+    criar_controle_versao(engine)
+    
+    if argumentos.comando == "tudo":
+        for comando in COMANDOS.values():
+            comando()
+    else:
+        COMANDOS[argumentos.comando]()
@@ -0,0 +1,294 @@
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+load_dotenv()
+
+CONSULTA_LENTA_MS = os.getenv("CONSULTA_LENTA_MS")
+CONSULTAS_LENTAS_GUARDADAS = int(os.getenv("CONSULTAS_LENTAS_GUARDADAS", "50"))
+
+LIMITES_DURACAO = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LIMITES_CONSULTAS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+LIMITES_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+PREFIXO = "futuroconecta"
+
+logger_consultas = logging.getLogger("futuroconecta.consultas_lentas")
+
+
+class MedicaoRequisicao:
+    __slots__ = ("consultas", "tempo_banco", "linhas")
+
+    def __init__(self):
+        self.consultas = 0
+        self.tempo_banco = 0.0
+        self.linhas = 0
+
+
+medicao_atual: ContextVar[Optional[MedicaoRequisicao]] = ContextVar("medicao_atual", default=None)
+
+
+class Histograma:
+    def __init__(self, limites: Tuple[float, ...]):
+        self.limites = limites
+        self.contagens = [0] * (len(limites) + 1)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor: float) -> None:
+        self.contagens[bisect_left(self.limites, valor)] += 1
+        self.soma += valor
+        self.total += 1
+
+
+def formatar_rotulos(rotulos: Tuple[Tuple[str, str], ...]) -> str:
+    if not rotulos:
+        return ""
+    
+    pares = []
+    
+    for nome, valor in rotulos:
+        valor = str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pares.append(f'{nome}="{valor}"')
+    
+    return "{" + ",".join(pares) + "}"
+
+
+class RegistroMetricas:
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._contadores: Dict[str, Dict[tuple, float]] = {}
+        self._histogramas: Dict[str, Dict[tuple, Histograma]] = {}
+        self._limites: Dict[str, Tuple[float, ...]] = {}
+        self._medidores: Dict[str, Callable[[], float]] = {}
+        self._descricoes: Dict[str, Tuple[str, str]] = {}
+
+    def contador(self, nome: str, descricao: str) -> None:
+        self._descricoes[nome] = ("counter", descricao)
+        self._contadores[nome] = {}
+
+    def histograma(self, nome: str, descricao: str, limites: Tuple[float, ...]) -> None:
+        self._descricoes[nome] = ("histogram", descricao)
+        self._histogramas[nome] = {}
+        self._limites[nome] = limites
+
+    def medidor(self, nome: str, descricao: str, leitura: Callable[[], float]) -> None:
+        self._descricoes[nome] = ("gauge", descricao)
+        self._medidores[nome] = leitura
+
+    def incrementar(self, nome: str, valor: float = 1, **rotulos) -> None:
+        chave = tuple(sorted(rotulos.items()))
+        
+        with self._trava:
+            serie = self._contadores[nome]
+            serie[chave] = serie.get(chave, 0) + valor
+
+    def observar(self, nome: str, valor: float, **rotulos) -> None:
+        chave = tuple(sorted(rotulos.items()))
+        
+        with self._trava:
+            serie = self._histogramas[nome]
+            histograma = serie.get(chave)
+            
+            if histograma is None:
+                histograma = serie[chave] = Histograma(self._limites[nome])
+            
+            histograma.observar(valor)
+
+    def exportar(self) -> str:
+        linhas = []
+        
+        with self._trava:
+            for nome, (tipo, descricao) in self._descricoes.items():
+                linhas.append(f"# HELP {PREFIXO}_{nome} {descricao}")
+                linhas.append(f"# TYPE {PREFIXO}_{nome} {tipo}")
+                
+                if tipo == "counter":
+                    for rotulos, valor in sorted(self._contadores[nome].items()):
+                        linhas.append(f"{PREFIXO}_{nome}{formatar_rotulos(rotulos)} {valor:g}")
+                    continue
+                
+                if tipo == "gauge":
+                    linhas.append(f"{PREFIXO}_{nome} {self._medidores[nome]():g}")
+                    continue
+                
+                for rotulos, histograma in sorted(self._histogramas[nome].items(), key=lambda item: item[0]):
+                    acumulado = 0
+                    
+                    for limite, contagem in zip(histograma.limites, histograma.contagens):
+                        acumulado += contagem
+                        linhas.append(
+                            f"{PREFIXO}_{nome}_bucket{formatar_rotulos(rotulos + (('le', f'{limite:g}'),))} {acumulado}"
+                        )
+                    
+                    linhas.append(f"{PREFIXO}_{nome}_bucket{formatar_rotulos(rotulos + (('le', '+Inf'),))} {histograma.total}")
+                    linhas.append(f"{PREFIXO}_{nome}_sum{formatar_rotulos(rotulos)} {histograma.soma:g}")
+                    linhas.append(f"{PREFIXO}_{nome}_count{formatar_rotulos(rotulos)} {histograma.total}")
+        
+        return "\n".join(linhas) + "\n"
+
+
+registro_metricas = RegistroMetricas()
+registro_metricas.contador("requisicoes_total", "Requisicoes HTTP atendidas")
+registro_metricas.histograma("requisicao_duracao_segundos", "Latencia das requisicoes HTTP", LIMITES_DURACAO)
+registro_metricas.histograma("consultas_por_requisicao", "Consultas SQL executadas por requisicao", LIMITES_CONSULTAS)
+registro_metricas.contador("banco_consultas_total", "Consultas SQL executadas")
+registro_metricas.contador("banco_duracao_segundos_total", "Tempo gasto em consultas SQL")
+registro_metricas.contador("linhas_carregadas_total", "Objetos ORM carregados do banco")
+registro_metricas.histograma("resposta_bytes", "Tamanho do corpo das respostas (apos compressao)", LIMITES_BYTES)
+registro_metricas.contador("consultas_lentas_total", "Consultas acima de CONSULTA_LENTA_MS")
+
+
+class RegistroConsultasLentas:
+    def __init__(self, limite_ms: Optional[float], guardadas: int = CONSULTAS_LENTAS_GUARDADAS):
+        self.limite_ms = limite_ms
+        self._consultas = deque(maxlen=guardadas)
+
+    @property
+    def ativo(self) -> bool:
+        return self.limite_ms is not None
+
+    def registrar(self, consulta: dict) -> None:
+        self._consultas.append(consulta)
+        registro_metricas.incrementar("consultas_lentas_total")
+        logger_consultas.warning(
+            "Consulta lenta (%.1f ms): %s | parametros=%s | plano=%s",
+            consulta["duracao_ms"],
+            consulta["sql"],
+            consulta["parametros"],
+            "; ".join(consulta["plano"]) or "indisponivel"
+        )
+
+    def listar(self) -> List[dict]:
+        return list(reversed(self._consultas))
+
+
+consultas_lentas = RegistroConsultasLentas(float(CONSULTA_LENTA_MS) if CONSULTA_LENTA_MS else None)
+
+
+def capturar_plano(conexao, sql: str, parametros) -> List[str]:
+    dialeto = conexao.dialect.name
+    
+    if dialeto == "sqlite":
+        prefixo = "EXPLAIN QUERY PLAN "
+    elif dialeto == "postgresql":
+        prefixo = "EXPLAIN "
+    else:
+        return []
+    
+    explicacao = conexao.connection.dbapi_connection.cursor()
+    try:
+        explicacao.execute(prefixo + sql, parametros)
+        return [" ".join(str(coluna) for coluna in linha) for linha in explicacao.fetchall()]
+    except Exception as e:
+        return [f"erro ao capturar plano: {e}"]
+    finally:
+        explicacao.close()
+
+
+def antes_da_consulta(conexao, cursor, sql, parametros, contexto, varias):
+    conexao.info.setdefault("inicio_consultas", []).append(time.perf_counter())
+
+
+def depois_da_consulta(conexao, cursor, sql, parametros, contexto, varias):
+    duracao = time.perf_counter() - conexao.info["inicio_consultas"].pop()
+    medicao = medicao_atual.get()
+    
+    if medicao is not None:
+        medicao.consultas += 1
+        medicao.tempo_banco += duracao
+    else:
+        registro_metricas.incrementar("banco_consultas_total", rota="fora_de_requisicao")
+        registro_metricas.incrementar("banco_duracao_segundos_total", duracao, rota="fora_de_requisicao")
+    
+    if not consultas_lentas.ativo or duracao * 1000 < consultas_lentas.limite_ms:
+        return
+    
+    consultas_lentas.registrar({
+        "duracao_ms": round(duracao * 1000, 2),
+        "sql": sql,
+        "parametros": repr(parametros)[:500],
+        "plano": [] if varias else capturar_plano(conexao, sql, parametros),
+        "registrada_em": time.strftime("%Y-%m-%dT%H:%M:%S")
+    })
+
+
+def contar_linha_carregada(alvo, contexto):
+    medicao = medicao_atual.get()
+    
+    if medicao is not None:
+        medicao.linhas += 1
+
+
+def instrumentar_engine(engine) -> None:
+    if event.contains(engine, "before_cursor_execute", antes_da_consulta):
+        return
+    
+    event.listen(engine, "before_cursor_execute", antes_da_consulta)
+    event.listen(engine, "after_cursor_execute", depois_da_consulta)
+
+
+def instrumentar_modelos(base) -> None:
+    if not event.contains(base, "load", contar_linha_carregada):
+        event.listen(base, "load", contar_linha_carregada, propagate=True)
+
+
+def rota_da_requisicao(scope: Scope) -> str:
+    rota = scope.get("route")
+    return getattr(rota, "path", None) or "nao_encontrada"
+
+
+class MetricasMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        medicao = MedicaoRequisicao()
+        token = medicao_atual.set(medicao)
+        inicio = time.perf_counter()
+        status = 500
+        enviados = 0
+
+        async def enviar(mensagem: Message) -> None:
+            nonlocal status, enviados
+            
+            if mensagem["type"] == "http.response.start":
+                status = mensagem["status"]
+            elif mensagem["type"] == "http.response.body":
+                enviados += len(mensagem.get("body", b""))
+            
+            await send(mensagem)
+        
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            medicao_atual.reset(token)
+            self.registrar(scope, status, time.perf_counter() - inicio, enviados, medicao)
+
+    def registrar(self, scope: Scope, status: int, duracao: float, enviados: int, medicao: MedicaoRequisicao) -> None:
+        metodo = scope["method"]
+        rota = rota_da_requisicao(scope)
+        
+        registro_metricas.incrementar("requisicoes_total", metodo=metodo, rota=rota, status=str(status))
+        registro_metricas.observar("requisicao_duracao_segundos", duracao, metodo=metodo, rota=rota)
+        registro_metricas.observar("consultas_por_requisicao", medicao.consultas, metodo=metodo, rota=rota)
+        registro_metricas.observar("resposta_bytes", enviados, metodo=metodo, rota=rota)
+        
+        if medicao.consultas:
+            registro_metricas.incrementar("banco_consultas_total", medicao.consultas, metodo=metodo, rota=rota)
+            registro_metricas.incrementar("banco_duracao_segundos_total", medicao.tempo_banco, metodo=metodo, rota=rota)
+        
+        if medicao.linhas:
+            registro_metricas.incrementar("linhas_carregadas_total", medicao.linhas, metodo=metodo, rota=rota)
@@ -1,5 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, JSON
+from datetime import date
+from typing import Optional
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship
 from database import Base
+from versionamento import agora_utc
+
+JSONDocumento = JSON().with_variant(JSONB(), "postgresql")
 
 
 class Profissional(Base):
@@ -12,14 +20,108 @@ class Profissional(Base):
     resumo = Column(Text, nullable=False)
     localizacao = Column(String(100), nullable=False, index=True)
     area = Column(String(100), nullable=False, index=True)
-    habilidades_tecnicas = Column(JSON, nullable=False)
-    soft_skills = Column(JSON, nullable=False)
-    experiencias = Column(JSON, nullable=False)
-    formacao = Column(JSON, nullable=False)
-    projetos = Column(JSON, nullable=False)
-    certificacoes = Column(JSON, nullable=False)
-    idiomas = Column(JSON, nullable=False)
-    area_interesses = Column(JSON, nullable=False)
+    habilidades_tecnicas = Column(JSONDocumento, nullable=False)
+    soft_skills = Column(JSONDocumento, nullable=False)
+    experiencias = Column(JSONDocumento, nullable=False)
+    formacao = Column(JSONDocumento, nullable=False)
+    projetos = Column(JSONDocumento, nullable=False)
+    certificacoes = Column(JSONDocumento, nullable=False)
+    idiomas = Column(JSONDocumento, nullable=False)
+    area_interesses = Column(JSONDocumento, nullable=False)
+    anos_experiencia_base = Column(Integer)
+    cargos_atuais = Column(Integer)
+    cargo_recente = Column(String(200))
+    inicio_cargo_recente = Column(String(7))
+    versao = Column(Integer, nullable=False, default=1)
+    atualizado_em = Column(DateTime, default=agora_utc, onupdate=agora_utc)
+
+    indice_habilidades = relationship(
+        "HabilidadeProfissional",
+        cascade="all, delete-orphan"
+    )
+    indice_idiomas = relationship(
+        "IdiomaProfissional",
+        cascade="all, delete-orphan"
+    )
+
+    @hybrid_property
+    def anos_experiencia(self) -> Optional[int]:
+        if self.anos_experiencia_base is None:
+            return None
+        return self.anos_experiencia_base + self.cargos_atuais * date.today().year
+
+    @anos_experiencia.inplace.expression
+    @classmethod
+    def _anos_experiencia(cls):
+        return cls.anos_experiencia_base + cls.cargos_atuais * date.today().year
+
+    __table_args__ = (
+        Index("ix_profissionais_habilidades_gin", habilidades_tecnicas, postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_profissionais_idiomas_gin", idiomas, postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     def __repr__(self):
         return f"<Profissional(id={self.id}, nome='{self.nome}', cargo='{self.cargo}')>"
+
+
+class HabilidadeProfissional(Base):
+    __tablename__ = "habilidades_profissionais"
+
+    profissional_id = Column(
+        Integer,
+        ForeignKey("profissionais.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    habilidade = Column(String(200), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_habilidades_profissionais_habilidade", "habilidade", "profissional_id"),
+    )
+
+    def __repr__(self):
+        return f"<HabilidadeProfissional(profissional_id={self.profissional_id}, habilidade='{self.habilidade}')>"
+
+
+class IdiomaProfissional(Base):
+    __tablename__ = "idiomas_profissionais"
+
+    profissional_id = Column(
+        Integer,
+        ForeignKey("profissionais.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    idioma = Column(String(100), primary_key=True)
+    nivel = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_idiomas_profissionais_idioma_nivel", "idioma", "nivel", "profissional_id"),
+    )
+
+    def __repr__(self):
+        return f"<IdiomaProfissional(profissional_id={self.profissional_id}, idioma='{self.idioma}', nivel={self.nivel})>"
+
+
+class ContagemFaceta(Base):
+    __tablename__ = "contagens_facetas"
+
+    tipo = Column(String(20), primary_key=True)
+    valor = Column(String(200), primary_key=True)
+    quantidade = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ContagemFaceta(tipo='{self.tipo}', valor='{self.valor}', quantidade={self.quantidade})>"
+
+
+class TarefaDerivada(Base):
+    __tablename__ = "tarefas_derivadas"
+
+    profissional_id = Column(Integer, primary_key=True)
+    sequencia = Column(Integer, nullable=False, default=1)
+    eventos = Column(Integer, nullable=False, default=1)
+    tentativas = Column(Integer, nullable=False, default=0)
+    criado_em = Column(DateTime, nullable=False, default=agora_utc)
+    disponivel_em = Column(DateTime, nullable=False, default=agora_utc, index=True)
+    ultimo_erro = Column(Text)
+
+    def __repr__(self):
+        return f"<TarefaDerivada(profissional_id={self.profissional_id}, sequencia={self.sequencia}, tentativas={self.tentativas})>"
@@ -0,0 +1,275 @@
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+NIVEIS_IDIOMA = {
+    'Básico': 1,
+    'Intermediário': 2,
+    'Avançado': 3,
+    'Fluente': 4,
+    'Nativo': 5
+}
+
+HABILIDADES_CANONICAS = {
+    'AWS': ['amazon web services', 'amazon aws'],
+    'Adobe XD': ['xd'],
+    'After Effects': ['adobe after effects', 'ae'],
+    'Anatomia': [],
+    'Angular': ['angularjs', 'angular 2+'],
+    'Apache Spark': ['spark', 'pyspark'],
+    'Articulate Storyline': ['storyline'],
+    'Azure': ['microsoft azure'],
+    'Azure ML': ['azure machine learning'],
+    'C#': ['csharp', 'c sharp'],
+    'C++': ['cpp', 'cplusplus'],
+    'CI/CD': ['ci cd', 'integração contínua'],
+    'CRM': [],
+    'CSS': ['css3'],
+    'Camtasia': [],
+    'Canvas': ['canvas lms'],
+    'Content Marketing': ['marketing de conteúdo'],
+    'Copywriting': [],
+    'Design System': ['design systems'],
+    'Design Thinking': [],
+    'Django': [],
+    'Docker': [],
+    'EdTech Tools': ['edtech'],
+    'Email Marketing': ['e-mail marketing'],
+    'Excel': ['microsoft excel', 'ms excel'],
+    'Facebook Ads': ['meta ads'],
+    'FastAPI': [],
+    'Farmacologia': [],
+    'Figma': [],
+    'Flask': [],
+    'GCP': ['google cloud', 'google cloud platform'],
+    'Gestão de Saúde': [],
+    'Git': [],
+    'Go': ['golang'],
+    'Google Ads': ['adwords', 'google adwords'],
+    'Google Analytics': ['ga4'],
+    'Google Classroom': [],
+    'GraphQL': [],
+    'HTML': ['html5'],
+    'Hadoop': ['apache hadoop'],
+    'Illustrator': ['adobe illustrator'],
+    'InDesign': ['adobe indesign'],
+    'Instagram Marketing': [],
+    'Java': [],
+    'JavaScript': ['js', 'ecmascript', 'es6'],
+    'Keras': [],
+    'Kotlin': [],
+    'Kubernetes': ['k8s'],
+    'LMS': [],
+    'MLflow': [],
+    'Machine Learning': ['ml', 'aprendizado de máquina'],
+    'Marketing Automation': ['automação de marketing'],
+    'Metodologias Ativas': [],
+    'Microservices': ['microsserviços', 'microserviços', 'microservicos'],
+    'MongoDB': ['mongo'],
+    'Moodle': [],
+    'MySQL': [],
+    'Node.js': ['node', 'nodejs'],
+    'NumPy': [],
+    'Pandas': [],
+    'Photoshop': ['adobe photoshop'],
+    'PostgreSQL': ['postgres', 'postgre', 'psql'],
+    'Power BI': ['powerbi', 'microsoft power bi'],
+    'Power Point': ['powerpoint', 'microsoft powerpoint'],
+    'Prontuário Eletrônico': ['pep'],
+    'Protocolos Clínicos': [],
+    'Prototyping': ['prototipagem'],
+    'PyTorch': ['torch'],
+    'Python': ['python3', 'python 3'],
+    'R': ['linguagem r'],
+    'REST API': ['rest', 'restful', 'api rest', 'rest apis'],
+    'RabbitMQ': ['rabbit'],
+    'React': ['reactjs', 'react.js'],
+    'React Native': [],
+    'Redis': [],
+    'SEM': [],
+    'SEO': [],
+    'SQL': [],
+    'Scikit-learn': ['sklearn', 'scikit learn'],
+    'Sistemas Hospitalares': [],
+    'Sketch': [],
+    'Tableau': [],
+    'Telemedicina': [],
+    'TensorFlow': ['tf'],
+    'TypeScript': ['ts'],
+    'User Research': ['ux research', 'pesquisa com usuários'],
+    'Vue.js': ['vue', 'vuejs'],
+    'Wireframing': ['wireframes', 'wireframe']
+}
+
+LIMIAR_SIMILARIDADE_HABILIDADE = 0.3
+TAMANHO_MINIMO_APROXIMACAO = 3
+
+
+def remover_acentos(texto: str) -> str:
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(caractere for caractere in decomposto if not unicodedata.combining(caractere))
+
+
+def chave_habilidade(habilidade: str) -> str:
+    return " ".join(remover_acentos(habilidade).strip().lower().split())
+
+
+def compactar(chave: str) -> str:
+    return re.sub(r"[^a-z0-9+#]", "", chave)
+
+
+def montar_aliases() -> Dict[str, str]:
+    aliases = {}
+    
+    for canonica, variantes in HABILIDADES_CANONICAS.items():
+        for variante in [canonica] + variantes:
+            chave = chave_habilidade(variante)
+            aliases.setdefault(chave, canonica)
+            aliases.setdefault(compactar(chave), canonica)
+    
+    return aliases
+
+
+ALIASES_HABILIDADES = montar_aliases()
+
+
+def canonizar_habilidade(habilidade: str) -> str:
+    chave = chave_habilidade(habilidade)
+    canonica = ALIASES_HABILIDADES.get(chave) or ALIASES_HABILIDADES.get(compactar(chave))
+    
+    if canonica is not None:
+        return canonica
+    
+    return " ".join(habilidade.strip().split())
+
+
+def canonizar_habilidades(habilidades: List[str]) -> List[str]:
+    resultado = []
+    vistas = set()
+    
+    for habilidade in habilidades:
+        canonica = canonizar_habilidade(habilidade)
+        chave = chave_habilidade(canonica)
+        
+        if canonica and chave not in vistas:
+            vistas.add(chave)
+            resultado.append(canonica)
+    
+    return resultado
+
+
+def normalizar_habilidade(habilidade: str) -> str:
+    return chave_habilidade(canonizar_habilidade(habilidade))
+
+
+def normalizar_idioma(idioma: str) -> str:
+    return " ".join(remover_acentos(idioma).strip().lower().split())
+
+
+def extrair_niveis_idiomas(idiomas: List[dict]) -> dict:
+    niveis = {}
+    
+    for lang in idiomas:
+        idioma = normalizar_idioma(lang['idioma'])
+        niveis[idioma] = max(niveis.get(idioma, 0), NIVEIS_IDIOMA.get(lang['nivel'], 0))
+    
+    return niveis
+
+
+def trigramas(chave: str) -> Set[str]:
+    texto = f"  {chave} "
+    return {texto[indice:indice + 3] for indice in range(len(texto) - 2)}
+
+
+def distancia_edicao(a: str, b: str) -> int:
+    antepenultima = None
+    atual = list(range(len(b) + 1))
+    
+    for i in range(1, len(a) + 1):
+        anterior, linha = atual, [i] + [0] * len(b)
+        
+        for j in range(1, len(b) + 1):
+            linha[j] = min(
+                anterior[j] + 1,
+                linha[j - 1] + 1,
+                anterior[j - 1] + (a[i - 1] != b[j - 1])
+            )
+            
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                linha[j] = min(linha[j], antepenultima[j - 2] + 1)
+        
+        antepenultima, atual = anterior, linha
+    
+    return atual[len(b)]
+
+
+class VocabularioHabilidades:
+    def __init__(self, limiar: float = LIMIAR_SIMILARIDADE_HABILIDADE):
+        self.limiar = limiar
+        self._chaves: Set[str] = set()
+        self._trigramas: Dict[str, Set[str]] = {}
+        self._trava = threading.Lock()
+        self.carregado = False
+        self.adicionar(HABILIDADES_CANONICAS)
+
+    def adicionar(self, habilidades: Iterable[str]) -> None:
+        with self._trava:
+            for habilidade in habilidades:
+                chave = normalizar_habilidade(habilidade)
+                
+                if not chave or chave in self._chaves:
+                    continue
+                
+                self._chaves.add(chave)
+                
+                for trigrama in trigramas(chave):
+                    self._trigramas.setdefault(trigrama, set()).add(chave)
+
+    def carregar(self, habilidades: Iterable[str]) -> None:
+        self.adicionar(habilidades)
+        self.carregado = True
+
+    def resolver(self, termo: str) -> str:
+        chave = normalizar_habilidade(termo)
+        
+        with self._trava:
+            if chave in self._chaves or len(compactar(chave)) < TAMANHO_MINIMO_APROXIMACAO:
+                return chave
+            
+            alvo = trigramas(chave)
+            comuns = {}
+            
+            for trigrama in alvo:
+                for candidata in self._trigramas.get(trigrama, ()):
+                    comuns[candidata] = comuns.get(candidata, 0) + 1
+        
+        melhor: Optional[str] = None
+        melhor_nota = self.limiar
+        
+        for candidata, quantidade in sorted(comuns.items()):
+            nota = quantidade / (len(alvo) + len(trigramas(candidata)) - quantidade)
+            
+            if nota >= melhor_nota and (melhor is None or nota > melhor_nota):
+                melhor, melhor_nota = candidata, nota
+        
+        if melhor is not None:
+            return melhor
+        
+        limite = 1 if len(chave) < 8 else 2
+        proximas = sorted(
+            (distancia_edicao(chave, candidata), candidata)
+            for candidata in comuns
+            if abs(len(candidata) - len(chave)) <= limite
+        )
+        
+        if proximas and proximas[0][0] <= limite:
+            return proximas[0][1]
+        
+        return chave
+
+    def __len__(self) -> int:
+        return len(self._chaves)
+
+
+vocabulario_habilidades = VocabularioHabilidades()
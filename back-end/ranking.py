@@ -0,0 +1,281 @@
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from database import SessionLocal
+from models import Profissional, HabilidadeProfissional, IdiomaProfissional
+from normalizacao import NIVEIS_IDIOMA, normalizar_habilidade, normalizar_idioma
+
+load_dotenv()
+
+RANKING_TTL = float(os.getenv("RANKING_TTL", "300"))
+
+PESOS_RANKING = {
+    "desejaveis": 4.0,
+    "experiencia": 2.0,
+    "idiomas": 2.0,
+    "cidade": 1.0,
+    "area": 1.0
+}
+
+ANOS_TETO_RANKING = 15
+
+logger_ranking = logging.getLogger("futuroconecta.ranking")
+
+
+def codificar_valores(valores: List[Optional[str]]) -> Tuple[np.ndarray, Dict[str, int]]:
+    codigos = {}
+    array = np.fromiter(
+        (codigos.setdefault(valor, len(codigos)) for valor in valores),
+        dtype=np.int32,
+        count=len(valores)
+    )
+    return array, codigos
+
+
+class MatrizRanking:
+    def __init__(
+        self,
+        ids: np.ndarray,
+        anos: np.ndarray,
+        areas: List[Optional[str]],
+        cidades: List[Optional[str]],
+        habilidades: Dict[str, np.ndarray],
+        idiomas: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    ):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.anos = np.asarray(anos, dtype=np.int16)
+        self.fator_experiencia = (
+            np.clip(self.anos, 0, ANOS_TETO_RANKING).astype(np.float32) / ANOS_TETO_RANKING
+        )
+        self.codigos_area, self.valores_area = codificar_valores(areas)
+        self.codigos_cidade, self.valores_cidade = codificar_valores(cidades)
+        self.habilidades = {
+            habilidade: self._linhas(profissionais_ids)
+            for habilidade, profissionais_ids in habilidades.items()
+        }
+        self.idiomas = {}
+        
+        for idioma, (profissionais_ids, niveis) in idiomas.items():
+            linhas = np.searchsorted(self.ids, np.asarray(profissionais_ids, dtype=np.int64)).astype(np.int32)
+            self.idiomas[idioma] = (linhas, np.asarray(niveis, dtype=np.int8))
+
+    def _linhas(self, profissionais_ids) -> np.ndarray:
+        linhas = np.searchsorted(self.ids, np.asarray(profissionais_ids, dtype=np.int64)).astype(np.int32)
+        linhas.sort()
+        return linhas
+
+    @property
+    def tamanho(self) -> int:
+        return len(self.ids)
+
+    def memoria_bytes(self) -> int:
+        total = (
+            self.ids.nbytes + self.anos.nbytes + self.fator_experiencia.nbytes
+            + self.codigos_area.nbytes + self.codigos_cidade.nbytes
+        )
+        total += sum(linhas.nbytes for linhas in self.habilidades.values())
+        total += sum(linhas.nbytes + niveis.nbytes for linhas, niveis in self.idiomas.values())
+        return total
+
+    def ranquear(
+        self,
+        obrigatorias: List[str] = (),
+        desejaveis: List[str] = (),
+        anos_minimos: Optional[int] = None,
+        idiomas: List[Tuple[str, Optional[str]]] = (),
+        cidade: Optional[str] = None,
+        area: Optional[str] = None,
+        limite: int = 10
+    ) -> Tuple[List[int], List[float], int]:
+        n = self.tamanho
+        mascara = np.ones(n, dtype=bool)
+        
+        for habilidade in {normalizar_habilidade(skill) for skill in obrigatorias}:
+            linhas = self.habilidades.get(habilidade)
+            
+            if linhas is None:
+                return [], [], 0
+            
+            presentes = np.zeros(n, dtype=bool)
+            presentes[linhas] = True
+            mascara &= presentes
+        
+        if anos_minimos is not None:
+            mascara &= self.anos >= anos_minimos
+        
+        pontuacao = PESOS_RANKING["experiencia"] * self.fator_experiencia
+        
+        desejaveis = {normalizar_habilidade(skill) for skill in desejaveis}
+        
+        for habilidade in desejaveis:
+            linhas = self.habilidades.get(habilidade)
+            
+            if linhas is not None:
+                pontuacao[linhas] += PESOS_RANKING["desejaveis"] / len(desejaveis)
+        
+        for idioma, nivel_minimo in idiomas:
+            entrada = self.idiomas.get(normalizar_idioma(idioma))
+            
+            if entrada is None:
+                continue
+            
+            linhas, niveis = entrada
+            nivel = NIVEIS_IDIOMA.get(nivel_minimo, 0) if nivel_minimo else 0
+            pontuacao[linhas[niveis >= nivel]] += PESOS_RANKING["idiomas"] / len(idiomas)
+        
+        if cidade in self.valores_cidade:
+            pontuacao += PESOS_RANKING["cidade"] * (self.codigos_cidade == self.valores_cidade[cidade])
+        
+        if area in self.valores_area:
+            pontuacao += PESOS_RANKING["area"] * (self.codigos_area == self.valores_area[area])
+        
+        candidatos = np.flatnonzero(mascara)
+        total = len(candidatos)
+        
+        if total > limite:
+            notas = pontuacao[candidatos]
+            limiar = np.partition(notas, total - limite)[total - limite]
+            acima = candidatos[notas > limiar]
+            empatados = candidatos[notas == limiar][:limite - len(acima)]
+            candidatos = np.concatenate([acima, empatados])
+        
+        ordem = np.lexsort((candidatos, -pontuacao[candidatos]))
+        escolhidos = candidatos[ordem]
+        
+        return self.ids[escolhidos].tolist(), pontuacao[escolhidos].astype(np.float64).round(4).tolist(), total
+
+
+def montar_matriz_ranking(db: Session) -> MatrizRanking:
+    perfis = db.execute(
+        select(
+            Profissional.id,
+            Profissional.anos_experiencia,
+            Profissional.area,
+            Profissional.localizacao
+        ).order_by(Profissional.id)
+    ).all()
+    
+    ids = np.fromiter((perfil[0] for perfil in perfis), dtype=np.int64, count=len(perfis))
+    anos = np.fromiter(
+        (perfil[1] if perfil[1] is not None else -1 for perfil in perfis),
+        dtype=np.int16,
+        count=len(perfis)
+    )
+    
+    habilidades = {}
+    consulta = select(HabilidadeProfissional.habilidade, HabilidadeProfissional.profissional_id)
+    
+    for habilidade, profissional_id in db.execute(consulta):
+        habilidades.setdefault(habilidade, []).append(profissional_id)
+    
+    idiomas = {}
+    consulta = select(IdiomaProfissional.idioma, IdiomaProfissional.profissional_id, IdiomaProfissional.nivel)
+    
+    for idioma, profissional_id, nivel in db.execute(consulta):
+        profissionais_ids, niveis = idiomas.setdefault(idioma, ([], []))
+        profissionais_ids.append(profissional_id)
+        niveis.append(nivel)
+    
+    return MatrizRanking(
+        ids,
+        anos,
+        [perfil[2] for perfil in perfis],
+        [perfil[3] for perfil in perfis],
+        habilidades,
+        idiomas
+    )
+
+
+class IndiceRanking:
+    def __init__(self, ttl: float = RANKING_TTL, fabrica_sessao=SessionLocal):
+        self.ttl = ttl
+        self.fabrica_sessao = fabrica_sessao
+        self._matriz = None
+        self._montada_em = 0.0
+        self._versao = 0
+        self._versao_matriz = -1
+        self._trava = threading.Lock()
+        self._reconstruindo = False
+        self.reconstrucoes = 0
+        self.duracao_montagem = 0.0
+
+    def invalidar(self) -> None:
+        self._versao += 1
+
+    def _atual(self) -> bool:
+        return (
+            self._matriz is not None
+            and self._versao_matriz == self._versao
+            and time.monotonic() - self._montada_em < self.ttl
+        )
+
+    def _montar(self, db: Session) -> MatrizRanking:
+        with self._trava:
+            if self._atual():
+                return self._matriz
+            
+            versao = self._versao
+            inicio = time.monotonic()
+            matriz = montar_matriz_ranking(db)
+            
+            self._matriz = matriz
+            self._versao_matriz = versao
+            self._montada_em = inicio
+            self.reconstrucoes += 1
+            self.duracao_montagem = time.monotonic() - inicio
+            
+            return matriz
+
+    def _reconstruir_em_segundo_plano(self) -> None:
+        db = self.fabrica_sessao()
+        try:
+            while not self._atual():
+                self._montar(db)
+                db.rollback()
+        except Exception:
+            logger_ranking.exception("Falha ao remontar a matriz de ranking")
+        finally:
+            db.close()
+            self._reconstruindo = False
+
+    def _agendar_reconstrucao(self) -> None:
+        with self._trava:
+            if self._reconstruindo:
+                return
+            
+            self._reconstruindo = True
+        
+        threading.Thread(target=self._reconstruir_em_segundo_plano, name="ranking", daemon=True).start()
+
+    def obter_matriz(self, db: Session) -> MatrizRanking:
+        if self._atual():
+            return self._matriz
+        
+        if self._matriz is not None and self.fabrica_sessao is not None:
+            self._agendar_reconstrucao()
+            return self._matriz
+        
+        return self._montar(db)
+
+    def estatisticas(self) -> dict:
+        matriz = self._matriz
+        
+        return {
+            "perfis": matriz.tamanho if matriz else 0,
+            "habilidades": len(matriz.habilidades) if matriz else 0,
+            "memoria_bytes": matriz.memoria_bytes() if matriz else 0,
+            "atualizado": self._atual(),
+            "reconstrucoes": self.reconstrucoes,
+            "reconstruindo": self._reconstruindo,
+            "duracao_montagem_ms": round(self.duracao_montagem * 1000, 2),
+            "ttl": self.ttl
+        }
+
+
+indice_ranking = IndiceRanking()
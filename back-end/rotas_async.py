@@ -0,0 +1,204 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from typing import List, Optional
+from pydantic import ValidationError
+
+import crud_async
+from database import AsyncSessionLocal
+from serializacao import responder_profissionais, responder_pagina, responder_perfil, campos_da_requisicao
+from schemas import ProfissionalCreate, ProfissionalResponse, ProfissionalUpdate, OperacaoPatch, PaginaProfissionais, NivelIdioma
+from versionamento import versoes_do_if_match, cabecalhos_do_perfil, ConflitoVersao, erro_de_conflito
+
+rotas_async = APIRouter()
+
+
+@rotas_async.post("/api/profissionais", response_model=ProfissionalResponse, status_code=201)
+async def criar_novo_profissional(profissional: ProfissionalCreate):
+    async with AsyncSessionLocal() as db:
+        try:
+            return await crud_async.criar_profissional(db, profissional)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+
+@rotas_async.get("/api/profissionais", response_model=List[ProfissionalResponse])
+async def listar_profissionais(
+    skip: int = Query(0, ge=0, description="Número de registros para pular"),
+    limit: int = Query(100, ge=1, le=100, description="Número máximo de registros"),
+    area: Optional[str] = Query(None, description="Filtrar por área"),
+    cidade: Optional[str] = Query(None, description="Filtrar por cidade"),
+    tecnologia: Optional[str] = Query(None, description="Filtrar por tecnologia"),
+    anos_minimos: Optional[int] = Query(None, ge=0, description="Mínimo de anos de experiência"),
+    idioma: Optional[str] = Query(None, description="Filtrar por idioma"),
+    nivel_minimo: Optional[NivelIdioma] = Query(None, description="Nível mínimo no idioma (requer idioma)"),
+    busca: Optional[str] = Query(None, description="Busca textual"),
+    campos: Optional[List[str]] = Depends(campos_da_requisicao)
+):
+    async with AsyncSessionLocal() as db:
+        if busca or area or cidade or tecnologia or idioma or anos_minimos is not None:
+            profissionais = await crud_async.buscar_profissionais(
+                db=db,
+                termo_busca=busca,
+                area=area,
+                cidade=cidade,
+                tecnologia=tecnologia,
+                anos_minimos=anos_minimos,
+                idioma=idioma,
+                nivel_minimo=nivel_minimo,
+                skip=skip,
+                limit=limit,
+                campos=campos
+            )
+        else:
+            profissionais = await crud_async.obter_todos_profissionais(db, skip=skip, limit=limit, campos=campos)
+        
+        return responder_profissionais(profissionais, campos)
+
+
+@rotas_async.get("/api/profissionais/pagina", response_model=PaginaProfissionais)
+async def listar_profissionais_por_cursor(
+    cursor: Optional[str] = Query(None, description="Cursor retornado em next_cursor pela página anterior"),
+    limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros"),
+    area: Optional[str] = Query(None, description="Filtrar por área"),
+    cidade: Optional[str] = Query(None, description="Filtrar por cidade"),
+    tecnologia: Optional[str] = Query(None, description="Filtrar por tecnologia"),
+    anos_minimos: Optional[int] = Query(None, ge=0, description="Mínimo de anos de experiência"),
+    idioma: Optional[str] = Query(None, description="Filtrar por idioma"),
+    nivel_minimo: Optional[NivelIdioma] = Query(None, description="Nível mínimo no idioma (requer idioma)"),
+    busca: Optional[str] = Query(None, description="Busca textual"),
+    campos: Optional[List[str]] = Depends(campos_da_requisicao)
+):
+    async with AsyncSessionLocal() as db:
+        try:
+            profissionais, proximo_cursor = await crud_async.buscar_profissionais_por_cursor(
+                db=db,
+                termo_busca=busca,
+                area=area,
+                cidade=cidade,
+                tecnologia=tecnologia,
+                anos_minimos=anos_minimos,
+                idioma=idioma,
+                nivel_minimo=nivel_minimo,
+                cursor=cursor,
+                limit=limit,
+                campos=campos
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return responder_pagina(profissionais, proximo_cursor, campos)
+
+
+@rotas_async.get("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
+async def obter_profissional(profissional_id: int, request: Request):
+    async with AsyncSessionLocal() as db:
+        profissional = await crud_async.obter_profissional_serializado(db, profissional_id)
+        
+        if profissional is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profissional com ID {profissional_id} não encontrado"
+            )
+        
+        return responder_perfil(request, profissional)
+
+
+@rotas_async.put("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
+async def atualizar_dados_profissional(
+    profissional_id: int,
+    profissional: ProfissionalUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    async with AsyncSessionLocal() as db:
+        try:
+            profissional_atualizado = await crud_async.atualizar_profissional(
+                db,
+                profissional_id,
+                profissional,
+                versoes_do_if_match(if_match, profissional_id)
+            )
+        except ConflitoVersao as e:
+            raise erro_de_conflito(e, if_match)
+        
+        if profissional_atualizado is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profissional com ID {profissional_id} não encontrado"
+            )
+        
+        response.headers.update(cabecalhos_do_perfil(profissional_atualizado))
+        return profissional_atualizado
+
+
+@rotas_async.patch("/api/profissionais/{profissional_id}", response_model=ProfissionalResponse)
+async def alterar_dados_profissional(
+    profissional_id: int,
+    operacoes: List[OperacaoPatch],
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    async with AsyncSessionLocal() as db:
+        try:
+            profissional_alterado = await crud_async.alterar_profissional(
+                db,
+                profissional_id,
+                operacoes,
+                versoes_do_if_match(if_match, profissional_id)
+            )
+        except ConflitoVersao as e:
+            raise erro_de_conflito(e, if_match)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=e.errors(include_url=False, include_context=False, include_input=False)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        if profissional_alterado is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profissional com ID {profissional_id} não encontrado"
+            )
+        
+        response.headers.update(cabecalhos_do_perfil(profissional_alterado))
+        return profissional_alterado
+
+
+@rotas_async.delete("/api/profissionais/{profissional_id}", status_code=204)
+async def deletar_profissional_por_id(profissional_id: int):
+    async with AsyncSessionLocal() as db:
+        sucesso = await crud_async.deletar_profissional(db, profissional_id)
+        
+        if not sucesso:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profissional com ID {profissional_id} não encontrado"
+            )
+        
+        return None
+
+
+@rotas_async.get("/api/areas", response_model=List[str])
+async def listar_areas():
+    async with AsyncSessionLocal() as db:
+        return await crud_async.obter_areas_unicas(db)
+
+
+@rotas_async.get("/api/cidades", response_model=List[str])
+async def listar_cidades():
+    async with AsyncSessionLocal() as db:
+        return await crud_async.obter_cidades_unicas(db)
+
+
+@rotas_async.get("/api/tecnologias", response_model=List[str])
+async def listar_tecnologias():
+    async with AsyncSessionLocal() as db:
+        return await crud_async.obter_tecnologias_unicas(db)
+
+
+@rotas_async.get("/api/profissionais/tecnologia/{tecnologia}", response_model=List[ProfissionalResponse])
+async def listar_profissionais_por_tecnologia(tecnologia: str):
+    async with AsyncSessionLocal() as db:
+        profissionais = await crud_async.obter_profissionais_com_tecnologia(db, tecnologia)
+        return responder_profissionais(profissionais)
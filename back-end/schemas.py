@@ -1,14 +1,32 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+import re
+from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, List, Literal, Optional
+
+
+NivelIdioma = Literal['Básico', 'Intermediário', 'Avançado', 'Fluente', 'Nativo']
+
+PADRAO_MES = r"^\d{4}-(0[1-9]|1[0-2])$"
 
 
 class ExperienciaSchema(BaseModel):
     empresa: str
     cargo: str
-    inicio: str
+    inicio: str = Field(..., pattern=PADRAO_MES)
     fim: str
     descricao: str
 
+    @field_validator("fim")
+    @classmethod
+    def validar_fim(cls, valor: str) -> str:
+        if valor.strip().lower() == "atual":
+            return "Atual"
+        
+        if not re.match(PADRAO_MES, valor):
+            raise ValueError("use o formato AAAA-MM ou 'Atual'")
+        
+        return valor
+
 
 class FormacaoSchema(BaseModel):
     curso: str
@@ -49,24 +67,97 @@ class ProfissionalCreate(ProfissionalBase):
 
 
 class ProfissionalUpdate(BaseModel):
-    nome: Optional[str] = None
+    nome: Optional[str] = Field(None, min_length=3, max_length=200)
     foto: Optional[str] = None
-    cargo: Optional[str] = None
-    resumo: Optional[str] = None
-    localizacao: Optional[str] = None
-    area: Optional[str] = None
-    habilidades_tecnicas: Optional[List[str]] = None
-    soft_skills: Optional[List[str]] = None
-    experiencias: Optional[List[ExperienciaSchema]] = None
-    formacao: Optional[List[FormacaoSchema]] = None
+    cargo: Optional[str] = Field(None, min_length=3, max_length=200)
+    resumo: Optional[str] = Field(None, min_length=10)
+    localizacao: Optional[str] = Field(None, min_length=3, max_length=100)
+    area: Optional[str] = Field(None, min_length=3, max_length=100)
+    habilidades_tecnicas: Optional[List[str]] = Field(None, min_items=1)
+    soft_skills: Optional[List[str]] = Field(None, min_items=1)
+    experiencias: Optional[List[ExperienciaSchema]] = Field(None, min_items=1)
+    formacao: Optional[List[FormacaoSchema]] = Field(None, min_items=1)
     projetos: Optional[List[ProjetoSchema]] = None
     certificacoes: Optional[List[str]] = None
-    idiomas: Optional[List[IdiomaSchema]] = None
+    idiomas: Optional[List[IdiomaSchema]] = Field(None, min_items=1)
     area_interesses: Optional[List[str]] = None
 
+    @field_validator("*")
+    @classmethod
+    def rejeitar_nulo(cls, valor):
+        if valor is None:
+            raise ValueError("o campo não pode ser nulo")
+        return valor
+
 
 class ProfissionalResponse(ProfissionalBase):
     id: int
+    versao: int = 1
+    atualizado_em: Optional[datetime] = None
 
     class Config:
         from_attributes = True
+
+
+class PaginaProfissionais(BaseModel):
+    itens: List[ProfissionalResponse]
+    next_cursor: Optional[str] = None
+
+
+class OperacaoPatch(BaseModel):
+    op: Literal['add', 'remove', 'replace']
+    path: str
+    value: Any = None
+
+
+class ProfissionalAtualizacaoLote(ProfissionalUpdate):
+    id: int
+    versao: Optional[int] = Field(None, ge=1)
+
+
+class RemocaoLote(BaseModel):
+    ids: List[int] = Field(..., min_items=1)
+
+
+class ResultadoItemLote(BaseModel):
+    indice: int
+    status: int
+    id: Optional[int] = None
+    erro: Optional[Any] = None
+
+
+class ResultadoLote(BaseModel):
+    sucesso: int
+    falhas: int
+    resultados: List[ResultadoItemLote]
+
+
+class RequisitoIdioma(BaseModel):
+    idioma: str
+    nivel_minimo: Optional[NivelIdioma] = None
+
+
+class VagaRanking(BaseModel):
+    habilidades_obrigatorias: List[str] = []
+    habilidades_desejaveis: List[str] = []
+    anos_minimos: Optional[int] = Field(None, ge=0)
+    idiomas: List[RequisitoIdioma] = []
+    cidade: Optional[str] = None
+    area: Optional[str] = None
+    limit: int = Field(10, ge=1, le=100)
+
+
+class ProfissionalRanqueado(BaseModel):
+    pontuacao: float
+    profissional: ProfissionalResponse
+
+
+class ResultadoRanking(BaseModel):
+    total_candidatos: int
+    itens: List[ProfissionalRanqueado]
+
+
+class Sugestao(BaseModel):
+    tipo: str
+    valor: str
+    quantidade: int
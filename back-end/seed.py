@@ -1,32 +1,104 @@
+import argparse
 import json
 import os
-from sqlalchemy.orm import Session
-from database import SessionLocal, engine, Base
+import time
+from typing import Iterator, List
+from sqlalchemy import insert
+from database import SessionLocal, engine, Base, insert_com_conflito, atualizar_esquema
 from models import Profissional
+from crud import reconstruir_indice_habilidades, reconstruir_indice_idiomas, contar_profissionais_por_area, calcular_resumo_experiencia
+from busca import criar_indice_busca, reconstruir_indice_busca
+from facetas import reconstruir_facetas
+from normalizacao import canonizar_habilidades
+from versionamento import agora_utc, criar_controle_versao
+
+CAMINHO_PADRAO = os.path.join("..", "src", "data", "profissionais.json")
+
+CAMPOS_PROFISSIONAL = [
+    'nome', 'foto', 'cargo', 'resumo', 'localizacao', 'area',
+    'habilidades_tecnicas', 'soft_skills', 'experiencias', 'formacao',
+    'projetos', 'certificacoes', 'idiomas', 'area_interesses',
+    'anos_experiencia_base', 'cargos_atuais', 'cargo_recente', 'inicio_cargo_recente'
+]
 
 
 def limpar_banco_dados():
     print("Limpando banco de dados...")
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    criar_indice_busca(engine)
+    criar_controle_versao(engine)
     print("Banco de dados limpo e recriado!")
 
 
-def carregar_dados_json() -> list:
-    caminho_json = os.path.join("..", "src", "data", "profissionais.json")
+def _ler_array_json(arquivo, tamanho_bloco: int = 65536) -> Iterator[dict]:
+    decodificador = json.JSONDecoder()
+    buffer = ""
+    iniciou = False
     
-    if not os.path.exists(caminho_json):
-        print(f"[ERRO] Arquivo nao encontrado em {caminho_json}")
-        return []
+    while True:
+        bloco = arquivo.read(tamanho_bloco)
+        buffer += bloco
+        posicao = 0
+        
+        while True:
+            while posicao < len(buffer) and buffer[posicao] in " \t\r\n,":
+                posicao += 1
+            
+            if posicao >= len(buffer):
+                break
+            
+            if not iniciou:
+                if buffer[posicao] != "[":
+                    raise ValueError("O arquivo JSON deve conter uma lista de perfis")
+                iniciou = True
+                posicao += 1
+                continue
+            
+            if buffer[posicao] == "]":
+                return
+            
+            try:
+                perfil, posicao = decodificador.raw_decode(buffer, posicao)
+            except json.JSONDecodeError:
+                break
+            
+            yield perfil
+        
+        buffer = buffer[posicao:]
+        
+        if not bloco:
+            if buffer.strip():
+                raise ValueError("Arquivo JSON incompleto")
+            return
+
+
+def _ler_ndjson(arquivo) -> Iterator[dict]:
+    for linha in arquivo:
+        if linha.strip():
+            yield json.loads(linha)
+
+
+def ler_perfis(caminho_arquivo: str) -> Iterator[dict]:
+    with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
+        if caminho_arquivo.endswith((".ndjson", ".jsonl")):
+            yield from _ler_ndjson(arquivo)
+        else:
+            yield from _ler_array_json(arquivo)
+
+
+def ler_em_lotes(perfis: Iterator[dict], tamanho_lote: int) -> Iterator[List[dict]]:
+    lote = []
     
-    try:
-        with open(caminho_json, 'r', encoding='utf-8') as arquivo:
-            dados = json.load(arquivo)
-            print(f"[OK] Carregados {len(dados)} perfis do arquivo JSON")
-            return dados
-    except Exception as e:
-        print(f"[ERRO] Erro ao ler arquivo JSON: {e}")
-        return []
+    for perfil in perfis:
+        lote.append(perfil)
+        
+        if len(lote) >= tamanho_lote:
+            yield lote
+            lote = []
+    
+    if lote:
+        yield lote
 
 
 def mapear_campos_json_para_db(perfil_json: dict) -> dict:
@@ -64,91 +136,137 @@ def validar_perfil(perfil: dict) -> bool:
     return True
 
 
-def inserir_perfil(db: Session, perfil_json: dict) -> bool:
-    try:
+def montar_linha(perfil_db: dict) -> dict:
+    linha = {
+        'nome': perfil_db['nome'],
+        'foto': perfil_db.get('foto', ''),
+        'cargo': perfil_db['cargo'],
+        'resumo': perfil_db['resumo'],
+        'localizacao': perfil_db['localizacao'],
+        'area': perfil_db['area'],
+        'habilidades_tecnicas': canonizar_habilidades(perfil_db['habilidades_tecnicas']),
+        'soft_skills': perfil_db['soft_skills'],
+        'experiencias': perfil_db['experiencias'],
+        'formacao': perfil_db['formacao'],
+        'projetos': perfil_db.get('projetos', []),
+        'certificacoes': perfil_db.get('certificacoes', []),
+        'idiomas': perfil_db['idiomas'],
+        'area_interesses': perfil_db.get('area_interesses', [])
+    }
+    linha.update(calcular_resumo_experiencia(linha['experiencias']))
+    
+    if perfil_db.get('id') is not None:
+        linha['id'] = int(perfil_db['id'])
+    
+    return linha
+
+
+def validar_lote(lote: List[dict]) -> List[dict]:
+    linhas = []
+    
+    for perfil_json in lote:
         perfil_db = mapear_campos_json_para_db(perfil_json)
         
-        if not validar_perfil(perfil_db):
-            return False
-        
-        novo_profissional = Profissional(
-            nome=perfil_db['nome'],
-            foto=perfil_db.get('foto', ''),
-            cargo=perfil_db['cargo'],
-            resumo=perfil_db['resumo'],
-            localizacao=perfil_db['localizacao'],
-            area=perfil_db['area'],
-            habilidades_tecnicas=perfil_db['habilidades_tecnicas'],
-            soft_skills=perfil_db['soft_skills'],
-            experiencias=perfil_db['experiencias'],
-            formacao=perfil_db['formacao'],
-            projetos=perfil_db.get('projetos', []),
-            certificacoes=perfil_db.get('certificacoes', []),
-            idiomas=perfil_db['idiomas'],
-            area_interesses=perfil_db.get('area_interesses', [])
-        )
-        
-        db.add(novo_profissional)
-        return True
+        if validar_perfil(perfil_db):
+            linhas.append(montar_linha(perfil_db))
+    
+    return linhas
+
+
+def inserir_lote(db, linhas: List[dict], incremental: bool) -> None:
+    com_id = [linha for linha in linhas if 'id' in linha]
+    sem_id = [linha for linha in linhas if 'id' not in linha]
+    
+    if com_id:
+        if incremental:
+            comando = insert_com_conflito(db.bind, Profissional.__table__)
+            comando = comando.on_conflict_do_update(
+                index_elements=['id'],
+                set_={
+                    **{campo: comando.excluded[campo] for campo in CAMPOS_PROFISSIONAL},
+                    'versao': Profissional.__table__.c.versao + 1,
+                    'atualizado_em': agora_utc()
+                }
+            )
+        else:
+            comando = insert(Profissional.__table__)
         
-    except Exception as e:
-        print(f"[ERRO] Erro ao inserir perfil: {e}")
-        return False
+        db.execute(comando, com_id)
+    
+    if sem_id:
+        db.execute(insert(Profissional.__table__), sem_id)
+
+
+def reconstruir_dados_derivados(db) -> None:
+    print("Reconstruindo indices e contagens...")
+    reconstruir_indice_habilidades(db)
+    reconstruir_indice_idiomas(db)
+    reconstruir_indice_busca(db)
+    reconstruir_facetas(db)
 
 
-def popular_banco_dados():
+def popular_banco_dados(
+    caminho_arquivo: str = CAMINHO_PADRAO,
+    tamanho_lote: int = 1000,
+    incremental: bool = False
+):
     print("\n" + "="*60)
     print("INICIANDO POPULACAO DO BANCO DE DADOS")
     print("="*60 + "\n")
     
-    limpar_banco_dados()
-    perfis_json = carregar_dados_json()
-    
-    if not perfis_json:
-        print("[ERRO] Nenhum dado para inserir. Encerrando...")
+    if not os.path.exists(caminho_arquivo):
+        print(f"[ERRO] Arquivo nao encontrado em {caminho_arquivo}")
         return
     
+    if incremental:
+        Base.metadata.create_all(bind=engine)
+        atualizar_esquema(engine)
+        criar_indice_busca(engine)
+        criar_controle_versao(engine)
+    else:
+        limpar_banco_dados()
+    
     db = SessionLocal()
     
     try:
-        total_perfis = len(perfis_json)
+        total_perfis = 0
         sucesso = 0
-        erros = 0
+        inicio = time.perf_counter()
         
-        print(f"Processando {total_perfis} perfis...\n")
+        print(f"Importando {caminho_arquivo} em lotes de {tamanho_lote}...\n")
         
-        for indice, perfil in enumerate(perfis_json, start=1):
-            if inserir_perfil(db, perfil):
-                sucesso += 1
-                print(f"[OK] [{indice}/{total_perfis}] {perfil['nome']} - {perfil['cargo']}")
-            else:
-                erros += 1
-                print(f"[ERRO] [{indice}/{total_perfis}] Erro ao inserir: {perfil.get('nome', 'Desconhecido')}")
+        for lote in ler_em_lotes(ler_perfis(caminho_arquivo), tamanho_lote):
+            linhas = validar_lote(lote)
+            inserir_lote(db, linhas, incremental)
+            db.commit()
+            
+            total_perfis += len(lote)
+            sucesso += len(linhas)
+            decorrido = time.perf_counter() - inicio
+            print(f"[OK] {sucesso} perfis importados ({sucesso / decorrido:.0f} perfis/s)")
         
-        db.commit()
+        importacao = time.perf_counter() - inicio
+        reconstruir_dados_derivados(db)
+        duracao = time.perf_counter() - inicio
+        erros = total_perfis - sucesso
         
         print("\n" + "="*60)
         print("ESTATISTICAS FINAIS")
         print("="*60)
         print(f"[OK] Perfis inseridos com sucesso: {sucesso}")
         print(f"[ERRO] Erros: {erros}")
-        print(f"Taxa de sucesso: {(sucesso/total_perfis)*100:.1f}%")
+        
+        if total_perfis > 0:
+            print(f"Taxa de sucesso: {(sucesso/total_perfis)*100:.1f}%")
+            print(f"Velocidade de importacao: {sucesso / importacao:.0f} perfis/s")
+            print(f"Tempo total (com indices): {duracao:.2f}s")
         
         if sucesso > 0:
             print("\n" + "-"*60)
             print("DISTRIBUICAO POR AREA")
             print("-"*60)
             
-            contagem_areas = {}
-            
-            for perfil in perfis_json:
-                area = perfil['area']
-                if area in contagem_areas:
-                    contagem_areas[area] += 1
-                else:
-                    contagem_areas[area] = 1
-            
-            for area, quantidade in sorted(contagem_areas.items()):
+            for area, quantidade in sorted(contar_profissionais_por_area(db).items()):
                 print(f"  - {area}: {quantidade} profissionais")
         
         print("\n" + "="*60)
@@ -181,7 +299,7 @@ def verificar_banco_populado():
         print("\nPrimeiros 5 profissionais:")
         print("-"*60)
         
-        primeiros = db.query(Profissional).limit(5).all()
+        primeiros = db.query(Profissional).order_by(Profissional.id).limit(5).all()
         
         for prof in primeiros:
             print(f"  - ID {prof.id}: {prof.nome} - {prof.cargo} ({prof.area})")
@@ -189,16 +307,7 @@ def verificar_banco_populado():
         print("\nProfissionais por area:")
         print("-"*60)
         
-        todos = db.query(Profissional).all()
-        areas = {}
-        
-        for prof in todos:
-            if prof.area in areas:
-                areas[prof.area] += 1
-            else:
-                areas[prof.area] = 1
-        
-        for area, qtd in sorted(areas.items()):
+        for area, qtd in sorted(contar_profissionais_por_area(db).items()):
             print(f"  - {area}: {qtd} profissionais")
         
         print("\n[OK] Verificacao concluida!")
@@ -212,7 +321,13 @@ def verificar_banco_populado():
 
 
 if __name__ == "__main__":
-    popular_banco_dados()
+    parser = argparse.ArgumentParser(description="Importa perfis profissionais (JSON ou NDJSON) para o banco")
+    parser.add_argument("--arquivo", default=CAMINHO_PADRAO, help="Arquivo .json (lista) ou .ndjson/.jsonl")
+    parser.add_argument("--lote", type=int, default=1000, help="Quantidade de perfis por lote de insercao")
+    parser.add_argument("--incremental", action="store_true", help="Atualiza perfis existentes pelo id em vez de recriar o banco")
+    argumentos = parser.parse_args()
+    
+    popular_banco_dados(argumentos.arquivo, argumentos.lote, argumentos.incremental)
     verificar_banco_populado()
     
     print("\nProcesso finalizado! O banco de dados esta pronto para uso.")
@@ -0,0 +1,263 @@
+import csv
+import io
+import os
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Tuple
+import orjson
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter, create_model
+from models import Profissional
+from schemas import (
+    ProfissionalResponse,
+    ExperienciaSchema,
+    FormacaoSchema,
+    ProjetoSchema,
+    IdiomaSchema
+)
+from versionamento import (
+    etag_do_perfil,
+    segundos_do_perfil,
+    nao_modificado,
+    cabecalhos_versionados,
+    resposta_nao_modificada
+)
+
+SERIALIZACAO_RAPIDA = os.getenv("SERIALIZACAO_RAPIDA", "true").lower() in ("1", "true", "sim")
+
+CAMPOS_PROFISSIONAL = list(ProfissionalResponse.model_fields)
+
+CAMPOS_CARD = ["nome", "foto", "cargo", "resumo", "localizacao", "area", "habilidades_tecnicas", "id"]
+
+CARD_MAX_HABILIDADES = int(os.getenv("CARD_MAX_HABILIDADES", "5"))
+CARD_TAMANHO_RESUMO = int(os.getenv("CARD_TAMANHO_RESUMO", "160"))
+
+CONJUNTOS_CAMPOS = {
+    "card": CAMPOS_CARD
+}
+
+CAMPOS_ANINHADOS = {
+    "experiencias": list(ExperienciaSchema.model_fields),
+    "formacao": list(FormacaoSchema.model_fields),
+    "projetos": list(ProjetoSchema.model_fields),
+    "idiomas": list(IdiomaSchema.model_fields)
+}
+
+
+class RespostaJSONRapida(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def resolver_campos(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    
+    if fields in CONJUNTOS_CAMPOS:
+        return CONJUNTOS_CAMPOS[fields]
+    
+    campos = ["id"]
+    
+    for campo in fields.split(","):
+        campo = campo.strip()
+        
+        if not campo or campo in campos:
+            continue
+        
+        if campo not in CAMPOS_PROFISSIONAL:
+            raise ValueError(f"Campo '{campo}' inválido em fields")
+        
+        campos.append(campo)
+    
+    return [campo for campo in CAMPOS_PROFISSIONAL if campo in campos]
+
+
+def campos_da_requisicao(
+    fields: Optional[str] = Query(
+        None,
+        description="Campos separados por vírgula (ex.: nome,cargo) ou 'card' para a versão compacta"
+    )
+) -> Optional[List[str]]:
+    try:
+        return resolver_campos(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@lru_cache(maxsize=128)
+def modelo_projecao(campos: Tuple[str, ...]):
+    definicoes = {
+        campo: (ProfissionalResponse.model_fields[campo].annotation, ...)
+        for campo in campos
+    }
+    nome = "ProfissionalCard" if list(campos) == CAMPOS_CARD else "ProfissionalProjecao"
+    
+    return create_model(nome, **definicoes)
+
+
+def encurtar_texto(texto: str, tamanho: int) -> str:
+    if len(texto) <= tamanho:
+        return texto
+    
+    return texto[:tamanho].rsplit(" ", 1)[0].rstrip(" ,.;:") + "…"
+
+
+def ajustar_card(dados: dict) -> dict:
+    habilidades = dados["habilidades_tecnicas"]
+    dados["resumo"] = encurtar_texto(dados["resumo"], CARD_TAMANHO_RESUMO)
+    dados["habilidades_tecnicas"] = habilidades[:CARD_MAX_HABILIDADES]
+    dados["total_habilidades"] = len(habilidades)
+    return dados
+
+
+def profissional_para_dict(profissional: Profissional, campos: Optional[List[str]] = None) -> dict:
+    dados = {}
+    
+    for campo in campos or CAMPOS_PROFISSIONAL:
+        valor = getattr(profissional, campo)
+        
+        if campo in CAMPOS_ANINHADOS:
+            chaves = CAMPOS_ANINHADOS[campo]
+            valor = [{chave: item[chave] for chave in chaves} for item in valor]
+        
+        dados[campo] = valor
+    
+    if campos == CAMPOS_CARD:
+        ajustar_card(dados)
+    
+    return dados
+
+
+def valor_csv(valor: Any) -> Any:
+    if isinstance(valor, (list, dict)):
+        return orjson.dumps(valor).decode()
+    
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    
+    return valor
+
+
+def gerar_ndjson(lotes: Iterator[List[Profissional]], campos: Optional[List[str]] = None) -> Iterator[bytes]:
+    for lote in lotes:
+        yield b"".join(
+            orjson.dumps(profissional_para_dict(profissional, campos)) + b"\n"
+            for profissional in lote
+        )
+
+
+def gerar_csv(lotes: Iterator[List[Profissional]], campos: Optional[List[str]] = None) -> Iterator[bytes]:
+    colunas = campos or CAMPOS_PROFISSIONAL
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(colunas)
+    
+    for lote in lotes:
+        for profissional in lote:
+            dados = profissional_para_dict(profissional, colunas)
+            escritor.writerow([valor_csv(dados[coluna]) for coluna in colunas])
+        
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def serializar_profissionais(profissionais: List[Profissional], campos: Optional[List[str]] = None) -> List[dict]:
+    return [profissional_para_dict(profissional, campos) for profissional in profissionais]
+
+
+def _validar_projecao(profissionais: List[Profissional], campos: List[str]) -> List[dict]:
+    adaptador = TypeAdapter(List[modelo_projecao(tuple(campos))])
+    validados = adaptador.validate_python(profissionais, from_attributes=True)
+    itens = adaptador.dump_python(validados, mode="json")
+    
+    if campos == CAMPOS_CARD:
+        itens = [ajustar_card(item) for item in itens]
+    
+    return itens
+
+
+def responder_profissionais(profissionais: List[Profissional], campos: Optional[List[str]] = None):
+    if SERIALIZACAO_RAPIDA:
+        return RespostaJSONRapida(content=serializar_profissionais(profissionais, campos))
+    
+    if campos:
+        return JSONResponse(content=_validar_projecao(profissionais, campos))
+    
+    return profissionais
+
+
+def responder_pagina(profissionais: List[Profissional], proximo_cursor, campos: Optional[List[str]] = None):
+    if SERIALIZACAO_RAPIDA:
+        return RespostaJSONRapida(content={
+            "itens": serializar_profissionais(profissionais, campos),
+            "next_cursor": proximo_cursor
+        })
+    
+    if campos:
+        return JSONResponse(content={
+            "itens": _validar_projecao(profissionais, campos),
+            "next_cursor": proximo_cursor
+        })
+    
+    return {"itens": profissionais, "next_cursor": proximo_cursor}
+
+
+def responder_ranking(ranqueados: List[Tuple[Profissional, float]], total: int, campos: Optional[List[str]] = None):
+    profissionais = [profissional for profissional, _ in ranqueados]
+    pontuacoes = [pontuacao for _, pontuacao in ranqueados]
+    
+    if SERIALIZACAO_RAPIDA:
+        itens = serializar_profissionais(profissionais, campos)
+    elif campos:
+        itens = _validar_projecao(profissionais, campos)
+    else:
+        itens = profissionais
+    
+    conteudo = {
+        "total_candidatos": total,
+        "itens": [
+            {"pontuacao": pontuacao, "profissional": item}
+            for pontuacao, item in zip(pontuacoes, itens)
+        ]
+    }
+    
+    if SERIALIZACAO_RAPIDA:
+        return RespostaJSONRapida(content=conteudo)
+    
+    if campos:
+        return JSONResponse(content=conteudo)
+    
+    return conteudo
+
+
+def empacotar_perfil(profissional) -> bytes:
+    etag = etag_do_perfil(profissional.id, profissional.versao, profissional.atualizado_em)
+    modificado_em = segundos_do_perfil(profissional.atualizado_em)
+    conteudo = ProfissionalResponse.model_validate(profissional).model_dump_json().encode()
+    
+    return b"%s\n%s\n%s" % (etag.encode(), b"" if modificado_em is None else str(modificado_em).encode(), conteudo)
+
+
+def desempacotar_perfil(empacotado: bytes) -> Tuple[str, Optional[int], bytes]:
+    etag, modificado_em, conteudo = empacotado.split(b"\n", 2)
+    return etag.decode(), int(modificado_em) if modificado_em else None, conteudo
+
+
+def responder_perfil(request: Request, empacotado: bytes) -> Response:
+    etag, modificado_em, conteudo = desempacotar_perfil(empacotado)
+    
+    if nao_modificado(request, etag, modificado_em):
+        return resposta_nao_modificada(etag, modificado_em)
+    
+    return Response(
+        content=conteudo,
+        media_type="application/json",
+        headers=cabecalhos_versionados(etag, modificado_em)
+    )
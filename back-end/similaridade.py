@@ -0,0 +1,171 @@
+import heapq
+import os
+import sys
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from models import Profissional
+from normalizacao import normalizar_habilidade
+
+load_dotenv()
+
+SIMILARES_MAX_CANDIDATOS = int(os.getenv("SIMILARES_MAX_CANDIDATOS", "2000"))
+SIMILARES_MAX_TOKENS = int(os.getenv("SIMILARES_MAX_TOKENS", "64"))
+
+PESOS_SIMILARIDADE = {
+    "h": 1.0,
+    "i": 0.5,
+    "a": 1.5
+}
+
+
+def tokens_do_profissional(profissional: Profissional) -> FrozenSet[str]:
+    tokens = [f"h:{normalizar_habilidade(skill)}" for skill in profissional.habilidades_tecnicas or []]
+    tokens += [f"i:{normalizar_habilidade(interesse)}" for interesse in profissional.area_interesses or []]
+    
+    if profissional.area:
+        tokens.append(f"a:{normalizar_habilidade(profissional.area)}")
+    
+    return frozenset(sys.intern(token) for token in sorted(set(tokens))[:SIMILARES_MAX_TOKENS])
+
+
+class IndiceSimilaridade:
+    def __init__(self, max_candidatos: int = SIMILARES_MAX_CANDIDATOS):
+        self.max_candidatos = max_candidatos
+        self._codigos: Dict[str, int] = {}
+        self._pesos: List[float] = []
+        self._perfis: Dict[int, Tuple[Tuple[int, ...], float]] = {}
+        self._postings: Dict[int, set] = {}
+        self._trava = threading.Lock()
+        self.montado = False
+        self.consultas = 0
+        self.candidatos_avaliados = 0
+
+    def montar(self, db: Session) -> None:
+        with self._trava:
+            if self.montado:
+                return
+            
+            consulta = select(
+                Profissional.id,
+                Profissional.habilidades_tecnicas,
+                Profissional.area_interesses,
+                Profissional.area
+            ).execution_options(yield_per=1000)
+            
+            for linha in db.execute(consulta):
+                self._definir(linha.id, tokens_do_profissional(linha))
+            
+            self.montado = True
+
+    def _codificar(self, tokens: FrozenSet[str]) -> Tuple[int, ...]:
+        codigos = []
+        
+        for token in tokens:
+            codigo = self._codigos.get(token)
+            
+            if codigo is None:
+                codigo = self._codigos[token] = len(self._pesos)
+                self._pesos.append(PESOS_SIMILARIDADE[token[0]])
+            
+            codigos.append(codigo)
+        
+        return tuple(sorted(codigos))
+
+    def _definir(self, profissional_id: int, tokens: FrozenSet[str]) -> None:
+        self._remover(profissional_id)
+        codigos = self._codificar(tokens)
+        self._perfis[profissional_id] = (codigos, sum(self._pesos[codigo] for codigo in codigos))
+        
+        for codigo in codigos:
+            self._postings.setdefault(codigo, set()).add(profissional_id)
+
+    def _remover(self, profissional_id: int) -> None:
+        codigos, _ = self._perfis.pop(profissional_id, ((), 0.0))
+        
+        for codigo in codigos:
+            posting = self._postings[codigo]
+            posting.discard(profissional_id)
+            
+            if not posting:
+                del self._postings[codigo]
+
+    def definir(self, itens: List[Tuple[int, FrozenSet[str]]]) -> None:
+        with self._trava:
+            if not self.montado:
+                return
+            
+            for profissional_id, tokens in itens:
+                self._definir(profissional_id, tokens)
+
+    def remover(self, profissionais_ids: Iterable[int]) -> None:
+        with self._trava:
+            if not self.montado:
+                return
+            
+            for profissional_id in profissionais_ids:
+                self._remover(profissional_id)
+
+    def contem(self, profissional_id: int) -> bool:
+        return profissional_id in self._perfis
+
+    def similares(self, profissional_id: int, limite: int = 10) -> Tuple[List[Tuple[int, float]], int]:
+        with self._trava:
+            if profissional_id not in self._perfis:
+                return [], 0
+            
+            codigos, peso_alvo = self._perfis[profissional_id]
+            alvo = set(codigos)
+            candidatos = set()
+            postings = sorted((self._postings[codigo] for codigo in codigos), key=len)
+            
+            for posting in postings:
+                for candidato in posting:
+                    if candidato != profissional_id:
+                        candidatos.add(candidato)
+                    
+                    if len(candidatos) >= self.max_candidatos:
+                        break
+                
+                if len(candidatos) >= self.max_candidatos:
+                    break
+            
+            pontuados = []
+            
+            for candidato in candidatos:
+                codigos_candidato, peso_candidato = self._perfis[candidato]
+                comum = sum(self._pesos[codigo] for codigo in codigos_candidato if codigo in alvo)
+                uniao = peso_alvo + peso_candidato - comum
+                pontuados.append((comum / uniao if uniao else 0.0, candidato))
+            
+            self.consultas += 1
+            self.candidatos_avaliados += len(pontuados)
+        
+        melhores = heapq.nsmallest(limite, pontuados, key=lambda item: (-item[0], item[1]))
+        
+        return [(candidato, round(nota, 4)) for nota, candidato in melhores if nota > 0], len(pontuados)
+
+    def memoria_bytes(self) -> int:
+        with self._trava:
+            total = sys.getsizeof(self._perfis) + sys.getsizeof(self._postings) + sys.getsizeof(self._codigos)
+            total += sum(sys.getsizeof(token) for token in self._codigos)
+            total += sum(sys.getsizeof(item) + sys.getsizeof(item[0]) for item in self._perfis.values())
+            total += sum(sys.getsizeof(posting) for posting in self._postings.values())
+            return total
+
+    def estatisticas(self) -> dict:
+        return {
+            "montado": self.montado,
+            "perfis": len(self._perfis),
+            "tokens": len(self._postings),
+            "max_tokens_por_perfil": SIMILARES_MAX_TOKENS,
+            "max_candidatos": self.max_candidatos,
+            "memoria_bytes": self.memoria_bytes(),
+            "consultas": self.consultas,
+            "candidatos_avaliados": self.candidatos_avaliados
+        }
+
+
+indice_similaridade = IndiceSimilaridade()
@@ -0,0 +1,272 @@
+import os
+import sys
+import threading
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from typing import List, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from models import Profissional
+from normalizacao import chave_habilidade
+
+load_dotenv()
+
+SUGESTOES_MAX_PREFIXOS = int(os.getenv("SUGESTOES_MAX_PREFIXOS", "5000"))
+SUGESTOES_LIMITE_MAXIMO = 20
+SUGESTOES_FAIXA_MAXIMA = 1000
+
+TIPO_NOME = "nome"
+TIPO_CARGO = "cargo"
+TIPO_HABILIDADE = "habilidade"
+TIPO_CIDADE = "cidade"
+TIPO_AREA = "area"
+
+
+def termos_do_profissional(profissional: Profissional) -> Counter:
+    termos = Counter()
+    termos[(TIPO_NOME, profissional.nome)] += 1
+    termos[(TIPO_CARGO, profissional.cargo)] += 1
+    termos[(TIPO_CIDADE, profissional.localizacao)] += 1
+    termos[(TIPO_AREA, profissional.area)] += 1
+    
+    for habilidade in set(profissional.habilidades_tecnicas or []):
+        termos[(TIPO_HABILIDADE, habilidade)] += 1
+    
+    return termos
+
+
+def chaves_do_termo(valor: str) -> List[str]:
+    chave = chave_habilidade(valor)
+    chaves = [chave]
+    
+    for posicao, caractere in enumerate(chave):
+        if caractere == " " and posicao + 1 < len(chave):
+            chaves.append(chave[posicao + 1:])
+    
+    return list(dict.fromkeys(chaves))
+
+
+def sucessor(prefixo: str) -> str:
+    return prefixo[:-1] + chr(ord(prefixo[-1]) + 1)
+
+
+def ordem_sugestao(item: Tuple[int, str, str]):
+    quantidade, tipo, valor = item
+    return (-quantidade, valor, tipo)
+
+
+class IndiceSugestoes:
+    def __init__(self, max_prefixos: int = SUGESTOES_MAX_PREFIXOS):
+        self.max_prefixos = max_prefixos
+        self.capacidade = SUGESTOES_LIMITE_MAXIMO * 2
+        self._entradas: List[Tuple[str, str, str]] = []
+        self._frequencias = Counter()
+        self._melhores = OrderedDict()
+        self._fixos = set()
+        self._trava = threading.Lock()
+        self.montado = False
+        self.acertos = 0
+        self.falhas = 0
+
+    def montar(self, db: Session) -> None:
+        termos = Counter()
+        consulta = select(
+            Profissional.nome,
+            Profissional.cargo,
+            Profissional.localizacao,
+            Profissional.area,
+            Profissional.habilidades_tecnicas
+        ).execution_options(yield_per=1000)
+        
+        for linha in db.execute(consulta):
+            termos.update(termos_do_profissional(linha))
+        
+        entradas = sorted(
+            (chave, tipo, valor)
+            for (tipo, valor) in termos
+            for chave in chaves_do_termo(valor)
+        )
+        
+        with self._trava:
+            self._entradas = entradas
+            self._frequencias = termos
+            self._melhores = OrderedDict()
+            self._fixos = self._prefixos_extensos()
+            self.montado = True
+            
+            for prefixo in sorted(self._fixos):
+                self._calcular(prefixo)
+
+    def _faixa(self, prefixo: str) -> Tuple[int, int]:
+        inicio = bisect_left(self._entradas, (prefixo,))
+        fim = bisect_left(self._entradas, (sucessor(prefixo),), inicio)
+        return inicio, fim
+
+    def _prefixos_extensos(self) -> set:
+        extensos = set()
+        pendentes = [""]
+        
+        while pendentes:
+            prefixo = pendentes.pop()
+            inicio, fim = self._faixa(prefixo) if prefixo else (0, len(self._entradas))
+            
+            if prefixo and fim - inicio <= SUGESTOES_FAIXA_MAXIMA:
+                continue
+            
+            if prefixo:
+                extensos.add(prefixo)
+            
+            posicao = inicio
+            
+            while posicao < fim:
+                chave = self._entradas[posicao][0]
+                
+                if len(chave) <= len(prefixo):
+                    posicao += 1
+                    continue
+                
+                filho = chave[:len(prefixo) + 1]
+                pendentes.append(filho)
+                posicao = bisect_left(self._entradas, (sucessor(filho),), posicao)
+        
+        return extensos
+
+    def _calcular(self, prefixo: str) -> list:
+        inicio, fim = self._faixa(prefixo)
+        termos = {(tipo, valor) for _, tipo, valor in self._entradas[inicio:fim]}
+        
+        itens = sorted(
+            ((self._frequencias[(tipo, valor)], tipo, valor) for tipo, valor in termos),
+            key=ordem_sugestao
+        )
+        melhores = [itens[:self.capacidade], len(itens) <= self.capacidade]
+        
+        self._melhores[prefixo] = melhores
+        self._limitar()
+        
+        return melhores
+
+    def _limitar(self) -> None:
+        while len(self._melhores) > self.max_prefixos:
+            antigo = next(
+                (prefixo for prefixo in self._melhores if prefixo not in self._fixos),
+                None
+            )
+            
+            if antigo is None:
+                return
+            
+            del self._melhores[antigo]
+
+    def _atualizar_prefixo(self, prefixo: str, tipo: str, valor: str, quantidade: int) -> None:
+        melhores = self._melhores.get(prefixo)
+        
+        if melhores is None:
+            return
+        
+        itens, completo = melhores
+        menor_quantidade = itens[-1][0] if itens else 0
+        posicao = next(
+            (indice for indice, item in enumerate(itens) if item[1] == tipo and item[2] == valor),
+            None
+        )
+        
+        if posicao is not None:
+            del itens[posicao]
+        
+        if quantidade > 0 and (completo or quantidade >= menor_quantidade):
+            insort(itens, (quantidade, tipo, valor), key=ordem_sugestao)
+        
+        if len(itens) > self.capacidade:
+            del itens[self.capacidade:]
+            melhores[1] = False
+        
+        if not melhores[1] and len(itens) < SUGESTOES_LIMITE_MAXIMO:
+            del self._melhores[prefixo]
+            
+            if prefixo in self._fixos:
+                self._calcular(prefixo)
+
+    def aplicar_delta(self, antigos: Counter, novos: Counter) -> None:
+        delta = Counter(novos)
+        delta.subtract(antigos)
+        
+        with self._trava:
+            if not self.montado:
+                return
+            
+            for (tipo, valor), quantidade in delta.items():
+                if quantidade == 0:
+                    continue
+                
+                anterior = self._frequencias[(tipo, valor)]
+                atual = max(anterior + quantidade, 0)
+                chaves = chaves_do_termo(valor)
+                
+                if atual > 0:
+                    self._frequencias[(tipo, valor)] = atual
+                else:
+                    self._frequencias.pop((tipo, valor), None)
+                
+                for chave in chaves:
+                    if anterior <= 0 < atual:
+                        insort(self._entradas, (chave, tipo, valor))
+                    elif atual <= 0 < anterior:
+                        posicao = bisect_left(self._entradas, (chave, tipo, valor))
+                        
+                        if posicao < len(self._entradas) and self._entradas[posicao] == (chave, tipo, valor):
+                            del self._entradas[posicao]
+                
+                for prefixo in {chave[:tamanho] for chave in chaves for tamanho in range(1, len(chave) + 1)}:
+                    self._atualizar_prefixo(prefixo, tipo, valor, atual)
+
+    def sugerir(self, termo: str, limite: int = 10) -> List[dict]:
+        prefixo = chave_habilidade(termo)
+        
+        if not prefixo:
+            return []
+        
+        with self._trava:
+            melhores = self._melhores.get(prefixo)
+            
+            if melhores is None:
+                self.falhas += 1
+                melhores = self._calcular(prefixo)
+            else:
+                self.acertos += 1
+                self._melhores.move_to_end(prefixo)
+            
+            itens = melhores[0][:limite]
+        
+        return [
+            {"tipo": tipo, "valor": valor, "quantidade": quantidade}
+            for quantidade, tipo, valor in itens
+        ]
+
+    def memoria_bytes(self) -> int:
+        with self._trava:
+            total = sys.getsizeof(self._entradas) + sys.getsizeof(self._frequencias) + sys.getsizeof(self._melhores)
+            total += sum(sys.getsizeof(entrada) + sys.getsizeof(entrada[0]) for entrada in self._entradas)
+            total += sum(sys.getsizeof(chave) + sys.getsizeof(chave[1]) for chave in self._frequencias)
+            total += sum(
+                sys.getsizeof(prefixo) + sys.getsizeof(itens) + sum(sys.getsizeof(item) for item in itens)
+                for prefixo, (itens, _) in self._melhores.items()
+            )
+            return total
+
+    def estatisticas(self) -> dict:
+        return {
+            "montado": self.montado,
+            "termos": len(self._frequencias),
+            "entradas": len(self._entradas),
+            "prefixos_em_cache": len(self._melhores),
+            "prefixos_fixos": len(self._fixos),
+            "max_prefixos": self.max_prefixos,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "memoria_bytes": self.memoria_bytes()
+        }
+
+
+indice_sugestoes = IndiceSugestoes()
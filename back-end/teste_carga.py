@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROTAS_PADRAO = [
+    "/api/profissionais?limit=20",
+    "/api/profissionais?busca=dados",
+    "/api/profissionais?area=Design",
+    "/api/profissionais/1",
+    "/api/areas",
+    "/api/estatisticas",
+]
+
+
+def aguardar_servidor(url_base: str, tempo_limite: float = 15.0) -> bool:
+    limite = time.monotonic() + tempo_limite
+    
+    while time.monotonic() < limite:
+        try:
+            with urllib.request.urlopen(f"{url_base}/health") as resposta:
+                if resposta.status == 200:
+                    return True
+        except OSError:
+            time.sleep(0.2)
+    
+    return False
+
+
+def iniciar_servidor(modo: str, porta: int) -> subprocess.Popen:
+    ambiente = dict(os.environ, USAR_BANCO_ASYNC="true" if modo == "async" else "false")
+    
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(porta), "--log-level", "warning"],
+        env=ambiente
+    )
+
+
+def executar_requisicao(url: str) -> float:
+    inicio = time.perf_counter()
+    
+    with urllib.request.urlopen(url) as resposta:
+        resposta.read()
+    
+    return time.perf_counter() - inicio
+
+
+def percentil(valores: list, fracao: float) -> float:
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, int(len(ordenados) * fracao))
+    return ordenados[indice]
+
+
+def medir(url_base: str, total: int, concorrencia: int, rotas: list) -> dict:
+    urls = [f"{url_base}{rotas[i % len(rotas)]}" for i in range(total)]
+    
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        list(executor.map(executar_requisicao, urls[:concorrencia]))
+        
+        inicio = time.perf_counter()
+        latencias = list(executor.map(executar_requisicao, urls))
+        duracao = time.perf_counter() - inicio
+    
+    return {
+        "requisicoes": total,
+        "concorrencia": concorrencia,
+        "requisicoes_por_segundo": round(total / duracao, 1),
+        "latencia_media_ms": round(sum(latencias) / len(latencias) * 1000, 2),
+        "latencia_p99_ms": round(percentil(latencias, 0.99) * 1000, 2)
+    }
+
+
+def comparar_modos(total: int, concorrencia: int, porta: int, rotas: list) -> dict:
+    resultados = {}
+    
+    for modo in ["sync", "async"]:
+        servidor = iniciar_servidor(modo, porta)
+        url_base = f"http://127.0.0.1:{porta}"
+        
+        try:
+            if not aguardar_servidor(url_base):
+                print(f"[ERRO] Servidor em modo {modo} nao respondeu")
+                continue
+            
+            resultados[modo] = medir(url_base, total, concorrencia, rotas)
+            print(
+                f"[OK] {modo}: {resultados[modo]['requisicoes_por_segundo']} req/s, "
+                f"p99 {resultados[modo]['latencia_p99_ms']} ms"
+            )
+        finally:
+            servidor.terminate()
+            servidor.wait()
+    
+    return resultados
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Teste de carga comparando os modos sync e async da API")
+    parser.add_argument("--requisicoes", type=int, default=2000)
+    parser.add_argument("--concorrencia", type=int, default=64)
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--saida", help="Arquivo JSON para gravar os resultados")
+    argumentos = parser.parse_args()
+    
+    resultados = comparar_modos(argumentos.requisicoes, argumentos.concorrencia, argumentos.porta, ROTAS_PADRAO)
+    
+    if argumentos.saida:
+        with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2)
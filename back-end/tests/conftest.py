@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+
+DIRETORIO_TESTES = tempfile.mkdtemp(prefix="futuroconecta_testes_")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(DIRETORIO_TESTES, 'testes.db')}"
+os.environ["FOTOS_DIRETORIO"] = os.path.join(DIRETORIO_TESTES, "fotos")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from database import Base, SessionLocal, engine
+from busca import criar_indice_busca
+from cache import cache_perfis
+from versionamento import criar_controle_versao
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    criar_indice_busca(engine)
+    criar_controle_versao(engine)
+    sessao = SessionLocal()
+    
+    try:
+        yield sessao
+    finally:
+        sessao.rollback()
+        
+        for tabela in reversed(Base.metadata.sorted_tables):
+            sessao.execute(tabela.delete())
+        
+        sessao.commit()
+        sessao.close()
+        cache_perfis.limpar()
+
+
+def perfil(nome: str, **campos) -> dict:
+    dados = {
+        "nome": nome,
+        "cargo": "Desenvolvedora Backend",
+        "resumo": "Profissional com experiência em APIs e bancos de dados.",
+        "localizacao": "Recife/PE",
+        "area": "Desenvolvimento",
+        "habilidades_tecnicas": ["Python", "Docker"],
+        "soft_skills": ["Comunicação"],
+        "experiencias": [{
+            "empresa": "Acme",
+            "cargo": "Desenvolvedora",
+            "inicio": "2019-01",
+            "fim": "Atual",
+            "descricao": "APIs REST"
+        }],
+        "formacao": [{"curso": "Computação", "instituicao": "UFPE", "ano": 2018}],
+        "idiomas": [{"idioma": "Português", "nivel": "Nativo"}]
+    }
+    dados.update(campos)
+    return dados
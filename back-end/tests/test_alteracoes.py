@@ -0,0 +1,75 @@
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+import main
+from conftest import perfil
+from crud import alterar_profissional, criar_profissional, obter_profissional_por_id
+from schemas import OperacaoPatch, ProfissionalCreate
+
+
+@pytest.mark.parametrize("operacoes", [
+    [{"op": "replace", "path": "/nome", "value": None}],
+    [{"op": "replace", "path": "/nome", "value": "ab"}],
+    [{"op": "replace", "path": "/habilidades_tecnicas", "value": None}],
+    [{"op": "replace", "path": "/idiomas", "value": []}],
+    [{"op": "remove", "path": "/idiomas/0"}],
+    [{"op": "replace", "path": "/experiencias/0/empresa", "value": None}]
+])
+def test_alteracao_invalida_nao_grava(db, operacoes):
+    profissional = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    
+    with pytest.raises(ValidationError):
+        alterar_profissional(db, profissional.id, [OperacaoPatch(**operacao) for operacao in operacoes])
+    
+    db.expire_all()
+    assert obter_profissional_por_id(db, profissional.id).versao == 1
+
+
+def test_alteracao_valida_grava_documento_completo(db):
+    profissional = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    operacoes = [
+        OperacaoPatch(op="add", path="/idiomas/-", value={"idioma": "Inglês", "nivel": "Avançado"}),
+        OperacaoPatch(op="remove", path="/idiomas/0"),
+        OperacaoPatch(op="replace", path="/nome", value="Ana Souza Lima")
+    ]
+    
+    alterado = alterar_profissional(db, profissional.id, operacoes)
+    
+    assert alterado.versao == 2
+    assert alterado.nome == "Ana Souza Lima"
+    assert alterado.idiomas == [{"idioma": "Inglês", "nivel": "Avançado"}]
+
+
+def test_put_com_nulo_retorna_422_sem_gravar(db):
+    cliente = TestClient(main.app)
+    profissional = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    
+    resposta = cliente.put(f"/api/profissionais/{profissional.id}", json={"habilidades_tecnicas": None, "cargo": "Tech Lead"})
+    
+    assert resposta.status_code == 422
+    assert cliente.get(f"/api/profissionais/{profissional.id}").json()["cargo"] == "Desenvolvedora Backend"
+
+
+def test_patch_em_lote_respeita_versao_de_cada_item(db):
+    cliente = TestClient(main.app)
+    ana = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    bruno = criar_profissional(db, ProfissionalCreate(**perfil("Bruno Lima")))
+    carla = criar_profissional(db, ProfissionalCreate(**perfil("Carla Dias")))
+    
+    resposta = cliente.patch("/api/profissionais/batch", json=[
+        {"id": ana.id, "versao": 1, "cargo": "Tech Lead"},
+        {"id": bruno.id, "versao": 7, "cargo": "Tech Lead"},
+        {"id": carla.id, "cargo": "Tech Lead"},
+        {"id": 9999, "versao": 1, "cargo": "Tech Lead"}
+    ])
+    
+    assert [item["status"] for item in resposta.json()["resultados"]] == [200, 412, 200, 404]
+    
+    db.expire_all()
+    assert obter_profissional_por_id(db, ana.id).versao == 2
+    assert obter_profissional_por_id(db, bruno.id).cargo == "Desenvolvedora Backend"
+    assert obter_profissional_por_id(db, carla.id).cargo == "Tech Lead"
+    
+    resposta = cliente.patch("/api/profissionais/batch", json=[{"id": ana.id, "versao": 1, "cargo": "Gerente"}])
+    assert resposta.json()["resultados"][0]["status"] == 412
@@ -0,0 +1,22 @@
+from sqlalchemy import delete, func, select, text
+
+from conftest import perfil
+from crud import criar_profissional
+from models import HabilidadeProfissional, IdiomaProfissional, Profissional
+from schemas import ProfissionalCreate
+
+
+def test_sqlite_aplica_chaves_estrangeiras(db):
+    assert db.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def test_delete_direto_remove_linhas_dos_indices(db):
+    ana = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    criar_profissional(db, ProfissionalCreate(**perfil("Bruno Lima")))
+    
+    db.execute(delete(Profissional).where(Profissional.id == ana.id))
+    db.commit()
+    
+    for modelo in (HabilidadeProfissional, IdiomaProfissional):
+        assert db.scalar(select(func.count()).select_from(modelo).where(modelo.profissional_id == ana.id)) == 0
+        assert db.scalar(select(func.count()).select_from(modelo)) > 0
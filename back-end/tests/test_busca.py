@@ -0,0 +1,55 @@
+from fastapi.testclient import TestClient
+
+import main
+from conftest import perfil
+from crud import atualizar_profissional, buscar_profissionais, criar_profissional, deletar_profissional
+from schemas import ProfissionalCreate, ProfissionalUpdate
+
+
+def nomes(profissionais) -> list:
+    return [profissional.nome for profissional in profissionais]
+
+
+def criar(db, nome: str, **campos):
+    return criar_profissional(db, ProfissionalCreate(**perfil(nome, **campos)))
+
+
+def test_campo_com_peso_maior_vem_primeiro(db):
+    criar(db, "Ana Souza", resumo="Trabalhou com a equipe de Kafka durante dois anos.")
+    criar(db, "Bruno Kafka")
+    
+    assert nomes(buscar_profissionais(db, termo_busca="kafka")) == ["Bruno Kafka", "Ana Souza"]
+
+
+def test_busca_ignora_acentos_e_caixa(db):
+    criar(db, "João Pereira", cargo="Engenheiro de Produção")
+    
+    for termo in ("joao", "JOÃO", "producao", "Produção"):
+        assert nomes(buscar_profissionais(db, termo_busca=termo)) == ["João Pereira"]
+
+
+def test_busca_por_prefixo_e_todas_as_palavras(db):
+    criar(db, "Ana Souza", habilidades_tecnicas=["Python", "Kubernetes"])
+    criar(db, "Bruno Lima", habilidades_tecnicas=["Python", "Docker"])
+    
+    assert nomes(buscar_profissionais(db, termo_busca="kube")) == ["Ana Souza"]
+    assert nomes(buscar_profissionais(db, termo_busca="python kubernetes")) == ["Ana Souza"]
+    assert set(nomes(buscar_profissionais(db, termo_busca="python"))) == {"Ana Souza", "Bruno Lima"}
+
+
+def test_termo_sem_palavras_nao_retorna_nada(db):
+    criar(db, "Ana Souza")
+    
+    assert buscar_profissionais(db, termo_busca="!!! ---") == []
+    assert TestClient(main.app).get("/api/profissionais", params={"busca": "\"*"}).json() == []
+
+
+def test_indice_acompanha_edicoes_e_remocoes(db):
+    ana = criar(db, "Ana Souza", cargo="Cientista de Dados")
+    
+    atualizar_profissional(db, ana.id, ProfissionalUpdate(cargo="Arquiteta de Software"))
+    assert buscar_profissionais(db, termo_busca="cientista") == []
+    assert nomes(buscar_profissionais(db, termo_busca="arquiteta")) == ["Ana Souza"]
+    
+    deletar_profissional(db, ana.id)
+    assert buscar_profissionais(db, termo_busca="arquiteta") == []
@@ -0,0 +1,60 @@
+import pytest
+
+from cache import CacheMemoria, CacheRedis
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture(params=["memoria", "redis"])
+def cache(request):
+    if request.param == "memoria":
+        return CacheMemoria(max_itens=10, ttl=60)
+    
+    return CacheRedis(fakeredis.FakeRedis(), ttl=60)
+
+
+def test_acertos_e_falhas(cache):
+    assert cache.obter(1) is None
+    cache.definir(1, b"perfil")
+    
+    assert cache.obter(1) == b"perfil"
+    assert cache.estatisticas()["acertos"] == 1
+    assert cache.estatisticas()["falhas"] == 1
+
+
+def test_definir_descarta_valor_lido_antes_de_uma_invalidacao(cache):
+    marcador = cache.marcador()
+    cache.remover(1)
+    cache.definir(1, b"antigo", marcador)
+    
+    assert cache.obter(1) is None
+    
+    cache.definir(1, b"novo", cache.marcador())
+    assert cache.obter(1) == b"novo"
+
+
+def test_redis_compartilha_invalidacoes_entre_processos():
+    servidor = fakeredis.FakeServer()
+    cache_a = CacheRedis(fakeredis.FakeRedis(server=servidor), ttl=60)
+    cache_b = CacheRedis(fakeredis.FakeRedis(server=servidor), ttl=60)
+    
+    marcador = cache_a.marcador()
+    cache_b.remover(7)
+    cache_a.definir(7, b"antigo", marcador)
+    
+    assert cache_b.obter(7) is None
+
+
+def test_redis_conta_remocoes():
+    cache = CacheRedis(fakeredis.FakeRedis(), ttl=60)
+    cache.definir(1, b"a")
+    cache.definir(2, b"b")
+    cache.definir(3, b"c")
+    
+    cache.remover(1)
+    cache.remover(99)
+    cache.limpar()
+    
+    assert cache.estatisticas()["remocoes"] == 3
+    assert cache.obter(2) is None
+    assert cache.marcador() == 3
@@ -0,0 +1,82 @@
+from fastapi.testclient import TestClient
+
+import main
+from conftest import perfil
+from crud import calcular_estatisticas, criar_profissional
+from database import SessionLocal
+from estatisticas import InstantaneoEstatisticas, agrupar_tecnologias, faixa_experiencia
+from schemas import ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def experiencia(inicio: str, fim: str) -> dict:
+    return {"empresa": "Acme", "cargo": "Analista", "inicio": inicio, "fim": fim, "descricao": "Projetos"}
+
+
+def criar(db, nome: str, **campos):
+    return criar_profissional(db, ProfissionalCreate(**perfil(nome, **campos)))
+
+
+def test_agrega_areas_cidades_tecnologias_idiomas_e_experiencia(db):
+    criar(db, "Ana Souza", area="Dados", habilidades_tecnicas=["Python", "SQL"],
+          experiencias=[experiencia("2010-01", "2022-06")],
+          idiomas=[{"idioma": "Inglês", "nivel": "Fluente"}])
+    criar(db, "Bruno Lima", localizacao="Natal/RN", habilidades_tecnicas=["python3"],
+          experiencias=[experiencia("2021-01", "2022-01")],
+          idiomas=[{"idioma": "Inglês", "nivel": "Básico"}, {"idioma": "Espanhol", "nivel": "Básico"}])
+    criar(db, "Carla Dias", area="Dados", habilidades_tecnicas=["SQL", "Python"],
+          experiencias=[experiencia("2016-01", "2022-01")])
+    
+    estatisticas = cliente.get("/api/estatisticas").json()
+    
+    assert estatisticas["total_profissionais"] == 3
+    assert estatisticas["profissionais_por_area"] == {"Dados": 2, "Desenvolvimento": 1}
+    assert estatisticas["profissionais_por_cidade"] == {"Natal/RN": 1, "Recife/PE": 2}
+    assert estatisticas["top_tecnologias"] == [
+        {"tecnologia": "Python", "quantidade": 3},
+        {"tecnologia": "SQL", "quantidade": 2}
+    ]
+    assert list(estatisticas["idiomas"]) == ["ingles", "espanhol", "portugues"]
+    assert estatisticas["idiomas"]["ingles"] == {"total": 2, "niveis": {"Básico": 1, "Fluente": 1}}
+    assert estatisticas["faixas_experiencia"] == {"0-1": 1, "2-4": 0, "5-9": 1, "10-14": 1, "15+": 0}
+    assert calcular_estatisticas(db, limite_tecnologias=1)["top_tecnologias"] == [
+        {"tecnologia": "Python", "quantidade": 3}
+    ]
+
+
+def test_responde_304_ate_a_proxima_escrita(db):
+    criar(db, "Ana Souza")
+    etag = cliente.get("/api/estatisticas").headers["ETag"]
+    
+    assert cliente.get("/api/estatisticas", headers={"If-None-Match": etag}).status_code == 304
+    
+    criar(db, "Bruno Lima")
+    resposta = cliente.get("/api/estatisticas", headers={"If-None-Match": etag})
+    
+    assert resposta.status_code == 200
+    assert resposta.json()["total_profissionais"] == 2
+
+
+def test_instantaneo_mantem_versao_do_calculo(db):
+    criar(db, "Ana Souza")
+    instantaneo = InstantaneoEstatisticas(intervalo=60)
+    instantaneo._fabrica_sessao, instantaneo._calcular = SessionLocal, calcular_estatisticas
+    
+    dados, estado = instantaneo.obter()
+    assert dados["total_profissionais"] == 1
+    
+    criar(db, "Bruno Lima")
+    assert instantaneo.obter() == (dados, estado)
+    assert instantaneo.estatisticas()["versao_atual"] > estado.versao
+    
+    instantaneo.atualizar()
+    dados, novo_estado = instantaneo.obter()
+    assert dados["total_profissionais"] == 2
+    assert novo_estado.etag != estado.etag
+
+
+def test_agrupa_grafias_e_faixas_sem_experiencia():
+    assert agrupar_tecnologias({"Python": 3, "python3": 5, "SQL": 4}) == [("python3", 8), ("SQL", 4)]
+    assert faixa_experiencia(None) == "0-1"
+    assert faixa_experiencia(15) == "15+"
@@ -0,0 +1,78 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import models
+from conftest import perfil
+from crud import buscar_profissionais, calcular_resumo_experiencia, criar_profissional
+from schemas import ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def experiencia(inicio: str, fim: str) -> dict:
+    return {"empresa": "Acme", "cargo": "Desenvolvedora", "inicio": inicio, "fim": fim, "descricao": "APIs"}
+
+
+@pytest.mark.parametrize("inicio,fim", [
+    ("2019-01", "atual x"),
+    ("2019-01", ""),
+    ("2019-01", "2023/12"),
+    ("abc", "2023-12"),
+    ("2019-13", "Atual")
+])
+def test_periodo_invalido_retorna_422_em_post_put_e_patch(db, inicio, fim):
+    resposta = cliente.post("/api/profissionais", json=perfil("Ana Souza", experiencias=[experiencia(inicio, fim)]))
+    assert resposta.status_code == 422
+    
+    profissional_id = cliente.post("/api/profissionais", json=perfil("Bruno Lima")).json()["id"]
+    
+    resposta = cliente.put(f"/api/profissionais/{profissional_id}", json={"experiencias": [experiencia(inicio, fim)]})
+    assert resposta.status_code == 422
+    
+    resposta = cliente.patch(f"/api/profissionais/{profissional_id}", json=[
+        {"op": "replace", "path": "/experiencias/0/inicio", "value": inicio},
+        {"op": "replace", "path": "/experiencias/0/fim", "value": fim}
+    ])
+    assert resposta.status_code == 422
+    assert cliente.get(f"/api/profissionais/{profissional_id}").json()["versao"] == 1
+
+
+def test_atual_aceita_qualquer_caixa(db):
+    resposta = cliente.post("/api/profissionais", json=perfil("Ana Souza", experiencias=[experiencia("2019-01", " atual ")]))
+    
+    assert resposta.status_code == 201
+    assert resposta.json()["experiencias"][0]["fim"] == "Atual"
+
+
+def test_resumo_ignora_periodos_antigos_invalidos():
+    resumo = calcular_resumo_experiencia([
+        experiencia("2015-03", "2018-12"),
+        experiencia("2019-01", "Atual"),
+        experiencia("sem data", "2020-01"),
+        experiencia("2010-01", "")
+    ])
+    
+    assert resumo["anos_experiencia_base"] == 3 - 2019
+    assert resumo["cargos_atuais"] == 1
+    assert resumo["inicio_cargo_recente"] == "2019-01"
+
+
+def test_anos_minimos_acompanham_o_ano_corrente(db, monkeypatch):
+    criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza", experiencias=[experiencia("2019-01", "Atual")])))
+    criar_profissional(db, ProfissionalCreate(**perfil("Bruno Lima", experiencias=[experiencia("2000-01", "2010-06")])))
+    anos_hoje = date.today().year - 2019
+    
+    assert [p.nome for p in buscar_profissionais(db, anos_minimos=anos_hoje)] == ["Ana Souza", "Bruno Lima"]
+    assert [p.nome for p in buscar_profissionais(db, anos_minimos=anos_hoje + 10)] == []
+    
+    class DataFutura(date):
+        @classmethod
+        def today(cls):
+            return date(date.today().year + 10, 1, 1)
+    
+    monkeypatch.setattr(models, "date", DataFutura)
+    
+    assert [p.nome for p in buscar_profissionais(db, anos_minimos=anos_hoje + 10)] == ["Ana Souza"]
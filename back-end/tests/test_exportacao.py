@@ -0,0 +1,81 @@
+import csv
+import io
+
+import orjson
+from fastapi.testclient import TestClient
+
+import main
+from compressao import codificacoes_aceitas, escolher_compressor, CompressorGzip
+from conftest import perfil
+from crud import criar_profissional
+from schemas import ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def criar(db, nome: str, **campos):
+    return criar_profissional(db, ProfissionalCreate(**perfil(nome, **campos)))
+
+
+def test_exporta_ndjson_com_filtros(db):
+    criar(db, "Ana Souza", area="Dados")
+    criar(db, "Bruno Lima")
+    criar(db, "Carla Dias", area="Dados")
+    
+    resposta = cliente.get("/api/profissionais/export", params={"area": "Dados"})
+    linhas = [orjson.loads(linha) for linha in resposta.content.splitlines()]
+    
+    assert resposta.headers["content-type"] == "application/x-ndjson"
+    assert resposta.headers["content-disposition"] == 'attachment; filename="profissionais.ndjson"'
+    assert [linha["nome"] for linha in linhas] == ["Ana Souza", "Carla Dias"]
+    assert linhas[0]["habilidades_tecnicas"] == ["Python", "Docker"]
+
+
+def test_exporta_csv_com_projecao(db):
+    ana = criar(db, "Ana Souza", habilidades_tecnicas=["Python", "SQL"])
+    
+    resposta = cliente.get("/api/profissionais/export", params={"formato": "csv", "fields": "nome,habilidades_tecnicas"})
+    linhas = list(csv.reader(io.StringIO(resposta.text)))
+    
+    assert resposta.headers["content-type"] == "text/csv; charset=utf-8"
+    assert linhas == [
+        ["nome", "habilidades_tecnicas", "id"],
+        ["Ana Souza", '["Python","SQL"]', str(ana.id)]
+    ]
+
+
+def test_exportacao_rejeita_formato_e_campos_desconhecidos(db):
+    assert cliente.get("/api/profissionais/export", params={"formato": "xml"}).status_code == 422
+    assert cliente.get("/api/profissionais/export", params={"fields": "senha"}).status_code == 400
+
+
+def test_comprime_respostas_grandes_com_gzip(db):
+    for numero in range(20):
+        criar(db, f"Pessoa {numero:02d}")
+    
+    esperado = cliente.get("/api/profissionais/export", headers={"Accept-Encoding": "identity"})
+    resposta = cliente.get("/api/profissionais/export", headers={"Accept-Encoding": "gzip"})
+    
+    assert "content-encoding" not in esperado.headers
+    assert resposta.headers["content-encoding"] == "gzip"
+    assert resposta.headers["vary"] == "Accept-Encoding"
+    assert resposta.content == esperado.content
+    
+    listagem = cliente.get("/api/profissionais", headers={"Accept-Encoding": "gzip"})
+    assert listagem.headers["content-encoding"] == "gzip"
+    assert listagem.headers["etag"].startswith("W/")
+
+
+def test_nao_comprime_respostas_pequenas(db):
+    criar(db, "Ana Souza")
+    
+    resposta = cliente.get("/api/areas", headers={"Accept-Encoding": "gzip"})
+    
+    assert "content-encoding" not in resposta.headers
+    assert resposta.json() == ["Desenvolvimento"]
+
+
+def test_negociacao_respeita_q_zero():
+    assert codificacoes_aceitas("gzip;q=0, deflate") == {"deflate"}
+    assert escolher_compressor("gzip; q=0") is None
+    assert escolher_compressor("GZIP, identity") is CompressorGzip
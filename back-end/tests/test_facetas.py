@@ -0,0 +1,61 @@
+from conftest import perfil
+from crud import (
+    criar_profissional,
+    criar_profissionais_em_lote,
+    atualizar_profissional,
+    atualizar_profissionais_em_lote,
+    deletar_profissional,
+    deletar_profissionais_em_lote,
+    obter_areas_unicas,
+    obter_tecnologias_unicas
+)
+from facetas import verificar_facetas
+from schemas import ProfissionalCreate, ProfissionalUpdate
+
+
+def test_facetas_consistentes_apos_escritas(db):
+    ana = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    bruno = criar_profissional(db, ProfissionalCreate(**perfil("Bruno Lima", area="Dados", habilidades_tecnicas=["SQL"])))
+    carla = criar_profissional(db, ProfissionalCreate(**perfil("Carla Dias", area="Design", habilidades_tecnicas=["Figma"])))
+    assert verificar_facetas(db) == {}
+    
+    atualizar_profissional(db, ana.id, ProfissionalUpdate(area="Dados", habilidades_tecnicas=["Python", "Kafka"]))
+    atualizar_profissional(db, bruno.id, ProfissionalUpdate(localizacao="Natal/RN"))
+    assert atualizar_profissional(db, 9999, ProfissionalUpdate(area="Inexistente")) is None
+    assert verificar_facetas(db) == {}
+    
+    assert deletar_profissional(db, bruno.id)
+    assert not deletar_profissional(db, bruno.id)
+    assert verificar_facetas(db) == {}
+    
+    assert set(obter_areas_unicas(db)) == {"Dados", "Design"}
+    assert set(obter_tecnologias_unicas(db)) == {"Figma", "Kafka", "Python"}
+    
+    deletar_profissional(db, carla.id)
+    assert verificar_facetas(db) == {}
+    assert "Design" not in obter_areas_unicas(db)
+
+
+def test_facetas_consistentes_apos_escritas_em_lote(db):
+    avulso = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    ids_lote = criar_profissionais_em_lote(db, [
+        ProfissionalCreate(**perfil("Carla Dias", localizacao="Curitiba/PR")),
+        ProfissionalCreate(**perfil("Davi Rocha", habilidades_tecnicas=["Docker", "Python", "Go"])),
+        ProfissionalCreate(**perfil("Elisa Melo", area="Design", habilidades_tecnicas=["Figma"]))
+    ])
+    assert verificar_facetas(db) == {}
+    
+    resultados = atualizar_profissionais_em_lote(db, [
+        (ids_lote[0], ProfissionalUpdate(habilidades_tecnicas=["Go"])),
+        (ids_lote[1], ProfissionalUpdate(area="Design", localizacao="Recife/PE")),
+        (avulso.id, ProfissionalUpdate(area="Dados")),
+        (9999, ProfissionalUpdate(area="Inexistente"))
+    ])
+    assert resultados == [True, True, True, False]
+    assert verificar_facetas(db) == {}
+    
+    assert deletar_profissionais_em_lote(db, [ids_lote[2], ids_lote[2], 9999]) == [True, False, False]
+    assert verificar_facetas(db) == {}
+    
+    assert set(obter_areas_unicas(db)) == {"Dados", "Design", "Desenvolvimento"}
+    assert set(obter_tecnologias_unicas(db)) == {"Docker", "Go", "Python"}
@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+import pytest
+
+import crud
+from conftest import perfil
+from crud import atualizar_derivados, atualizar_profissional, buscar_profissionais, criar_profissional
+from database import SessionLocal
+from fila import FILA_ESPERA_MAXIMA, FilaDerivados, espera_nova_tentativa
+from models import TarefaDerivada
+from schemas import ProfissionalCreate, ProfissionalUpdate
+from versionamento import agora_utc
+
+
+@pytest.fixture
+def fila():
+    fila = FilaDerivados(ativa=True, max_tentativas=2, fabrica_sessao=SessionLocal)
+    fila.processados = []
+    fila._processar = lambda db, ids: fila.processados.append(ids)
+    return fila
+
+
+def tarefas(db) -> dict:
+    db.expire_all()
+    return {tarefa.profissional_id: tarefa for tarefa in db.query(TarefaDerivada)}
+
+
+def test_eventos_do_mesmo_perfil_viram_uma_tarefa(db, fila):
+    fila.enfileirar(db, [1, 2])
+    fila.enfileirar(db, [1])
+    fila.enfileirar(db, [1, 1])
+    db.commit()
+    
+    assert {id_: (tarefa.sequencia, tarefa.eventos) for id_, tarefa in tarefas(db).items()} == {1: (3, 3), 2: (1, 1)}
+    
+    assert fila.drenar() == 2
+    assert [sorted(ids) for ids in fila.processados] == [[1, 2]]
+    assert tarefas(db) == {}
+    assert fila.estatisticas()["profundidade"] == 0
+
+
+def test_evento_durante_o_processamento_mantem_a_tarefa(db, fila):
+    fila.enfileirar(db, [1])
+    db.commit()
+    
+    def processar(sessao, ids):
+        fila.processados.append(ids)
+        
+        if len(fila.processados) == 1:
+            fila.enfileirar(sessao, [1])
+    
+    fila._processar = processar
+    
+    assert fila.drenar() == 2
+    assert fila.processados == [[1], [1]]
+    assert tarefas(db) == {}
+
+
+def test_falha_isola_o_perfil_e_adia_com_espera_exponencial(db, fila):
+    fila.enfileirar(db, [1, 2, 3])
+    db.commit()
+    
+    def processar(sessao, ids):
+        if 2 in ids:
+            raise RuntimeError("indice indisponivel")
+        
+        fila.processados.append(ids)
+    
+    fila._processar = processar
+    
+    assert fila.processar_pendentes() == 3
+    assert fila.processados == [[1], [3]]
+    
+    pendentes = tarefas(db)
+    assert list(pendentes) == [2]
+    assert pendentes[2].tentativas == 1
+    assert pendentes[2].ultimo_erro == "RuntimeError: indice indisponivel"
+    assert pendentes[2].disponivel_em > agora_utc()
+    assert fila.processar_pendentes() == 0
+    
+    pendentes[2].disponivel_em = agora_utc() - timedelta(seconds=1)
+    db.commit()
+    fila.drenar()
+    
+    assert tarefas(db)[2].tentativas == 2
+    assert fila.estatisticas()["falhas"] == 1
+    assert fila.estatisticas()["profundidade"] == 0
+    
+    fila.enfileirar(db, [2])
+    db.commit()
+    assert tarefas(db)[2].tentativas == 0
+    assert fila.estatisticas()["profundidade"] == 1
+
+
+def test_espera_dobra_ate_o_teto():
+    assert [espera_nova_tentativa(tentativas, base=2.0) for tentativas in (1, 2, 3)] == [2.0, 4.0, 8.0]
+    assert espera_nova_tentativa(30, base=2.0) == FILA_ESPERA_MAXIMA
+
+
+def test_escritas_atualizam_a_busca_ao_drenar(db, monkeypatch, fila):
+    fila._processar = atualizar_derivados
+    monkeypatch.setattr(crud, "fila_derivados", fila)
+    
+    ana = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    atualizar_profissional(db, ana.id, ProfissionalUpdate(resumo="Especialista em Kafka"))
+    atualizar_profissional(db, ana.id, ProfissionalUpdate(resumo="Especialista em Elixir"))
+    
+    assert tarefas(db)[ana.id].eventos == 3
+    assert buscar_profissionais(db, termo_busca="elixir") == []
+    
+    assert fila.drenar() == 1
+    assert [profissional.nome for profissional in buscar_profissionais(db, termo_busca="elixir")] == ["Ana Souza"]
+    assert buscar_profissionais(db, termo_busca="kafka") == []
@@ -0,0 +1,117 @@
+import http.server
+import threading
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+import fotos
+from fotos import BuscadorArquivos, BuscadorHttp, CacheFotos, FotoIndisponivel, PREFIXO_ENVIADA, endereco_publico
+
+
+@pytest.fixture
+def servidor():
+    class Manipulador(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(302)
+            self.send_header("Location", "http://169.254.169.254/latest/meta-data")
+            self.end_headers()
+
+        def log_message(self, *argumentos):
+            pass
+    
+    servidor = http.server.HTTPServer(("127.0.0.1", 0), Manipulador)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    
+    try:
+        yield f"http://127.0.0.1:{servidor.server_address[1]}"
+    finally:
+        servidor.shutdown()
+
+
+@pytest.mark.parametrize("endereco, publico", [
+    ("8.8.8.8", True),
+    ("2606:4700::1111", True),
+    ("127.0.0.1", False),
+    ("::1", False),
+    ("10.1.2.3", False),
+    ("192.168.0.10", False),
+    ("169.254.169.254", False),
+    ("fe80::1%eth0", False),
+    ("::ffff:10.0.0.1", False),
+    ("224.0.0.1", False),
+    ("0.0.0.0", False)
+])
+def test_endereco_publico(endereco, publico):
+    assert endereco_publico(endereco) is publico
+
+
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1:9/foto.jpg",
+    "http://localhost:9/foto.jpg",
+    "http://[::1]:9/foto.jpg",
+    "file:///etc/passwd"
+])
+def test_buscador_recusa_rede_interna(url):
+    with pytest.raises(FotoIndisponivel):
+        BuscadorHttp(timeout=1).buscar(url)
+
+
+def test_buscador_verifica_cada_redirecionamento(servidor, monkeypatch):
+    monkeypatch.setattr(fotos, "endereco_publico", lambda endereco: endereco.startswith("127."))
+    
+    with pytest.raises(FotoIndisponivel, match="169.254.169.254"):
+        BuscadorHttp(timeout=1).buscar(f"{servidor}/foto.jpg")
+
+
+def test_buscador_recusa_redirecionamento_para_host_nao_permitido(servidor, monkeypatch):
+    monkeypatch.setattr(fotos, "endereco_publico", lambda endereco: True)
+    
+    with pytest.raises(FotoIndisponivel, match="não permitido"):
+        BuscadorHttp(timeout=1, hosts_permitidos={"127.0.0.1"}).buscar(f"{servidor}/foto.jpg")
+
+
+def jpeg(cor) -> bytes:
+    saida = BytesIO()
+    Image.new("RGB", (64, 48), cor).save(saida, format="JPEG")
+    return saida.getvalue()
+
+
+@pytest.fixture
+def origem(tmp_path):
+    pasta = tmp_path / "origem" / "fotos.exemplo.com"
+    pasta.mkdir(parents=True)
+    
+    for indice in range(3):
+        (pasta / f"{indice}.jpg").write_bytes(jpeg((indice * 80, 0, 0)))
+    
+    return BuscadorArquivos(str(tmp_path / "origem"))
+
+
+def test_ponteiros_de_url_contam_no_limite(tmp_path, origem):
+    cache = CacheFotos(str(tmp_path / "cache"), max_bytes=10 ** 6, trabalhadores=1, buscador=origem)
+    
+    try:
+        cache.obter("https://fotos.exemplo.com/0.jpg", 96)
+        ponteiros = list((tmp_path / "cache" / "urls").glob("*/*"))
+        
+        assert len(ponteiros) == 1
+        assert ponteiros[0] in cache._arquivos
+        assert cache.bytes_em_cache == sum(caminho.stat().st_size for caminho in cache._arquivos)
+    finally:
+        cache.parar()
+
+
+def test_enviadas_sem_uso_sao_apagadas(tmp_path, origem):
+    cache = CacheFotos(str(tmp_path / "cache"), trabalhadores=1, buscador=origem)
+    usada = cache.guardar_enviada(jpeg((0, 200, 0)))
+    trocada = cache.guardar_enviada(jpeg((0, 0, 200)))
+    orfa = cache.guardar_enviada(jpeg((200, 200, 0)))
+    
+    assert cache.descartar_enviadas([trocada]) == 0
+    assert cache.descartar_enviadas([trocada, "https://fotos.exemplo.com/0.jpg"], carencia=0) > 0
+    assert cache.coletar_enviadas({usada}, carencia=0)[0] == 1
+    
+    restantes = {PREFIXO_ENVIADA + caminho.name for caminho in (tmp_path / "cache" / "enviadas").glob("*/*")}
+    assert restantes == {usada}
+    assert orfa not in restantes
@@ -0,0 +1,74 @@
+import contextlib
+import io
+from collections import Counter
+
+from benchmark_crud import comparar, resumir
+from gerador_perfis import AREAS, gerar_perfis, gravar_ndjson
+from models import Profissional
+from schemas import ProfissionalCreate
+from seed import mapear_campos_json_para_db, popular_banco_dados
+
+
+def test_mesma_semente_gera_os_mesmos_perfis():
+    assert list(gerar_perfis(50, semente=7)) == list(gerar_perfis(50, semente=7))
+    assert list(gerar_perfis(50, semente=7)) != list(gerar_perfis(50, semente=8))
+    assert [perfil["id"] for perfil in gerar_perfis(3)] == [1, 2, 3]
+    assert "id" not in next(gerar_perfis(1, com_ids=False))
+
+
+def test_perfis_gerados_passam_na_validacao_da_api():
+    perfis = [mapear_campos_json_para_db(perfil) for perfil in gerar_perfis(300, com_ids=False)]
+    
+    for perfil in perfis:
+        ProfissionalCreate(**perfil)
+    
+    areas = Counter(perfil["area"] for perfil in perfis)
+    habilidades = Counter(habilidade for perfil in perfis for habilidade in perfil["habilidades_tecnicas"])
+    
+    assert set(areas) <= set(AREAS)
+    assert areas.most_common(1)[0][0] == "Desenvolvimento"
+    assert habilidades.most_common(1)[0][1] > 10 * habilidades.most_common()[-1][1]
+
+
+def test_seed_importa_arquivo_gerado(db, tmp_path):
+    arquivo = tmp_path / "perfis.ndjson"
+    gravar_ndjson(str(arquivo), 120, semente=3)
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        popular_banco_dados(str(arquivo), tamanho_lote=50, incremental=True)
+    
+    primeiro = next(gerar_perfis(1, semente=3))
+    
+    assert db.query(Profissional).count() == 120
+    assert db.get(Profissional, 1).nome == primeiro["nome"]
+
+
+def medicao(mediana_ms: float) -> dict:
+    return {"mediana_ms": mediana_ms}
+
+
+def test_comparar_aponta_regressoes_e_casos_ausentes():
+    base = {
+        "metadados": {"quantidade": 1000},
+        "resultados": {"crud.obter": medicao(1.0), "crud.listar": medicao(10.0), "http.listar": medicao(5.0)}
+    }
+    atual = {
+        "metadados": {"quantidade": 1000},
+        "resultados": {"crud.obter": medicao(1.5), "crud.buscar": medicao(2.0)}
+    }
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        regressoes = comparar(atual, base, tolerancia=0.25, folga_ms=0.2)
+    
+    assert [regressao.split(":")[0] for regressao in regressoes] == ["crud.obter", "crud.listar"]
+    
+    atual["resultados"] = {"crud.obter": medicao(1.4), "crud.listar": medicao(11.0)}
+    assert comparar(atual, base, tolerancia=0.25, folga_ms=0.2) == []
+
+
+def test_resumir_calcula_mediana_e_p95():
+    resumo = resumir([float(valor) for valor in range(1, 101)])
+    
+    assert resumo["mediana_ms"] == 50.5
+    assert resumo["p95_ms"] == 96.0
+    assert resumo["repeticoes"] == 100
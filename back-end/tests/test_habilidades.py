@@ -0,0 +1,61 @@
+from fastapi.testclient import TestClient
+
+import main
+from conftest import perfil
+from crud import criar_profissional, obter_profissionais_com_tecnologia
+from normalizacao import VocabularioHabilidades, canonizar_habilidades, distancia_edicao
+from schemas import ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def criar(db, nome: str, *habilidades):
+    return criar_profissional(db, ProfissionalCreate(**perfil(nome, habilidades_tecnicas=list(habilidades))))
+
+
+def nomes(profissionais) -> list:
+    return [profissional.nome for profissional in profissionais]
+
+
+def test_canoniza_aliases_e_remove_duplicadas():
+    assert canonizar_habilidades(["reactjs", "React.js", "k8s", "Postgres", "  Elixir  ", "elixir"]) == [
+        "React", "Kubernetes", "PostgreSQL", "Elixir"
+    ]
+
+
+def test_escrita_grava_grafia_canonica(db):
+    ana = criar(db, "Ana Souza", "python3", "nodejs", "Microsserviços")
+    
+    assert ana.habilidades_tecnicas == ["Python", "Node.js", "Microservices"]
+
+
+def test_vocabulario_tolera_erros_de_digitacao():
+    vocabulario = VocabularioHabilidades()
+    
+    assert vocabulario.resolver("Kubernets") == "kubernetes"
+    assert vocabulario.resolver("Tensorflwo") == "tensorflow"
+    assert vocabulario.resolver("golang") == "go"
+    assert distancia_edicao("pyhton", "python") == 1
+
+
+def test_vocabulario_nao_aproxima_termos_curtos_ou_distantes():
+    vocabulario = VocabularioHabilidades()
+    
+    assert vocabulario.resolver("Ts") == "typescript"
+    assert vocabulario.resolver("Jx") == "jx"
+    assert vocabulario.resolver("Cobol") == "cobol"
+    assert vocabulario.resolver("Java") == "java"
+
+
+def test_filtro_por_tecnologia_resolve_aliases_sem_casar_prefixos(db):
+    criar(db, "Ana Souza", "Java")
+    criar(db, "Bruno Lima", "JavaScript")
+    criar(db, "Carla Dias", "Kubernetes")
+    
+    assert nomes(obter_profissionais_com_tecnologia(db, "java")) == ["Ana Souza"]
+    assert nomes(obter_profissionais_com_tecnologia(db, "js")) == ["Bruno Lima"]
+    assert nomes(obter_profissionais_com_tecnologia(db, "Kubernets")) == ["Carla Dias"]
+    assert obter_profissionais_com_tecnologia(db, "Cobol") == []
+    
+    resposta = cliente.get("/api/profissionais", params={"tecnologia": "k8s"})
+    assert [item["nome"] for item in resposta.json()] == ["Carla Dias"]
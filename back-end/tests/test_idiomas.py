@@ -0,0 +1,60 @@
+from fastapi.testclient import TestClient
+
+import main
+from conftest import perfil
+from crud import alterar_profissional, buscar_profissionais_por_idioma, criar_profissional
+from schemas import OperacaoPatch, ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def criar(db, nome: str, *idiomas):
+    idiomas = [{"idioma": idioma, "nivel": nivel} for idioma, nivel in idiomas]
+    return criar_profissional(db, ProfissionalCreate(**perfil(nome, idiomas=idiomas)))
+
+
+def nomes(profissionais) -> list:
+    return [profissional.nome for profissional in profissionais]
+
+
+def test_filtra_por_idioma_e_nivel_minimo(db):
+    criar(db, "Ana Souza", ("Português", "Nativo"), ("Inglês", "Fluente"))
+    criar(db, "Bruno Lima", ("Português", "Nativo"), ("Inglês", "Básico"))
+    criar(db, "Carla Dias", ("Português", "Nativo"), ("Espanhol", "Avançado"))
+    
+    assert nomes(buscar_profissionais_por_idioma(db, "Inglês")) == ["Ana Souza", "Bruno Lima"]
+    assert nomes(buscar_profissionais_por_idioma(db, "Inglês", "Avançado")) == ["Ana Souza"]
+    assert nomes(buscar_profissionais_por_idioma(db, "Inglês", "Nativo")) == []
+    assert nomes(buscar_profissionais_por_idioma(db, "Alemão")) == []
+
+
+def test_idioma_sem_acento_e_repetido_usa_o_maior_nivel(db):
+    criar(db, "Ana Souza", ("inglês", "Básico"), ("INGLES", "Avançado"))
+    
+    assert nomes(buscar_profissionais_por_idioma(db, "Ingles", "Avançado")) == ["Ana Souza"]
+
+
+def test_filtro_http_combina_com_outros_filtros(db):
+    criar(db, "Ana Souza", ("Inglês", "Fluente"))
+    criar_profissional(db, ProfissionalCreate(**perfil(
+        "Bruno Lima",
+        area="Dados",
+        idiomas=[{"idioma": "Inglês", "nivel": "Fluente"}]
+    )))
+    
+    resposta = cliente.get("/api/profissionais", params={"idioma": "ingles", "nivel_minimo": "Fluente", "area": "Dados"})
+    assert [item["nome"] for item in resposta.json()] == ["Bruno Lima"]
+    
+    assert cliente.get("/api/profissionais", params={"idioma": "Inglês", "nivel_minimo": "Mestre"}).status_code == 422
+
+
+def test_indice_acompanha_alteracao_dos_idiomas(db):
+    ana = criar(db, "Ana Souza", ("Português", "Nativo"))
+    
+    alterar_profissional(db, ana.id, [
+        OperacaoPatch(op="add", path="/idiomas/-", value={"idioma": "Francês", "nivel": "Intermediário"})
+    ])
+    assert nomes(buscar_profissionais_por_idioma(db, "frances", "Intermediário")) == ["Ana Souza"]
+    
+    alterar_profissional(db, ana.id, [OperacaoPatch(op="remove", path="/idiomas/1")])
+    assert buscar_profissionais_por_idioma(db, "frances") == []
@@ -0,0 +1,81 @@
+import re
+
+from fastapi.testclient import TestClient
+
+import main
+import metricas
+from conftest import perfil
+from crud import criar_profissional
+from metricas import RegistroConsultasLentas, RegistroMetricas, formatar_rotulos
+from schemas import ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def valor(nome: str, **rotulos) -> float:
+    texto = cliente.get("/metrics").text
+    serie = f"futuroconecta_{nome}{formatar_rotulos(tuple(sorted(rotulos.items())))} "
+    linha = next((linha for linha in texto.splitlines() if linha.startswith(serie)), None)
+    return float(linha.rsplit(" ", 1)[1]) if linha else 0.0
+
+
+def test_rotulos_usam_o_modelo_da_rota(db):
+    ana = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza")))
+    rotulos = {"metodo": "GET", "rota": "/api/profissionais/{profissional_id}"}
+    
+    ok = valor("requisicoes_total", status="200", **rotulos)
+    ausentes = valor("requisicoes_total", status="404", **rotulos)
+    consultas = valor("banco_consultas_total", **rotulos)
+    
+    assert cliente.get(f"/api/profissionais/{ana.id}").status_code == 200
+    assert cliente.get("/api/profissionais/9999").status_code == 404
+    assert cliente.get("/api/profissionais/9998").status_code == 404
+    
+    assert valor("requisicoes_total", status="200", **rotulos) == ok + 1
+    assert valor("requisicoes_total", status="404", **rotulos) == ausentes + 2
+    assert valor("banco_consultas_total", **rotulos) >= consultas + 3
+    assert f'rota="/api/profissionais/{ana.id}"' not in cliente.get("/metrics").text
+
+
+def test_rota_inexistente_agrupa_em_um_rotulo(db):
+    antes = valor("requisicoes_total", metodo="GET", rota="nao_encontrada", status="404")
+    
+    cliente.get("/nao/existe/1")
+    cliente.get("/nao/existe/2")
+    
+    assert valor("requisicoes_total", metodo="GET", rota="nao_encontrada", status="404") == antes + 2
+
+
+def test_exportacao_no_formato_prometheus():
+    registro = RegistroMetricas()
+    registro.contador("eventos_total", "Eventos")
+    registro.histograma("duracao", "Duracao", (0.1, 1.0))
+    registro.incrementar("eventos_total", tipo='a"b')
+    registro.observar("duracao", 0.05)
+    registro.observar("duracao", 0.5)
+    registro.observar("duracao", 3)
+    
+    texto = registro.exportar()
+    
+    assert '# TYPE futuroconecta_eventos_total counter' in texto
+    assert 'futuroconecta_eventos_total{tipo="a\\"b"} 1' in texto
+    assert re.findall(r'futuroconecta_duracao_bucket\{le="([^"]+)"\} (\d+)', texto) == [
+        ("0.1", "1"), ("1", "2"), ("+Inf", "3")
+    ]
+    assert "futuroconecta_duracao_count 3" in texto
+
+
+def test_consultas_lentas_guardam_sql_e_plano(db, monkeypatch):
+    registro = RegistroConsultasLentas(0, guardadas=2)
+    monkeypatch.setattr(metricas, "consultas_lentas", registro)
+    monkeypatch.setattr(main, "consultas_lentas", registro)
+    
+    cliente.get("/api/profissionais", params={"area": "Dados"})
+    resposta = cliente.get("/api/metricas/consultas-lentas").json()
+    
+    assert resposta["ativo"] is True
+    assert len(resposta["consultas"]) == 2
+    assert all(consulta["sql"] for consulta in resposta["consultas"])
+    assert any(consulta["plano"] for consulta in resposta["consultas"])
+    
+    assert RegistroConsultasLentas(None).ativo is False
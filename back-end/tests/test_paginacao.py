@@ -0,0 +1,85 @@
+import base64
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from conftest import perfil
+from crud import criar_profissional, decodificar_cursor
+from schemas import ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def criar_perfis(db) -> list:
+    ids = []
+    
+    for indice in range(9):
+        resumo = "Profissional com experiência em APIs. " + "Kafka " * (indice % 4)
+        profissional = criar_profissional(db, ProfissionalCreate(**perfil(f"Pessoa {indice:02d}", resumo=resumo)))
+        ids.append(profissional.id)
+    
+    return ids
+
+
+def percorrer(parametros: dict) -> list:
+    ids = []
+    cursor = None
+    
+    while True:
+        resposta = cliente.get("/api/profissionais/pagina", params={**parametros, "limit": 2, "cursor": cursor})
+        assert resposta.status_code == 200
+        pagina = resposta.json()
+        ids.extend(item["id"] for item in pagina["itens"])
+        cursor = pagina["next_cursor"]
+        
+        if cursor is None:
+            return ids
+
+
+def test_percorre_todas_as_paginas_sem_lacunas_nem_repeticoes(db):
+    ids = criar_perfis(db)
+    
+    assert percorrer({}) == sorted(ids)
+
+
+def test_percorre_busca_na_ordem_de_relevancia(db):
+    ids = criar_perfis(db)
+    com_kafka = [ids[indice] for indice in range(9) if indice % 4]
+    
+    percorridos = percorrer({"busca": "kafka"})
+    completos = [item["id"] for item in cliente.get("/api/profissionais/pagina", params={"busca": "kafka"}).json()["itens"]]
+    
+    assert percorridos == completos
+    assert sorted(percorridos) == sorted(com_kafka)
+
+
+def codificar(posicao) -> str:
+    return base64.urlsafe_b64encode(json.dumps(posicao).encode()).decode()
+
+
+@pytest.mark.parametrize("cursor", [
+    "nao-e-base64!",
+    codificar([1, 2]),
+    codificar({"relevancia": -1.5}),
+    codificar({"id": "x"}),
+    codificar({"id": 5, "relevancia": "x"}),
+    codificar({"id": 5, "relevancia": None})
+])
+def test_cursor_adulterado_retorna_400(db, cursor):
+    assert cliente.get("/api/profissionais/pagina", params={"cursor": cursor}).status_code == 400
+    assert cliente.get("/api/profissionais/pagina", params={"cursor": cursor, "busca": "kafka"}).status_code == 400
+
+
+def test_cursor_converte_tipos():
+    assert decodificar_cursor(codificar({"id": "5", "relevancia": "-1.25"})) == {"id": 5, "relevancia": -1.25}
+
+
+def test_cursor_de_outra_consulta_retorna_400(db):
+    criar_perfis(db)
+    cursor_sem_busca = cliente.get("/api/profissionais/pagina", params={"limit": 2}).json()["next_cursor"]
+    cursor_com_busca = cliente.get("/api/profissionais/pagina", params={"limit": 2, "busca": "kafka"}).json()["next_cursor"]
+    
+    assert cliente.get("/api/profissionais/pagina", params={"cursor": cursor_sem_busca, "busca": "kafka"}).status_code == 400
+    assert cliente.get("/api/profissionais/pagina", params={"cursor": cursor_com_busca}).status_code == 400
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import crud
+import main
+from conftest import perfil
+from crud import criar_profissional
+from ranking import ANOS_TETO_RANKING, PESOS_RANKING, IndiceRanking, MatrizRanking
+from schemas import ProfissionalCreate
+
+HABILIDADES = ["python", "kafka", "go", "sql", "react"]
+CIDADES = ["Recife/PE", "Natal/RN", "Curitiba/PR"]
+AREAS = ["Dados", "Desenvolvimento"]
+
+
+def perfis_aleatorios(quantidade: int, semente: int = 7) -> list:
+    sorteio = random.Random(semente)
+    
+    return [
+        {
+            "id": indice + 1,
+            "anos": sorteio.randint(0, 20),
+            "area": sorteio.choice(AREAS),
+            "cidade": sorteio.choice(CIDADES),
+            "habilidades": set(sorteio.sample(HABILIDADES, sorteio.randint(1, 3))),
+            "ingles": sorteio.randint(0, 5)
+        }
+        for indice in range(quantidade)
+    ]
+
+
+def montar_matriz(perfis: list) -> MatrizRanking:
+    return MatrizRanking(
+        [p["id"] for p in perfis],
+        [p["anos"] for p in perfis],
+        [p["area"] for p in perfis],
+        [p["cidade"] for p in perfis],
+        {h: [p["id"] for p in perfis if h in p["habilidades"]] for h in HABILIDADES},
+        {"ingles": ([p["id"] for p in perfis if p["ingles"]], [p["ingles"] for p in perfis if p["ingles"]])}
+    )
+
+
+def pontuar(p: dict, desejaveis: list, cidade: str, area: str) -> float:
+    nota = PESOS_RANKING["experiencia"] * min(p["anos"], ANOS_TETO_RANKING) / ANOS_TETO_RANKING
+    nota += sum(PESOS_RANKING["desejaveis"] / len(desejaveis) for h in desejaveis if h in p["habilidades"])
+    nota += PESOS_RANKING["idiomas"] if p["ingles"] >= 3 else 0
+    nota += PESOS_RANKING["cidade"] * (p["cidade"] == cidade) + PESOS_RANKING["area"] * (p["area"] == area)
+    return nota
+
+
+@pytest.mark.parametrize("limite", [1, 5, 50, 500])
+def test_top_k_igual_a_ordenacao_completa(limite):
+    perfis = perfis_aleatorios(300)
+    desejaveis = ["kafka", "go"]
+    
+    ids, pontuacoes, total = montar_matriz(perfis).ranquear(
+        obrigatorias=["Python"],
+        desejaveis=["Kafka", "Go"],
+        anos_minimos=3,
+        idiomas=[("Inglês", "Avançado")],
+        cidade="Recife/PE",
+        area="Dados",
+        limite=limite
+    )
+    
+    candidatos = [p for p in perfis if "python" in p["habilidades"] and p["anos"] >= 3]
+    esperado = sorted(candidatos, key=lambda p: (-pontuar(p, desejaveis, "Recife/PE", "Dados"), p["id"]))[:limite]
+    
+    assert total == len(candidatos)
+    assert len(ids) == min(limite, total)
+    assert pontuacoes == pytest.approx([pontuar(p, desejaveis, "Recife/PE", "Dados") for p in esperado], abs=1e-4)
+    assert all((-a, x) <= (-b, y) for (x, a), (y, b) in zip(zip(ids, pontuacoes), zip(ids[1:], pontuacoes[1:])))
+
+
+def test_habilidade_obrigatoria_desconhecida_nao_retorna_candidatos():
+    assert montar_matriz(perfis_aleatorios(20)).ranquear(obrigatorias=["Cobol"]) == ([], [], 0)
+
+
+def test_endpoint_ranqueia_com_dados_atuais(db, monkeypatch):
+    monkeypatch.setattr(crud, "indice_ranking", IndiceRanking(fabrica_sessao=None))
+    cliente = TestClient(main.app)
+    
+    criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza", habilidades_tecnicas=["Python", "Kafka"])))
+    criar_profissional(db, ProfissionalCreate(**perfil("Bruno Lima", habilidades_tecnicas=["Python"])))
+    criar_profissional(db, ProfissionalCreate(**perfil("Carla Dias", habilidades_tecnicas=["Figma"])))
+    
+    vaga = {"habilidades_obrigatorias": ["python"], "habilidades_desejaveis": ["kafka"], "limit": 5}
+    resposta = cliente.post("/api/profissionais/ranking", params={"fields": "card"}, json=vaga).json()
+    
+    assert resposta["total_candidatos"] == 2
+    assert [item["profissional"]["nome"] for item in resposta["itens"]] == ["Ana Souza", "Bruno Lima"]
+    
+    criar_profissional(db, ProfissionalCreate(**perfil("Davi Rocha", habilidades_tecnicas=["Python", "Kafka", "Go"])))
+    resposta = cliente.post("/api/profissionais/ranking", json=vaga).json()
+    assert resposta["total_candidatos"] == 3
+    
+    assert cliente.post("/api/profissionais/ranking", json={**vaga, "limit": 0}).status_code == 422
+    assert cliente.post("/api/profissionais/ranking", json={**vaga, "anos_minimos": -1}).status_code == 422
@@ -0,0 +1,72 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import rotas_async
+from conftest import perfil
+from database import ASYNC_DATABASE_URL, configurar_sqlite, opcoes_engine
+
+
+@pytest.fixture
+def cliente(db, monkeypatch):
+    engine_async = create_async_engine(ASYNC_DATABASE_URL, **opcoes_engine(ASYNC_DATABASE_URL))
+    event.listen(engine_async.sync_engine, "connect", configurar_sqlite)
+    monkeypatch.setattr(
+        rotas_async,
+        "AsyncSessionLocal",
+        async_sessionmaker(engine_async, autoflush=False, expire_on_commit=False)
+    )
+    
+    app = FastAPI()
+    app.include_router(rotas_async.rotas_async)
+    
+    with TestClient(app) as cliente:
+        yield cliente
+        cliente.portal.call(engine_async.dispose)
+
+
+def test_crud_completo_pelas_rotas_async(cliente):
+    resposta = cliente.post("/api/profissionais", json=perfil("Ana Souza", habilidades_tecnicas=["Python", "Kafka"]))
+    assert resposta.status_code == 201
+    profissional_id = resposta.json()["id"]
+    
+    resposta = cliente.get(f"/api/profissionais/{profissional_id}")
+    assert resposta.status_code == 200
+    etag = resposta.headers["etag"]
+    assert cliente.get(f"/api/profissionais/{profissional_id}", headers={"If-None-Match": etag}).status_code == 304
+    
+    resposta = cliente.put(f"/api/profissionais/{profissional_id}", json={"cargo": "Tech Lead"}, headers={"If-Match": etag})
+    assert resposta.status_code == 200
+    assert resposta.json()["versao"] == 2
+    
+    resposta = cliente.put(f"/api/profissionais/{profissional_id}", json={"cargo": "Gerente"}, headers={"If-Match": etag})
+    assert resposta.status_code == 412
+    
+    resposta = cliente.patch(f"/api/profissionais/{profissional_id}", json=[
+        {"op": "add", "path": "/habilidades_tecnicas/-", "value": "Docker"}
+    ])
+    assert resposta.status_code == 200
+    assert resposta.json()["habilidades_tecnicas"] == ["Python", "Kafka", "Docker"]
+    
+    assert [item["id"] for item in cliente.get("/api/profissionais", params={"tecnologia": "kafka"}).json()] == [profissional_id]
+    assert [item["id"] for item in cliente.get("/api/profissionais/pagina", params={"busca": "ana"}).json()["itens"]] == [profissional_id]
+    
+    assert cliente.delete(f"/api/profissionais/{profissional_id}").status_code == 204
+    assert cliente.get(f"/api/profissionais/{profissional_id}").status_code == 404
+    assert cliente.delete(f"/api/profissionais/{profissional_id}").status_code == 404
+
+
+def test_rotas_async_rejeitam_entradas_invalidas(cliente):
+    profissional_id = cliente.post("/api/profissionais", json=perfil("Ana Souza")).json()["id"]
+    experiencia = {"empresa": "Acme", "cargo": "Dev", "inicio": "2019-01", "fim": "atual x", "descricao": "APIs"}
+    
+    assert cliente.put(f"/api/profissionais/{profissional_id}", json={"experiencias": [experiencia]}).status_code == 422
+    assert cliente.put(f"/api/profissionais/{profissional_id}", json={"nome": None}).status_code == 422
+    assert cliente.patch(f"/api/profissionais/{profissional_id}", json=[
+        {"op": "replace", "path": "/inexistente", "value": 1}
+    ]).status_code == 400
+    assert cliente.get("/api/profissionais/pagina", params={"cursor": "invalido"}).status_code == 400
+    assert cliente.put("/api/profissionais/9999", json={"cargo": "Tech Lead"}).status_code == 404
+    assert cliente.get(f"/api/profissionais/{profissional_id}").json()["versao"] == 1
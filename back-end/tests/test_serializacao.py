@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+
+import main
+from conftest import perfil
+from crud import criar_profissional, obter_todos_profissionais
+from schemas import ProfissionalCreate
+from serializacao import CAMPOS_CARD, CARD_MAX_HABILIDADES, CARD_TAMANHO_RESUMO, _validar_projecao, serializar_profissionais
+
+cliente = TestClient(main.app)
+
+HABILIDADES = ["Python", "Docker", "Kafka", "SQL", "Go", "Rust", "Terraform", "Figma"]
+RESUMO_LONGO = "Engenheira de dados com foco em pipelines de streaming, " * 8
+
+
+def test_card_encurta_resumo_e_habilidades(db):
+    criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza", resumo=RESUMO_LONGO, habilidades_tecnicas=HABILIDADES)))
+    criar_profissional(db, ProfissionalCreate(**perfil("Bruno Lima")))
+    
+    ana, bruno = cliente.get("/api/profissionais", params={"fields": "card"}).json()
+    
+    assert set(ana) == set(CAMPOS_CARD) | {"total_habilidades"}
+    assert ana["habilidades_tecnicas"] == HABILIDADES[:CARD_MAX_HABILIDADES]
+    assert ana["total_habilidades"] == len(HABILIDADES)
+    assert len(ana["resumo"]) <= CARD_TAMANHO_RESUMO + 1
+    assert ana["resumo"].endswith("…")
+    assert RESUMO_LONGO.startswith(ana["resumo"][:-1])
+    
+    assert bruno["resumo"] == perfil("Bruno Lima")["resumo"]
+    assert bruno["total_habilidades"] == 2
+
+
+def test_card_igual_com_e_sem_serializacao_rapida(db):
+    criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza", resumo=RESUMO_LONGO, habilidades_tecnicas=HABILIDADES)))
+    profissionais = obter_todos_profissionais(db)
+    
+    assert _validar_projecao(profissionais, CAMPOS_CARD) == serializar_profissionais(profissionais, CAMPOS_CARD)
+
+
+def test_fields_projeta_campos_e_rejeita_desconhecidos(db):
+    criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza", resumo=RESUMO_LONGO)))
+    
+    item, = cliente.get("/api/profissionais", params={"fields": "cargo,nome"}).json()
+    
+    assert set(item) == {"id", "nome", "cargo"}
+    assert item["nome"] == "Ana Souza"
+    assert cliente.get("/api/profissionais", params={"fields": "nome,senha"}).status_code == 400
@@ -0,0 +1,77 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import crud
+import main
+from conftest import perfil
+from crud import criar_profissional, deletar_profissional
+from schemas import ProfissionalCreate
+from similaridade import PESOS_SIMILARIDADE, IndiceSimilaridade
+
+
+def jaccard_ponderado(a: frozenset, b: frozenset) -> float:
+    peso = lambda tokens: sum(PESOS_SIMILARIDADE[token[0]] for token in tokens)
+    return peso(a & b) / peso(a | b)
+
+
+@pytest.fixture
+def indice(monkeypatch):
+    indice = IndiceSimilaridade()
+    monkeypatch.setattr(crud, "indice_similaridade", indice)
+    return indice
+
+
+def test_notas_seguem_jaccard_ponderado(indice):
+    perfis = {
+        1: frozenset({"h:python", "h:docker", "a:dados"}),
+        2: frozenset({"h:python", "h:docker", "a:dados", "i:ia"}),
+        3: frozenset({"h:python", "a:design"}),
+        4: frozenset({"h:figma", "a:design"}),
+        5: frozenset({"h:python", "h:docker", "a:dados"})
+    }
+    indice.montado = True
+    indice.definir(list(perfis.items()))
+    
+    similares, total = indice.similares(1, limite=10)
+    
+    assert total == 3
+    assert similares == [
+        (5, 1.0),
+        (2, round(jaccard_ponderado(perfis[1], perfis[2]), 4)),
+        (3, round(jaccard_ponderado(perfis[1], perfis[3]), 4))
+    ]
+    assert indice.similares(1, limite=1)[0] == [(5, 1.0)]
+    assert indice.similares(99) == ([], 0)
+
+
+def test_max_candidatos_limita_avaliacao(indice):
+    indice.max_candidatos = 3
+    indice.montado = True
+    indice.definir([(numero, frozenset({"h:python"})) for numero in range(1, 11)])
+    
+    similares, total = indice.similares(1, limite=10)
+    
+    assert total == 3
+    assert len(similares) == 3
+
+
+def test_endpoint_acompanha_escritas(db, indice):
+    cliente = TestClient(main.app)
+    
+    ana = criar_profissional(db, ProfissionalCreate(**perfil("Ana Souza", habilidades_tecnicas=["Python", "Docker"])))
+    bruno = criar_profissional(db, ProfissionalCreate(**perfil("Bruno Lima", habilidades_tecnicas=["python", "docker"])))
+    criar_profissional(db, ProfissionalCreate(**perfil("Carla Dias", area="Design", habilidades_tecnicas=["Python", "Figma"])))
+    
+    resposta = cliente.get(f"/api/profissionais/{ana.id}/similares").json()
+    
+    assert [item["profissional"]["nome"] for item in resposta["itens"]] == ["Bruno Lima", "Carla Dias"]
+    assert resposta["itens"][0]["pontuacao"] == 1.0
+    
+    davi = criar_profissional(db, ProfissionalCreate(**perfil("Davi Rocha", habilidades_tecnicas=["Python", "Docker"])))
+    deletar_profissional(db, bruno.id)
+    
+    resposta = cliente.get(f"/api/profissionais/{ana.id}/similares", params={"limit": 1}).json()
+    
+    assert [item["profissional"]["id"] for item in resposta["itens"]] == [davi.id]
+    assert cliente.get("/api/profissionais/9999/similares").status_code == 404
+    assert cliente.get(f"/api/profissionais/{ana.id}/similares", params={"limit": 51}).status_code == 422
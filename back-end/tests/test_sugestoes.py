@@ -0,0 +1,77 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import crud
+import main
+from conftest import perfil
+from crud import atualizar_profissional, criar_profissional, deletar_profissional, sugerir_termos
+from schemas import ProfissionalCreate, ProfissionalUpdate
+from sugestoes import IndiceSugestoes
+
+cliente = TestClient(main.app)
+
+
+@pytest.fixture
+def indice(monkeypatch):
+    indice = IndiceSugestoes()
+    monkeypatch.setattr(crud, "indice_sugestoes", indice)
+    return indice
+
+
+def criar(db, nome: str, **campos):
+    return criar_profissional(db, ProfissionalCreate(**perfil(nome, **campos)))
+
+
+def valores(sugestoes) -> list:
+    return [(item["tipo"], item["valor"], item["quantidade"]) for item in sugestoes]
+
+
+def test_sugere_por_frequencia_e_por_palavra_interna(db, indice):
+    criar(db, "Ana Souza", habilidades_tecnicas=["Python", "Pandas"])
+    criar(db, "Bruno Lima", habilidades_tecnicas=["Python", "PostgreSQL"])
+    criar(db, "Paula Santos", cargo="Product Designer", habilidades_tecnicas=["Figma"])
+    
+    assert valores(sugerir_termos(db, "p")) == [
+        ("habilidade", "Python", 2),
+        ("habilidade", "Pandas", 1),
+        ("nome", "Paula Santos", 1),
+        ("habilidade", "PostgreSQL", 1),
+        ("cargo", "Product Designer", 1)
+    ]
+    assert valores(sugerir_termos(db, "SOUZA")) == [("nome", "Ana Souza", 1)]
+    assert valores(sugerir_termos(db, "recif")) == [("cidade", "Recife/PE", 3)]
+    assert sugerir_termos(db, "python", limite=1) == [{"tipo": "habilidade", "valor": "Python", "quantidade": 2}]
+    assert sugerir_termos(db, "   ") == []
+
+
+def test_escritas_atualizam_contagens_sem_remontar(db, indice):
+    ana = criar(db, "Ana Souza", habilidades_tecnicas=["Python"])
+    bruno = criar(db, "Bruno Lima", habilidades_tecnicas=["Python"])
+    assert valores(sugerir_termos(db, "pyth")) == [("habilidade", "Python", 2)]
+    
+    atualizar_profissional(db, ana.id, ProfissionalUpdate(habilidades_tecnicas=["Kotlin"]))
+    assert valores(sugerir_termos(db, "pyth")) == [("habilidade", "Python", 1)]
+    assert valores(sugerir_termos(db, "kot")) == [("habilidade", "Kotlin", 1)]
+    
+    deletar_profissional(db, bruno.id)
+    assert sugerir_termos(db, "pyth") == []
+    assert indice.estatisticas()["acertos"] > 0
+
+
+def test_cache_limitado_continua_correto(db, indice):
+    indice.max_prefixos = 2
+    criar(db, "Ana Souza", habilidades_tecnicas=["Python", "Pandas", "PyTorch"])
+    
+    for termo in ["py", "pa", "pyt", "an", "py"]:
+        sugerir_termos(db, termo)
+    
+    assert indice.estatisticas()["prefixos_em_cache"] <= 2
+    assert [item["valor"] for item in sugerir_termos(db, "py")] == ["PyTorch", "Python"]
+
+
+def test_endpoint_valida_parametros(db, indice):
+    criar(db, "Ana Souza")
+    
+    assert cliente.get("/api/sugestoes", params={"q": "ana"}).json()[0]["valor"] == "Ana Souza"
+    assert cliente.get("/api/sugestoes", params={"q": ""}).status_code == 422
+    assert cliente.get("/api/sugestoes", params={"q": "ana", "limit": 21}).status_code == 422
@@ -0,0 +1,74 @@
+from email.utils import formatdate
+
+from fastapi.testclient import TestClient
+
+import main
+from conftest import perfil
+from crud import criar_profissional
+from schemas import ProfissionalCreate
+
+cliente = TestClient(main.app)
+
+
+def criar(db, nome: str):
+    return criar_profissional(db, ProfissionalCreate(**perfil(nome)))
+
+
+def test_listagem_responde_304_ate_a_proxima_escrita(db):
+    criar(db, "Ana Souza")
+    
+    resposta = cliente.get("/api/profissionais")
+    etag = resposta.headers["ETag"]
+    
+    assert resposta.headers["Cache-Control"] == "no-cache"
+    assert cliente.get("/api/profissionais", headers={"If-None-Match": etag}).status_code == 304
+    assert cliente.get("/api/areas", headers={"If-None-Match": f'W/{etag}'}).status_code == 304
+    assert cliente.get(
+        "/api/profissionais",
+        headers={"If-Modified-Since": resposta.headers["Last-Modified"]}
+    ).status_code == 304
+    
+    criar(db, "Bruno Lima")
+    
+    resposta = cliente.get("/api/profissionais", headers={"If-None-Match": etag})
+    assert resposta.status_code == 200
+    assert resposta.headers["ETag"] != etag
+    assert [item["nome"] for item in resposta.json()] == ["Ana Souza", "Bruno Lima"]
+    
+    antiga = formatdate(0, usegmt=True)
+    assert cliente.get("/api/profissionais", headers={"If-Modified-Since": antiga}).status_code == 200
+
+
+def test_perfil_responde_304_com_etag_da_versao(db):
+    ana = criar(db, "Ana Souza")
+    
+    resposta = cliente.get(f"/api/profissionais/{ana.id}")
+    etag = resposta.headers["ETag"]
+    
+    assert etag.startswith(f'"p{ana.id}-v1-')
+    assert cliente.get(f"/api/profissionais/{ana.id}", headers={"If-None-Match": etag}).status_code == 304
+    
+    cliente.put(f"/api/profissionais/{ana.id}", json={"cargo": "Tech Lead"})
+    
+    resposta = cliente.get(f"/api/profissionais/{ana.id}", headers={"If-None-Match": etag})
+    assert resposta.status_code == 200
+    assert resposta.json()["cargo"] == "Tech Lead"
+
+
+def test_if_match_desatualizado_responde_412(db):
+    ana = criar(db, "Ana Souza")
+    etag = cliente.get(f"/api/profissionais/{ana.id}").headers["ETag"]
+    
+    resposta = cliente.put(f"/api/profissionais/{ana.id}", json={"cargo": "Tech Lead"}, headers={"If-Match": etag})
+    assert resposta.status_code == 200
+    nova_etag = resposta.headers["ETag"]
+    assert nova_etag.startswith(f'"p{ana.id}-v2-')
+    
+    resposta = cliente.put(f"/api/profissionais/{ana.id}", json={"cargo": "Gerente"}, headers={"If-Match": etag})
+    assert resposta.status_code == 412
+    
+    operacoes = [{"op": "replace", "path": "/cargo", "value": "Gerente"}]
+    assert cliente.patch(f"/api/profissionais/{ana.id}", json=operacoes, headers={"If-Match": etag}).status_code == 412
+    assert cliente.patch(f"/api/profissionais/{ana.id}", json=operacoes, headers={"If-Match": nova_etag}).status_code == 200
+    assert cliente.put(f"/api/profissionais/{ana.id}", json={"cargo": "Diretora"}, headers={"If-Match": "*"}).status_code == 200
+    assert cliente.get(f"/api/profissionais/{ana.id}").json()["cargo"] == "Diretora"
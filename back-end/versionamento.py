@@ -0,0 +1,204 @@
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import List, NamedTuple, Optional
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from database import engine
+
+CACHE_CONTROL_VERSIONADO = "no-cache"
+
+PADRAO_ETAG_PERFIL = re.compile(r'"p(?P<id>\d+)-v(?P<versao>\d+)-[0-9a-f]+"')
+
+
+def agora_utc() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+CRIAR_TABELA_VERSAO = """
+CREATE TABLE IF NOT EXISTS versao_dados (
+    id INTEGER PRIMARY KEY,
+    instancia VARCHAR(32) NOT NULL,
+    versao BIGINT NOT NULL,
+    modificado_em BIGINT NOT NULL
+)
+"""
+
+INSERIR_VERSAO_INICIAL = """
+INSERT INTO versao_dados (id, instancia, versao, modificado_em)
+VALUES (1, :instancia, 0, :modificado_em)
+ON CONFLICT (id) DO NOTHING
+"""
+
+GATILHOS_VERSAO_SQLITE = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS versao_dados_{evento.lower()} AFTER {evento} ON profissionais
+    BEGIN
+        UPDATE versao_dados
+        SET versao = versao + 1,
+            modificado_em = max(modificado_em, CAST(strftime('%s', 'now') AS INTEGER))
+        WHERE id = 1;
+    END
+    """
+    for evento in ("INSERT", "UPDATE", "DELETE")
+]
+
+GATILHOS_VERSAO_POSTGRESQL = [
+    """
+    CREATE OR REPLACE FUNCTION incrementar_versao_dados() RETURNS trigger AS $$
+    BEGIN
+        UPDATE versao_dados
+        SET versao = versao + 1,
+            modificado_em = GREATEST(modificado_em, CAST(EXTRACT(EPOCH FROM now()) AS BIGINT))
+        WHERE id = 1;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS versao_dados_profissionais ON profissionais",
+    """
+    CREATE TRIGGER versao_dados_profissionais
+    AFTER INSERT OR UPDATE OR DELETE ON profissionais
+    FOR EACH STATEMENT EXECUTE FUNCTION incrementar_versao_dados()
+    """
+]
+
+
+def criar_controle_versao(bind: Engine) -> None:
+    gatilhos = GATILHOS_VERSAO_POSTGRESQL if bind.dialect.name == "postgresql" else GATILHOS_VERSAO_SQLITE
+    
+    with bind.begin() as conexao:
+        conexao.execute(text(CRIAR_TABELA_VERSAO))
+        conexao.execute(
+            text(INSERIR_VERSAO_INICIAL),
+            {"instancia": format(time.time_ns() // 1000, "x"), "modificado_em": int(time.time())}
+        )
+        
+        for gatilho in gatilhos:
+            conexao.execute(text(gatilho))
+
+
+class EstadoVersao(NamedTuple):
+    instancia: str
+    versao: int
+    modificado_em: int
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.instancia}-{self.versao}"'
+
+
+class VersaoDados:
+    def __init__(self, bind: Engine):
+        self.bind = bind
+
+    def ler(self) -> EstadoVersao:
+        with self.bind.connect() as conexao:
+            linha = conexao.execute(
+                text("SELECT instancia, versao, modificado_em FROM versao_dados WHERE id = 1")
+            ).one()
+        
+        return EstadoVersao(*linha)
+
+    def estatisticas(self) -> dict:
+        estado = self.ler()
+        
+        return {
+            "instancia": estado.instancia,
+            "versao": estado.versao,
+            "modificado_em": formatar_data_http(estado.modificado_em)
+        }
+
+
+def etag_do_perfil(profissional_id: int, versao: Optional[int], atualizado_em: Optional[datetime]) -> str:
+    marca = int(atualizado_em.replace(tzinfo=timezone.utc).timestamp() * 1_000_000) if atualizado_em else 0
+    return f'"p{profissional_id}-v{versao or 1}-{marca:x}"'
+
+
+def cabecalhos_do_perfil(profissional) -> dict:
+    return {"ETag": etag_do_perfil(profissional.id, profissional.versao, profissional.atualizado_em)}
+
+
+def versoes_do_if_match(cabecalho: Optional[str], profissional_id: int) -> Optional[List[int]]:
+    if cabecalho is None or cabecalho.strip() == "*":
+        return None
+    
+    versoes = []
+    
+    for valor in cabecalho.split(","):
+        correspondencia = PADRAO_ETAG_PERFIL.fullmatch(valor.strip().removeprefix("W/"))
+        
+        if correspondencia and int(correspondencia["id"]) == profissional_id:
+            versoes.append(int(correspondencia["versao"]))
+    
+    return versoes
+
+
+class ConflitoVersao(Exception):
+    def __init__(self, profissional_id: int, versao_atual: int):
+        super().__init__(
+            f"Profissional com ID {profissional_id} foi alterado por outra requisição (versão atual: {versao_atual})"
+        )
+        self.profissional_id = profissional_id
+        self.versao_atual = versao_atual
+
+
+def erro_de_conflito(erro: ConflitoVersao, if_match: Optional[str]) -> HTTPException:
+    return HTTPException(status_code=412 if if_match is not None else 409, detail=str(erro))
+
+
+def formatar_data_http(segundos: float) -> str:
+    return formatdate(segundos, usegmt=True)
+
+
+def segundos_do_perfil(atualizado_em: Optional[datetime]) -> Optional[int]:
+    if atualizado_em is None:
+        return None
+    
+    return int(atualizado_em.replace(tzinfo=timezone.utc).timestamp())
+
+
+def etag_corresponde(cabecalho: str, etag: str) -> bool:
+    if cabecalho.strip() == "*":
+        return True
+    
+    return any(valor.strip().removeprefix("W/") == etag for valor in cabecalho.split(","))
+
+
+def nao_modificado(request: Request, etag: str, modificado_em: Optional[int]) -> bool:
+    if request.method not in ("GET", "HEAD"):
+        return False
+    
+    se_nenhum = request.headers.get("if-none-match")
+    
+    if se_nenhum is not None:
+        return etag_corresponde(se_nenhum, etag)
+    
+    desde = request.headers.get("if-modified-since")
+    
+    if desde is None or modificado_em is None:
+        return False
+    
+    try:
+        return modificado_em <= parsedate_to_datetime(desde).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+def cabecalhos_versionados(etag: str, modificado_em: Optional[int]) -> dict:
+    cabecalhos = {"ETag": etag, "Cache-Control": CACHE_CONTROL_VERSIONADO}
+    
+    if modificado_em is not None:
+        cabecalhos["Last-Modified"] = formatar_data_http(modificado_em)
+    
+    return cabecalhos
+
+
+def resposta_nao_modificada(etag: str, modificado_em: Optional[int]) -> Response:
+    return Response(status_code=304, headers=cabecalhos_versionados(etag, modificado_em))
+
+
+versao_dados = VersaoDados(engine)
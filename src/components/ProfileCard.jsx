@@ -1,4 +1,5 @@
 import TagList from './TagList'
+import { obterUrlFoto } from '../services/api'
 
 function ProfileCard({ profile, onClick }) {
   return (
@@ -9,7 +10,7 @@ function ProfileCard({ profile, onClick }) {
       <div className="relative h-48 bg-gradient-to-br from-primary-400 to-primary-600 dark:from-primary-600 dark:to-primary-800 flex items-center justify-center overflow-hidden">
         {profile.foto ? (
           <img
-            src={profile.foto}
+            src={obterUrlFoto(profile, 512)}
             alt={profile.nome}
             className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-300"
           />
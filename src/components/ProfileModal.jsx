@@ -1,5 +1,6 @@
 import { useState } from 'react'
 import TagList from './TagList'
+import { obterUrlFoto } from '../services/api'
 
 function ProfileModal({ profile, onClose }) {
   const [showMessageForm, setShowMessageForm] = useState(false)
@@ -52,7 +53,7 @@ function ProfileModal({ profile, onClose }) {
             <div className="flex flex-col md:flex-row items-center gap-6">
               <div className="w-32 h-32 rounded-full bg-white dark:bg-gray-700 flex items-center justify-center overflow-hidden shadow-lg">
                 {profile.foto ? (
-                  <img src={profile.foto} alt={profile.nome} className="w-full h-full object-cover" />
+                  <img src={obterUrlFoto(profile, 256)} alt={profile.nome} className="w-full h-full object-cover" />
                 ) : (
                   <span className="text-5xl font-bold text-primary-600 dark:text-primary-400">
                     {profile.nome.charAt(0).toUpperCase()}
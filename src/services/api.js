@@ -60,6 +60,18 @@ export const fetchProfissionais = async (params = {}) => {
   }
 };
 
+/**
+ * URL da foto do profissional: no modo API usa a miniatura em cache do backend,
+ * no modo JSON local mantém a URL original
+ */
+export const obterUrlFoto = (profile, tamanho = 256) => {
+  if (!profile.foto || !isUsingAPI()) {
+    return profile.foto;
+  }
+  
+  return `${API_BASE_URL}/api/profissionais/${profile.id}/foto?size=${tamanho}&v=${profile.versao ?? 1}`;
+};
+
 /**
  * Busca um profissional específico por ID
  */